@@ -0,0 +1,104 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark the time used to create, measure, and serialize interface check results.
+
+Each check-result is created as the plugins do, with the measurement given as
+a dictionary, and is then measured and serialized to JSON as the results are
+saved.  The construct path creates the same check-results using the pydantic
+`model_construct`, without validation, for comparison.  The validated path is
+the faster of the two, since pydantic validates in compiled code; and so the
+check-results do not provide a construction path that skips validation.
+
+    python benchmarks/bench_check_results.py --ports 400 --rounds 10
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.feats.topology.checks.check_interfaces import (
+    InterfaceCheck,
+    InterfaceCheckParams,
+    InterfaceCheckMeasurement,
+    InterfaceCheckResult,
+    InterfaceCheckUsedExpectations,
+)
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def make_checks(n_ports: int) -> list[InterfaceCheck]:
+    return [
+        InterfaceCheck(
+            check_params=InterfaceCheckParams(
+                interface=f"Ethernet{port}", interface_flags=None
+            ),
+            expected_results=InterfaceCheckUsedExpectations(
+                used=True, desc=f"port {port}", oper_up=True, speed=100_000
+            ),
+        )
+        for port in range(1, n_ports + 1)
+    ]
+
+
+def measurement(check: InterfaceCheck) -> dict:
+    port = int(check.check_id().removeprefix("Ethernet"))
+    return dict(used=True, desc=f"port {port}", oper_up=bool(port % 10), speed=100_000)
+
+
+def run_checks(checks: list[InterfaceCheck]) -> list[str]:
+    results = [
+        InterfaceCheckResult(
+            device="switch1", check=check, measurement=measurement(check)
+        ).measure()
+        for check in checks
+    ]
+    return [res.model_dump_json() for res in results]
+
+
+def run_construct(checks: list[InterfaceCheck]) -> list[str]:
+    results = [
+        InterfaceCheckResult.model_construct(
+            device="switch1",
+            check=check,
+            measurement=InterfaceCheckMeasurement.model_construct(**measurement(check)),
+        ).measure()
+        for check in checks
+    ]
+    return [res.model_dump_json() for res in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ports", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    checks = make_checks(args.ports)
+
+    print(f"ports={args.ports} rounds={args.rounds}")
+
+    for name, func in (("validated", run_checks), ("construct", run_construct)):
+        func(checks)
+        t_start = time.perf_counter()
+        for _ in range(args.rounds):
+            func(checks)
+        t_used = (time.perf_counter() - t_start) / args.rounds
+        print(f"  {name + ':':18} {t_used * 1000:8.2f}ms per device")
+
+
+if __name__ == "__main__":
+    main()
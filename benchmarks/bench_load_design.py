@@ -0,0 +1,120 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark the time and memory (max RSS) used to load a synthetic design.
+
+The design is composed of N devices of the same device-type, each with P
+interfaces.  The designer assigns a profile to a fraction of the interfaces
+of each device, and then the "used" interfaces of every device are walked as
+the config rendering and check building would do; these walks are repeated
+since each check collection and template walks the used interfaces again.
+
+    python benchmarks/bench_load_design.py --devices 5000 --ports 128
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import resource
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.design import Design
+from netcad.device import Device, DeviceType, DeviceTypeRegistry
+from netcad.device.device_type import DeviceInterfaceType
+from netcad.device.profiles import InterfaceL3
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_device_cls(n_ports: int) -> type:
+    product_model = f"BENCH-{n_ports}"
+
+    interfaces = {
+        f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+        for port in range(1, n_ports + 1)
+    }
+    interfaces["Management1"] = DeviceInterfaceType(name="Management1")
+
+    DeviceTypeRegistry.registry_add(
+        product_model,
+        DeviceType(
+            model=product_model, product_model=product_model, interfaces=interfaces
+        ),
+    )
+
+    class BenchSwitch(Device):
+        os_name = "eos"
+
+    BenchSwitch.product_model = product_model
+    BenchSwitch.init_device_spec()
+    return BenchSwitch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=5000)
+    parser.add_argument("--ports", type=int, default=128)
+    parser.add_argument(
+        "--used", type=float, default=0.25, help="fraction of ports assigned"
+    )
+    parser.add_argument(
+        "--walks", type=int, default=10, help="number of walks of the used ports"
+    )
+    args = parser.parse_args()
+
+    device_cls = make_device_cls(args.ports)
+    n_used = int(args.ports * args.used)
+    rss_start = max_rss_mb()
+
+    design = Design(name="bench")
+
+    t_start = time.perf_counter()
+
+    devices = [device_cls(f"switch{num}") for num in range(args.devices)]
+    t_create = time.perf_counter()
+
+    for device in devices:
+        for port in range(1, n_used + 1):
+            device.interfaces[f"Ethernet{port}"].profile = InterfaceL3(desc="bench")
+
+    design.add_devices(*devices)
+    t_assign = time.perf_counter()
+
+    n_walked = sum(len(device.interfaces.used()) for device in devices)
+    t_walk = time.perf_counter()
+
+    for _ in range(args.walks - 1):
+        for device in devices:
+            device.interfaces.used()
+
+    t_walks = time.perf_counter()
+
+    print(f"devices={args.devices} ports={args.ports} used-ports={n_used}")
+    print(f"  create devices:    {t_create - t_start:8.3f}s")
+    print(f"  assign profiles:   {t_assign - t_create:8.3f}s")
+    print(f"  walk used ({n_walked}): {t_walk - t_assign:8.3f}s")
+    print(f"  walk used again x{args.walks - 1}: {t_walks - t_walk:8.3f}s")
+    print(f"  total:             {t_walks - t_start:8.3f}s")
+    print(
+        f"  max RSS:           {max_rss_mb():8.1f}MB (+{max_rss_mb() - rss_start:.1f}MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
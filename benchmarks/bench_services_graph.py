@@ -0,0 +1,106 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark the time used to build the services analysis graph.
+
+The synthetic service adds the same pattern of design and check nodes that
+the TopologyService adds: a node per device, interface and interface profile,
+and the interface check results related to each interface.
+
+    python benchmarks/bench_services_graph.py --devices 2000 --ports 8
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from types import SimpleNamespace
+import argparse
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.services import ServicesAnalyzer, DesignService
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+CHECK_TYPES = ("interfaces", "ipaddrs", "cabling")
+
+
+class BenchObj:
+    def __init__(self, name: str, check_type: str = None):
+        self.name = name
+        self.check_type = check_type
+
+
+class BenchService(DesignService):
+    def __init__(self, *vargs, n_devices: int, n_ports: int, **kwargs):
+        super().__init__(*vargs, **kwargs)
+        self.devices = [BenchObj(f"switch{num}") for num in range(n_devices)]
+        self.interfaces = {
+            dev_obj: [
+                (BenchObj(f"Ethernet{port}"), BenchObj(f"profile{port}"))
+                for port in range(1, n_ports + 1)
+            ]
+            for dev_obj in self.devices
+        }
+
+    def build_design_graph(self, ai: ServicesAnalyzer):
+        for dev_obj in self.devices:
+            ai.add_design_node(dev_obj, kind_type="device", device=dev_obj.name)
+
+            for if_obj, if_profile in self.interfaces[dev_obj]:
+                if ai.add_design_node(
+                    if_obj, kind_type="interface", device=dev_obj.name
+                ):
+                    ai.add_design_edge(dev_obj, if_obj)
+
+                ai.add_service_edge(self, dev_obj, if_obj)
+
+                if ai.add_design_node(if_profile, kind_type="interface.profile"):
+                    ai.add_design_edge(if_profile, if_obj)
+
+                ai.add_service_edge(self, self, if_obj)
+                ai.add_service_edge(self, if_profile, if_obj)
+
+    def build_results_graph(self, ai: ServicesAnalyzer):
+        for dev_obj in self.devices:
+            for if_obj, _ in self.interfaces[dev_obj]:
+                for check_type in CHECK_TYPES:
+                    check_obj = BenchObj(if_obj.name, check_type=check_type)
+                    ai.add_check_node(
+                        self, check_obj, check_id=if_obj.name, device=dev_obj.name
+                    )
+                    ai.add_check_edge(self, if_obj, check_obj)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--ports", type=int, default=8)
+    args = parser.parse_args()
+
+    design = SimpleNamespace(name="bench", devices={}, features={}, services={})
+    BenchService(
+        design, name="bench", owner="bench", n_devices=args.devices, n_ports=args.ports
+    )
+
+    t_start = time.perf_counter()
+    ai = ServicesAnalyzer(design=design)
+    ai.build()
+    t_build = time.perf_counter()
+
+    print(f"devices={args.devices} ports={args.ports}")
+    print(f"  nodes={ai.graph.vcount()} edges={ai.graph.ecount()}")
+    print(f"  build graph:       {t_build - t_start:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
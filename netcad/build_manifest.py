@@ -0,0 +1,74 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict
+from pathlib import Path
+import json
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.config import netcad_globals
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["BuildManifest"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class BuildManifest:
+    """
+    The BuildManifest records the device fingerprint (see DeviceFingerprinter)
+    of each build output, for example a device configuration file, so that an
+    incremental build can skip the devices whose design inputs did not change
+    since the last build.  The manifest is stored in the netcad cache directory
+    as "manifests/<kind>.json" and is keyed by the output path.
+    """
+
+    def __init__(self, kind: str, cache_dir: Optional[Path] = None):
+        cache_dir = cache_dir or netcad_globals.g_netcad_cache_dir
+        self.filepath = cache_dir / "manifests" / f"{kind}.json"
+        self.outputs: Dict[str, str] = dict()
+
+        if self.filepath.exists():
+            try:
+                self.outputs = json.loads(self.filepath.read_text())
+            except ValueError:
+                # a corrupted manifest is ignored; everything is rebuilt.
+                pass
+
+    def is_current(self, output: Path, fingerprint: Optional[str]) -> bool:
+        """
+        Returns True when the output exists and was built from the design
+        inputs with the same fingerprint.
+        """
+        return bool(
+            fingerprint
+            and self.outputs.get(str(output)) == fingerprint
+            and output.exists()
+        )
+
+    def update(self, output: Path, fingerprint: Optional[str]):
+        if fingerprint:
+            self.outputs[str(output)] = fingerprint
+        else:
+            self.outputs.pop(str(output), None)
+
+    def save(self):
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self.filepath.with_suffix(".tmp")
+        tmp_filepath.write_text(json.dumps(self.outputs, indent=3, sort_keys=True))
+        os.replace(tmp_filepath, self.filepath)
@@ -5,7 +5,7 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Dict, Hashable, Set
+from typing import Dict, Hashable, Set, List, Tuple
 from collections import defaultdict
 
 # -----------------------------------------------------------------------------
@@ -31,11 +31,67 @@ class CablePlanner(Registry):
         self.cables: Dict[Hashable, set] = defaultdict(set)
         self.validated = False
 
+        # the indexes of the cables, maintained by `add_endpoint`, so that the
+        # cables of a device, or the cable peers of an interface, are found
+        # without scanning all the cables.  The cable-ids of each device are
+        # stored as dict keys so that they retain the order of the cables.
+        # The indexes are rebuilt by `validate`, so that a subclass that
+        # changes the cables directly does not leave the indexes stale.
+
+        self.device_cables: Dict[Device, Dict[Hashable, None]] = defaultdict(dict)
+        self.interface_cables: Dict[DeviceInterface, Hashable] = dict()
+
     def add_devices(self, *devices: Device):
         self.devices.update(devices)
 
     def add_endpoint(self, cable_id, interface: DeviceInterface):
         self.cables[cable_id].add(interface)
+        self.device_cables[interface.device][cable_id] = None
+        self.interface_cables[interface] = cable_id
+
+    def clear_cables(self):
+        """
+        Removes all of the cables, and their indexes, so that the cabling can
+        be built from scratch.
+        """
+        self.cables.clear()
+        self.device_cables.clear()
+        self.interface_cables.clear()
+
+    def cable_peers(self, interface: DeviceInterface) -> Set[DeviceInterface]:
+        """
+        Returns the set of the other interfaces on the cable of the given
+        interface; or an empty set if the interface is not cabled by this plan.
+        """
+        if (cable_id := self.interface_cables.get(interface)) is None:
+            return set()
+
+        return self.cables[cable_id] - {interface}
+
+    def __getstate__(self):
+        # the cable indexes are not pickled, for example by the design cache,
+        # since they are rebuilt from the cables when unpickled.
+
+        state = self.__dict__.copy()
+        state.pop("device_cables", None)
+        state.pop("interface_cables", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.index_cables()
+
+    def index_cables(self):
+        """
+        Rebuilds the indexes of the cables from the cables.
+        """
+        self.device_cables = defaultdict(dict)
+        self.interface_cables = dict()
+
+        for cable_id, interfaces in self.cables.items():
+            for interface in interfaces:
+                self.device_cables[interface.device][cable_id] = None
+                self.interface_cables[interface] = cable_id
 
     def validate_endpoints(self):
         """
@@ -76,7 +132,8 @@ class CablePlanner(Registry):
         """
         Validates the cabling plan by ensureing that each cable contains exactly
         two device interface instances.  If the plan is valid, then the
-        `validated` attribute will be set to True.
+        `validated` attribute will be set to True, and the cable indexes are
+        rebuilt; see `index_cables`.
 
         If there are no validate cables, meaning, no cables with two end-points,
         then an exception is raised.
@@ -105,21 +162,22 @@ class CablePlanner(Registry):
             raise RuntimeError("No cabling", self, ifs_by_counts)
 
         self.validate_endpoints()
+        self.index_cables()
         self.validated = True
         return len(self.cables)
 
     @classmethod
-    def find_cables_by_device(cls, device: Device):
+    def find_cables_by_device(cls, device: Device) -> List[Tuple[Hashable, set]]:
+        """
+        Returns the list of (cable-id, endpoints) of the cables, from all of the
+        cable planners, that have an endpoint on the given device.
+        """
         device_cables = list()
 
-        cablers = cls.registry_list(subclasses=True)
-
-        for each_name in cablers:
-            cabler: CablePlanner = cls.registry_get(each_name)
-
-            for cable_id, endpoints in cabler.cables.items():
-                if any(map(lambda e: e.device == device, endpoints)):
-                    device_cables.append((cable_id, endpoints))
+        cabler: CablePlanner
+        for cabler in cls.registry_items(subclasses=True).values():
+            for cable_id in cabler.device_cables.get(device, ()):
+                device_cables.append((cable_id, cabler.cables[cable_id]))
 
         return device_cables
 
@@ -3,6 +3,7 @@
 
 from .check import Check
 from .check_result import CheckResult, CheckResultList, CheckResultsCollection
+from .check_result_lazy import LazyCheckResult
 
 from .check_exclusively import (
     CheckExclusiveResult,
@@ -9,20 +9,24 @@ import sys
 from typing import List, Optional, Any, Type, ClassVar
 from typing import TYPE_CHECKING
 from pathlib import Path
-import json
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
 from pydantic import BaseModel, Field, TypeAdapter
-import aiofiles
 
 # -----------------------------------------------------------------------------
 # Private Imports
 # -----------------------------------------------------------------------------
 
 from . import Check, CheckResult
+from .checks_file import (
+    ChecksCompression,
+    checks_filepath,
+    read_checks_file,
+    write_checks_file,
+)
 
 if TYPE_CHECKING:
     from netcad.design import DesignFeature
@@ -62,11 +66,44 @@ class CheckCollection(BaseModel):
 
     @staticmethod
     def filepath(testcase_dir: Path, service: str) -> Path:
-        return testcase_dir.joinpath(f"{service}.json")
+        return checks_filepath(testcase_dir, service)
+
+    async def save(
+        self,
+        testcase_dir: Path,
+        pretty: bool = False,
+        compression: ChecksCompression = ChecksCompression.none,
+    ) -> Path:
+        """
+        Saves the check collection, see `save_file`.  The checks build, see
+        `build_device_checks`, calls `save_file` directly unless a subclass
+        overrides this coroutine, in which case the override is used.
+        """
+        return self.save_file(testcase_dir, pretty=pretty, compression=compression)
+
+    def save_file(
+        self,
+        testcase_dir: Path,
+        pretty: bool = False,
+        compression: ChecksCompression = ChecksCompression.none,
+    ) -> Path:
+        """
+        Saves the check collection as JSON, compact unless `pretty` is True,
+        and returns the Path of the file.
 
-    async def save(self, testcase_dir: Path):
-        async with aiofiles.open(self.filepath(testcase_dir, self.name), "w+") as ofile:
-            await ofile.write(json.dumps(self.model_dump(), indent=3))
+        Parameters
+        ----------
+        testcase_dir:
+            The device checks directory.
+
+        pretty:
+            When True the JSON is indented for readability.
+
+        compression:
+            The compression of the file, see ChecksCompression.
+        """
+        content = self.model_dump_json(indent=3 if pretty else None)
+        return write_checks_file(testcase_dir, self.name, content.encode(), compression)
 
     @classmethod
     def get_name(cls):
@@ -75,9 +112,8 @@ class CheckCollection(BaseModel):
 
     @classmethod
     async def load(cls, testcase_dir: Path):
-        async with aiofiles.open(cls.filepath(testcase_dir, cls.get_name())) as infile:
-            content = json.loads(await infile.read())
-            return cls.model_validate(content)
+        content = await read_checks_file(cls.filepath(testcase_dir, cls.get_name()))
+        return cls.model_validate_json(content)
 
     @classmethod
     def build(cls, obj: Any, design_feature: "DesignFeature") -> "CheckCollection":
@@ -95,6 +131,10 @@ class CheckCollection(BaseModel):
 
     _check_results_type_map: ClassVar[dict[str, Type[CheckResult]]] = dict()
 
+    # the validators of the check-result types are created on first use and
+    # then reused for each result of that type; key=check-type.
+    _check_results_adapters: ClassVar[dict[str, TypeAdapter]] = dict()
+
     @classmethod
     def parse_result(cls, result: dict) -> CheckResult:
         """
@@ -112,12 +152,23 @@ class CheckCollection(BaseModel):
         if (check_type := check.get("check_type")) is None:
             raise ValueError('Required "check_type" missing in result')
 
+        return cls._result_adapter(check_type).validate_python(result)
+
+    @classmethod
+    def _result_adapter(cls, check_type: str) -> TypeAdapter:
+        """
+        Returns the validator for the check-result type bound to the check-type.
+        """
+        if (adapter := cls._check_results_adapters.get(check_type)) is not None:
+            return adapter
+
         if (cls_type := cls._check_results_type_map.get(check_type)) is None:
             raise ValueError(
                 f"This check collection does not have bound check-type: {check_type}"
             )
 
-        return TypeAdapter(cls_type).validate_python(result)
+        adapter = cls._check_results_adapters[check_type] = TypeAdapter(cls_type)
+        return adapter
 
     def __init_subclass__(cls, **kwargs):
         mod = sys.modules.get(cls.__module__)
@@ -142,6 +193,7 @@ class CheckCollection(BaseModel):
                 raise RuntimeError(f'Required "check_type" missing from: {str(each)}')
 
             cls._check_results_type_map[check_type_value] = each
+            cls._check_results_adapters.pop(check_type_value, None)
 
 
 CheckCollectionT = Type[CheckCollection]
@@ -5,7 +5,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional, Any, List, TypeVar, Generic
+from typing import Optional, Any, List, TypeVar, Generic, Type
+from functools import lru_cache
 import typing
 
 # -----------------------------------------------------------------------------
@@ -137,7 +138,6 @@ class CheckResult(BaseModel, Generic[CheckT], metaclass=MetaCheckResult):
         """
 
         arbitrary_types_allowed = True
-        json_encoders = {CheckResultLogs: lambda log: log.data}
 
     # noinspection PyUnusedLocal
     @field_validator("check_id", mode="before")
@@ -207,13 +207,21 @@ def _finalize_result(result: CheckResult, **kwargs) -> CheckResult:
     # check to see if there are any field-mismatches
     mismatch_fields = set()
     check_status_flags = CheckStatusFlag.PASS
+    logs = result.logs
+    msrd_values = msrd.__dict__
+    expd_values = expd.__dict__
 
-    for field in msrd.__fields__:
-        m_field = getattr(msrd, field)
+    for field, in_expd in _measure_plan(type(msrd), type(expd)):
+        m_field = msrd_values[field]
 
-        if (e_field := getattr(expd, field, None)) is None:
+        if in_expd:
+            e_field = expd_values[field]
+        else:
+            e_field = getattr(expd, field, None)
+
+        if e_field is None:
             # extra data supplied by DUT
-            result.logs.INFO(field, m_field)
+            logs.INFO(field, m_field)
             continue
 
         # if the fields are mismatched, then invoke the developer callback (or
@@ -227,7 +235,7 @@ def _finalize_result(result: CheckResult, **kwargs) -> CheckResult:
             if field_status != CheckStatus.SKIP:
                 mismatch_fields.add(field)
 
-        result.logs.log(field_status, field, {"expected": e_field, "measured": m_field})
+        logs.log_field(field_status, field, e_field, m_field)
 
     if mismatch_fields:
         setattr(result, "field", ", ".join(mismatch_fields))
@@ -238,6 +246,19 @@ def _finalize_result(result: CheckResult, **kwargs) -> CheckResult:
     return result
 
 
+@lru_cache(maxsize=None)
+def _measure_plan(
+    msrd_cls: Type[BaseModel], expd_cls: Type[BaseModel]
+) -> tuple[tuple[str, bool], ...]:
+    """
+    Returns the measurement fields that are compared, in order, by
+    `_finalize_result` for the given measurement and expected-results types;
+    along with True when the field is also an expected-results field.
+    """
+    expd_fields = expd_cls.model_fields
+    return tuple((field, field in expd_fields) for field in msrd_cls.model_fields)
+
+
 CheckResultsCollection = List[CheckResult]
 
 
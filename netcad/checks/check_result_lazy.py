@@ -0,0 +1,127 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import TYPE_CHECKING, Optional
+import json
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .check_status import CheckStatus
+from .check_result import CheckResult
+
+if TYPE_CHECKING:
+    from .check_collection import CheckCollectionT
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["LazyCheckResult"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class LazyCheckResult:
+    """
+    The LazyCheckResult stands in for a CheckResult whose payload has not been
+    parsed.  The identifying values, that is the device, check_type, check_id,
+    and status, are available without parsing the payload.  The CheckResult is
+    parsed, using the check collection, on first use of the `result` property
+    or of any other CheckResult attribute; for example `logs`.
+
+    Parameters
+    ----------
+    collection:
+        The check collection that is used to parse the payload.
+
+    payload:
+        The result payload, either as a dictionary or as a JSON string.
+    """
+
+    __slots__ = (
+        "device",
+        "check_type",
+        "check_id",
+        "status",
+        "_collection",
+        "_payload",
+        "_result",
+    )
+
+    def __init__(
+        self,
+        collection: "CheckCollectionT",
+        payload: dict | str,
+        device: str,
+        check_type: str,
+        check_id: Optional[str],
+        status: str,
+    ):
+        self.device = device
+        self.check_type = check_type
+        self.check_id = check_id
+        self.status = CheckStatus(status)
+        self._collection = collection
+        self._payload = payload
+        self._result: Optional[CheckResult] = None
+
+    @classmethod
+    def from_dict(
+        cls, collection: "CheckCollectionT", payload: dict
+    ) -> "LazyCheckResult":
+        """
+        Returns the lazy result for the result payload dictionary, as loaded
+        from a results file.
+        """
+        return cls(
+            collection,
+            payload,
+            device=payload["device"],
+            check_type=payload["check"]["check_type"],
+            check_id=payload.get("check_id"),
+            status=payload["status"],
+        )
+
+    @property
+    def result(self) -> CheckResult:
+        """
+        Returns the CheckResult, parsing the payload on first use.
+        """
+        if self._result is None:
+            payload = self._payload
+            if isinstance(payload, str):
+                payload = json.loads(payload)
+
+            self._result = self._collection.parse_result(payload)
+            self._payload = None
+
+        return self._result
+
+    def __getattr__(self, item):
+        # the private names are not delegated, so that copy and pickle do not
+        # parse the result when probing for their special methods.
+        if item.startswith("_"):
+            raise AttributeError(item)
+
+        return getattr(self.result, item)
+
+    def __hash__(self):
+        """make hashable for dict key purposes"""
+        return id(self)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(device={self.device!r}, "
+            f"check_type={self.check_type!r}, check_id={self.check_id!r}, "
+            f"status={self.status!s})"
+        )
@@ -1,68 +1,306 @@
-from typing import List, Optional
-from functools import partial
+#  Copyright (c) 2021 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Optional, Any, Tuple
+from collections.abc import Sequence
+from contextvars import ContextVar
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
 
 from rich.table import Table, Text
 from rich.pretty import Pretty
-from pydantic import Field, RootModel
+from pydantic import Field, RootModel, ConfigDict, field_validator, model_serializer
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
 
 from netcad.checks.check_status import CheckStatus
 
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["CheckResultLogs", "cv_log_pass_details", "PASS_COUNT_FIELD"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# when False, the logs created do not store the details of the fields that
+# PASS, only the number of them.  The value is used when the logs are created,
+# so it must be set before the checks are executed.
+
+cv_log_pass_details = ContextVar("log_pass_details", default=True)
+
+# the field name of the log entry that records the number of PASS logs whose
+# details were not stored.
+
+PASS_COUNT_FIELD = "(pass-count)"
+
+
+class _NOT_MEASURED:
+    """the measured value of the log entries not created by `log_field`"""
+
+
+class LogColumns(Sequence):
+    """
+    The append-only store of the log entries, as columns.  The log entries for
+    the measured fields, see `CheckResultLogs.log_field`, store the expected
+    value as the data and the measured value; the data dictionary of these
+    entries is only created when the logs are expanded.
+
+    The store is also a sequence of the [status, field, data] log entries, and
+    entries can be appended in that form; so that the code that used the list
+    of log entries, for example `logs.root.append([status, field, data])`, is
+    not changed.
+    """
+
+    __slots__ = ("status", "field", "data", "measured", "pass_count", "pass_details")
+
+    def __init__(self, pass_details: bool = True):
+        self.status: List[CheckStatus] = []
+        self.field: List[str] = []
+        self.data: List[Any] = []
+        self.measured: List[Any] = []
+        self.pass_count = 0
+        self.pass_details = pass_details
+
+    def append(self, entry):
+        """
+        Adds the [status, field, data] log entry.  The measured field entries,
+        whose data is the dictionary of the expected and measured values, and
+        the PASS count entry are stored as when they were logged.
+        """
+        status, field, data = entry
+
+        if field == PASS_COUNT_FIELD:
+            self.pass_count += data
+        elif isinstance(data, dict) and data.keys() == {"expected", "measured"}:
+            self.add(CheckStatus(status), field, data["expected"], data["measured"])
+        else:
+            self.add(CheckStatus(status), field, data)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def add(self, status: CheckStatus, field: str, data, measured=_NOT_MEASURED):
+        if status is CheckStatus.PASS and not self.pass_details:
+            self.pass_count += 1
+            return
+
+        self.status.append(status)
+        self.field.append(field)
+        self.data.append(data)
+        self.measured.append(measured)
+
+    def rows(self, statuses: Tuple[CheckStatus, ...] = ()):
+        """
+        Yields the (status, field, data) log entries; only those with the given
+        statuses, if any.
+        """
+        for status, field, data, measured in zip(
+            self.status, self.field, self.data, self.measured
+        ):
+            if statuses and status not in statuses:
+                continue
+
+            if measured is not _NOT_MEASURED:
+                data = {"expected": data, "measured": measured}
+
+            yield status, field, data
+
+        if self.pass_count and (not statuses or CheckStatus.PASS in statuses):
+            yield CheckStatus.PASS, PASS_COUNT_FIELD, self.pass_count
+
+    def __len__(self) -> int:
+        return len(self.status) + bool(self.pass_count)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [list(row) for row in self.rows()][index]
+
+        # the entry is read from the columns; the PASS count entry, if any, is
+        # the last entry.
+
+        n_entries = len(self)
+        if index < 0:
+            index += n_entries
+
+        if not 0 <= index < n_entries:
+            raise IndexError("log entry index out of range")
+
+        if index == len(self.status):
+            return [CheckStatus.PASS, PASS_COUNT_FIELD, self.pass_count]
+
+        data = self.data[index]
+        if (measured := self.measured[index]) is not _NOT_MEASURED:
+            data = {"expected": data, "measured": measured}
+
+        return [self.status[index], self.field[index], data]
+
+    def __iter__(self):
+        return (list(row) for row in self.rows())
+
+    def __repr__(self):
+        return repr(list(self))
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        # the logs are validated from, and serialized to, the list of
+        # [status, field, data] entries.
+
+        return {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "prefixItems": [{"type": "string"}, {"type": "string"}, {}],
+                "minItems": 3,
+                "maxItems": 3,
+            },
+        }
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        if not isinstance(other, LogColumns):
+            return NotImplemented
+        return list(self.rows()) == list(other.rows())
+
+
+def _status_logger(status: CheckStatus):
+    """
+    Returns the method that adds a log entry with the given status, for example
+    `logs.FAIL(field, data)`.
+    """
+
+    def log_status(self, field, data):
+        self.root.add(status, field, data)
+
+    log_status.__name__ = str(status)
+    log_status.__doc__ = f"Adds a {status} log entry for the field"
+    return log_status
+
+
+# the status values are serialized as str, since the pydantic serialization
+# of the enum members is much slower.
+
+_status_values = {status: status.value for status in CheckStatus}
+
 
 class CheckResultLogs(RootModel):
     """
     The CheckResultLog is a field within the CheckResult class.  It is used to
     store the check-result logging information so that it can be expressed to
     the User in an easy manner.
+
+    The log entries are stored as columns, see LogColumns, and are expanded
+    into the list of [status, field, data] entries only when they are rendered,
+    see `pretty_table`, or exported, see `expand`.  The logs are serialized in
+    the expanded form, so the results files are not changed.
+
+    When the `cv_log_pass_details` context variable is False, the details of
+    the PASS entries are not stored.  Only the number of them is stored, and
+    exported as a single PASS entry with the field name PASS_COUNT_FIELD.
     """
 
-    root: List = Field(default_factory=list)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    root: LogColumns = Field(
+        default_factory=lambda: LogColumns(cv_log_pass_details.get())
+    )
+
+    # -------------------------------------------------------------------------
+    #                       Logging Methods
+    # -------------------------------------------------------------------------
+
+    PASS = _status_logger(CheckStatus.PASS)
+    FAIL = _status_logger(CheckStatus.FAIL)
+    INFO = _status_logger(CheckStatus.INFO)
+    SKIP = _status_logger(CheckStatus.SKIP)
+    WARN = _status_logger(CheckStatus.WARN)
+
+    info = INFO
+    warn = WARN
+    fail = FAIL
+
+    def log(self, /, status, field, data):
+        self.root.add(CheckStatus(status), field, data)
+
+    def log_field(self, status: CheckStatus, field: str, expected, measured):
+        """
+        Adds the log entry for a measured field; the data of the entry is the
+        dictionary of the expected and measured values.
+        """
+        self.root.add(status, field, expected, measured)
+
+    # -------------------------------------------------------------------------
+    #                       Export Methods
+    # -------------------------------------------------------------------------
+
+    def expand(self, *statuses: CheckStatus) -> List[list]:
+        """
+        Returns the list of [status, field, data] log entries; only those with
+        the given statuses, if any.
+        """
+        return [list(row) for row in self.root.rows(statuses)]
 
     def pretty_table(self, table: Optional[Table] = None) -> Table:
         if not table:
             table = Table(show_header=False, box=None)
 
-        status_id_hash = {id(log): CheckStatus(log[0]) for log in self.root}
-
         def sorted_by_status(_log):
-            return status_id_hash[id(_log)].to_flag()
+            return _log[0].to_flag()
 
-        for log in sorted(self.root, key=sorted_by_status, reverse=True):
-            st_enum = status_id_hash[id(log)]
-            status, field, log_info = log
+        for log in sorted(self.expand(), key=sorted_by_status, reverse=True):
+            st_enum, field, log_info = log
 
-            if st_enum == CheckStatus.PASS:
+            if st_enum == CheckStatus.PASS and isinstance(log_info, dict):
                 log_info = log_info["expected"]
 
             table.add_row(
-                Text(status, style=st_enum.to_style()), field, Pretty(log_info)
+                Text(st_enum, style=st_enum.to_style()), field, Pretty(log_info)
             )
 
         return table
 
-    def log(self, /, status, field, data):
-        self.root.append([status, field, data])
-
-    def info(self, field, data):
-        self.log(CheckStatus.INFO, field, data)
+    # -------------------------------------------------------------------------
+    #                       Pydantic specific
+    # -------------------------------------------------------------------------
 
-    def warn(self, field, data):
-        self.log(CheckStatus.WARN, field, data)
-
-    def fail(self, field, data):
-        self.log(CheckStatus.FAIL, field, data)
-
-    def __getattr__(self, item):
+    @field_validator("root", mode="before")
+    @classmethod
+    def _load_rows(cls, value):
         """
-        Define the getattr oberload so the caller can invite the logging methods
-        that map to the various status levels.
-
-        Parameters
-        ----------
-        item: str
-            The name of the logging level, for example "pass" or "fail"
+        Stores the list of [status, field, data] log entries, for example from
+        a results file, as columns.
         """
-        try:
-            as_status = CheckStatus(item)
-            return partial(self.log, as_status)
-        except ValueError:
-            return None
+        if isinstance(value, LogColumns):
+            return value
+
+        columns = LogColumns()
+        columns.extend(value)
+        return columns
+
+    @model_serializer(mode="plain")
+    def _serialize(self) -> List[list]:
+        values = _status_values
+        return [
+            [values[status], field, data] for status, field, data in self.root.rows()
+        ]
@@ -0,0 +1,264 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Iterable, Iterator, Dict, Tuple, Sequence, Set
+from pathlib import Path
+import threading
+import sqlite3
+import json
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["CheckResultsDB"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    device TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    check_type TEXT NOT NULL,
+    check_id TEXT,
+    status TEXT NOT NULL,
+    field TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_results_device_collection ON results (device, collection);
+CREATE INDEX IF NOT EXISTS ix_results_collection ON results (collection);
+CREATE INDEX IF NOT EXISTS ix_results_check_type ON results (check_type);
+CREATE INDEX IF NOT EXISTS ix_results_check_id ON results (check_id);
+CREATE INDEX IF NOT EXISTS ix_results_status ON results (status);
+CREATE INDEX IF NOT EXISTS ix_results_field ON results (field);
+"""
+
+
+class CheckResultsDB:
+    """
+    The CheckResultsDB is a per-design SQLite database that consolidates all of
+    the check results for all devices in the design.  The database is stored
+    in the design checks directory, that is "<checks-dir>/<design>/results.db",
+    and is written along with the per-device results files when the checks
+    are executed.
+
+    Each result is stored as a row with indexed columns (device, collection,
+    check_type, check_id, status, field) so that the show and report commands
+    can push their filters into the query rather than loading and filtering
+    every results file.  The complete result object is stored in the `payload`
+    column as JSON.
+
+    The results can be saved from a worker thread, see `save_rows`, so that
+    the executing checks are not blocked by the database writes; the writes
+    are serialized by the instance lock.
+    """
+
+    FILENAME = "results.db"
+
+    # process wide cache of open databases, key=filepath.
+    _open_dbs: Dict[Path, "CheckResultsDB"] = dict()
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.conn = sqlite3.connect(filepath, timeout=30, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._stored: Optional[Set[Tuple[str, str]]] = None
+
+    @classmethod
+    def design_filepath(cls, checks_dir: Path, design_name: str) -> Path:
+        return checks_dir / design_name / cls.FILENAME
+
+    @classmethod
+    def open(cls, checks_dir: Path, design_name: str) -> "CheckResultsDB":
+        """
+        Returns the database instance for the given design, creating the
+        database file if it does not exist.  The same instance is returned for
+        each call within the process.
+        """
+        filepath = cls.design_filepath(checks_dir, design_name)
+        if not (db := cls._open_dbs.get(filepath)):
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            db = cls._open_dbs[filepath] = cls(filepath)
+
+        return db
+
+    @classmethod
+    def open_existing(
+        cls, checks_dir: Path, design_name: str
+    ) -> Optional["CheckResultsDB"]:
+        """
+        Returns the database instance for the given design if the database
+        file exists; otherwise None, for example when the checks were executed
+        by an older version of netcam.
+        """
+        if not cls.design_filepath(checks_dir, design_name).exists():
+            return None
+
+        return cls.open(checks_dir, design_name)
+
+    @classmethod
+    def close_all(cls):
+        for db in cls._open_dbs.values():
+            db.close()
+
+        cls._open_dbs.clear()
+
+    def close(self):
+        self.conn.close()
+
+    # -------------------------------------------------------------------------
+    #                             Write Methods
+    # -------------------------------------------------------------------------
+
+    def save_results(self, device: str, collection: str, payloads: Iterable[dict]):
+        """
+        Replaces all of the results for the given device and check collection
+        with the given result payloads.
+        """
+        self.save_rows(
+            device,
+            collection,
+            (
+                (
+                    payload["check"]["check_type"],
+                    payload.get("check_id"),
+                    str(payload["status"]),
+                    payload.get("field"),
+                    json.dumps(payload),
+                )
+                for payload in payloads
+            ),
+        )
+
+    def save_rows(
+        self,
+        device: str,
+        collection: str,
+        rows: Iterable[Tuple[str, Optional[str], str, Optional[str], str]],
+    ):
+        """
+        Replaces all of the results for the given device and check collection
+        with the given rows of (check_type, check_id, status, field, payload),
+        where the payload is the result already serialized as JSON.
+
+        This method can be called from a worker thread, for example using
+        `asyncio.to_thread`.
+        """
+        with self._lock, self.conn:
+            self._stored = None
+
+            self.conn.execute(
+                "DELETE FROM results WHERE device = ? AND collection = ?",
+                (device, collection),
+            )
+            self.conn.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((device, collection, *row) for row in rows),
+            )
+
+    # -------------------------------------------------------------------------
+    #                             Query Methods
+    # -------------------------------------------------------------------------
+
+    def stored(self) -> Set[Tuple[str, str]]:
+        """
+        Returns the set of (device, collection) for which results are stored
+        in the database.
+        """
+        if self._stored is None:
+            self._stored = set(
+                self.conn.execute("SELECT DISTINCT device, collection FROM results")
+            )
+
+        return self._stored
+
+    def query(self, **filters) -> Iterator[dict]:
+        """
+        Generates the result payloads that match the given filters.  See
+        `_where` for the supported filters.
+        """
+        where, params = _where(**filters)
+        cursor = self.conn.execute(f"SELECT payload FROM results {where}", params)
+        return (json.loads(payload) for (payload,) in cursor)
+
+    def query_rows(self, columns: Sequence[str], **filters) -> Iterator[Tuple]:
+        """
+        Generates the tuple of the requested column values for the results that
+        match the given filters, for example ("device", "payload").
+        """
+        where, params = _where(**filters)
+        return self.conn.execute(
+            f"SELECT {', '.join(columns)} FROM results {where}", params
+        )
+
+    def status_counts(
+        self, group_by: Sequence[str] = ("device", "collection"), **filters
+    ) -> Iterator[Tuple]:
+        """
+        Generates tuples of the `group_by` column values, followed by the status
+        and the number of results with that status.
+        """
+        where, params = _where(**filters)
+        cols = ", ".join((*group_by, "status"))
+        return self.conn.execute(
+            f"SELECT {cols}, COUNT(*) FROM results {where} GROUP BY {cols}", params
+        )
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _where(
+    devices: Optional[Iterable[str]] = None,
+    collections: Optional[Iterable[str]] = None,
+    check_types: Optional[Iterable[str]] = None,
+    statuses: Optional[Iterable[str]] = None,
+    include_fields: Optional[Iterable[str]] = None,
+    exclude_fields: Optional[Iterable[str]] = None,
+) -> Tuple[str, list]:
+    """
+    Returns the SQL WHERE clause and the associated parameters for the given
+    filters.  Any filter that is None or empty is not applied.
+    """
+    clauses = list()
+    params = list()
+
+    def in_clause(column, values, negate=False):
+        values = [str(value) for value in values]
+        marks = ", ".join("?" * len(values))
+        if negate:
+            clauses.append(f"({column} IS NULL OR {column} NOT IN ({marks}))")
+        else:
+            clauses.append(f"{column} IN ({marks})")
+        params.extend(values)
+
+    for column, values in (
+        ("device", devices),
+        ("collection", collections),
+        ("check_type", check_types),
+        ("status", statuses),
+        ("field", include_fields),
+    ):
+        if values:
+            in_clause(column, values)
+
+    if exclude_fields:
+        in_clause("field", exclude_fields, negate=True)
+
+    if not clauses:
+        return "", params
+
+    return "WHERE " + " AND ".join(clauses), params
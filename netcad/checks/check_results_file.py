@@ -0,0 +1,214 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Iterator, Iterable, Optional, List
+from pathlib import Path
+import enum
+import json
+import os
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from pydantic import BaseModel
+import aiofiles
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.helpers import StrEnum
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "ResultsFormat",
+    "ResultsFileWriter",
+    "results_filepath",
+    "iter_results_file",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+# noinspection PyArgumentList
+class ResultsFormat(StrEnum):
+    """
+    The check results file formats.  The "json" format is a single JSON list
+    that is pretty-printed; this is the default and is also used as an export
+    format.  The "ndjson" format stores one result object per line so that
+    results can be written as they are produced and read back without holding
+    the complete list in memory.
+    """
+
+    json = enum.auto()
+    ndjson = enum.auto()
+
+
+def results_filepath(results_dir: Path, name: str) -> Optional[Path]:
+    """
+    Returns the Path to the existing results file for the given check
+    collection name, regardless of the format that was used to write it.  If
+    there are files for both formats, the most recently written one is used.
+    If there is no results file, then None is returned.
+    """
+    found = [
+        filepath
+        for fmt in ResultsFormat
+        if (filepath := results_dir / f"{name}.{fmt}").exists()
+    ]
+
+    if not found:
+        return None
+
+    return max(found, key=lambda f: f.stat().st_mtime)
+
+
+def iter_results_file(filepath: Path) -> Iterator[dict]:
+    """
+    Generates each of the result objects stored in the given results file.
+    When the file is in NDJSON format, the results are read one line at a
+    time.
+    """
+    with filepath.open() as ifile:
+        if filepath.suffix != f".{ResultsFormat.ndjson}":
+            yield from json.load(ifile)
+            return
+
+        for line in ifile:
+            if line := line.strip():
+                yield json.loads(line)
+
+
+class ResultsFileWriter:
+    """
+    The ResultsFileWriter is used to incrementally write check results to a
+    results file, for example:
+
+        async with ResultsFileWriter(results_dir, "interfaces", fmt) as writer:
+            for payload in payloads:
+                await writer.write(payload)
+
+    When the NDJSON format is used each result is a line of the file.  When the
+    JSON format is used each result is written as an item of the
+    pretty-printed JSON list.  The results are buffered, and written to the
+    file in chunks of about CHUNK_SIZE characters.
+
+    The results are written to a temporary file that replaces the results file
+    only when all the results were written.  If an exception occurs, then the
+    temporary file, and the results file of any prior execution, are removed so
+    that there is no truncated, or stale, results file.  Any results file for
+    the same check collection that was written in the other format is also
+    removed so that readers do not find stale results.
+    """
+
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(
+        self, results_dir: Path, name: str, fmt: ResultsFormat = ResultsFormat.json
+    ):
+        self.format = ResultsFormat(fmt)
+        self.results_dir = results_dir
+        self.name = name
+        self.filepath = results_dir / f"{name}.{self.format}"
+        self.count = 0
+        self._tmp_filepath = self.filepath.with_name(self.filepath.name + ".tmp")
+        self._ofile = None
+        self._buffer: List[str] = list()
+        self._buffered = 0
+
+    async def write(self, payload: dict):
+        if self.format == ResultsFormat.ndjson:
+            await self._write(json.dumps(payload) + "\n")
+        else:
+            sep = ",\n" if self.count else "\n"
+            await self._write(sep + _indent(json.dumps(payload, indent=3)))
+
+        self.count += 1
+
+    async def write_model(self, model: BaseModel, payload: Optional[str] = None):
+        """
+        Writes the pydantic model, for example a check-result, using the
+        pydantic JSON serializer rather than first creating the payload dict.
+
+        The payload is the compact JSON of the model when the caller has
+        already serialized the model, for example to also store it in the
+        results database; the payload is written as is for the NDJSON format.
+        Only the JSON format, which is pretty-printed, serializes the model
+        again.
+        """
+        if self.format == ResultsFormat.ndjson:
+            await self._write(
+                (payload or model.model_dump_json(warnings="none")) + "\n"
+            )
+        else:
+            sep = ",\n" if self.count else "\n"
+            payload = model.model_dump_json(indent=3, warnings="none")
+            await self._write(sep + _indent(payload))
+
+        self.count += 1
+
+    async def write_all(self, payloads: Iterable[dict]):
+        for payload in payloads:
+            await self.write(payload)
+
+    async def _write(self, text: str):
+        self._buffer.append(text)
+        self._buffered += len(text)
+
+        if self._buffered >= self.CHUNK_SIZE:
+            await self._flush()
+
+    async def _flush(self):
+        if self._buffer:
+            await self._ofile.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    async def __aenter__(self):
+        self._ofile = await aiofiles.open(self._tmp_filepath, "w")
+        if self.format == ResultsFormat.json:
+            self._buffer.append("[")
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            await self._ofile.close()
+            self._tmp_filepath.unlink(missing_ok=True)
+            self.filepath.unlink(missing_ok=True)
+            return
+
+        if self.format == ResultsFormat.json:
+            self._buffer.append("\n]" if self.count else "]")
+
+        await self._flush()
+        await self._ofile.close()
+        os.replace(self._tmp_filepath, self.filepath)
+
+        for other_fmt in ResultsFormat:
+            if other_fmt != self.format:
+                (self.results_dir / f"{self.name}.{other_fmt}").unlink(missing_ok=True)
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _indent(text: str, prefix: str = "   ") -> str:
+    """indent each line so the list items are formatted as json.dumps would"""
+    return "\n".join(prefix + line for line in text.splitlines())
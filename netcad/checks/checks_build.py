@@ -0,0 +1,190 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Optional, Iterator, Tuple, Dict
+from typing import TYPE_CHECKING
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import multiprocessing
+import inspect
+import asyncio
+import time
+import os
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import toml
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .checks_file import ChecksCompression
+from .check_collection import CheckCollection
+
+if TYPE_CHECKING:
+    from netcad.device import Device
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["build_device_checks", "DeviceChecksBuild", "FEATURE_CHECKS_FILENAME"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# the file that maps the check collection names of the device to the design
+# feature names.  It is written after the check collections of the device, and
+# so is used as the build output for the build manifest.
+
+FEATURE_CHECKS_FILENAME = "feature-checks.toml"
+
+# key=check collection name, value=(feature name, seconds to build and save)
+DeviceChecksBuild = Dict[str, Tuple[str, float]]
+
+# The build job is stored as a module global before the worker processes are
+# forked so that the workers inherit the loaded designs rather than having the
+# device objects pickled and sent to each of them.
+
+_g_build_job: Optional[Tuple[List["Device"], Path, bool, ChecksCompression]] = None
+
+
+def build_device_checks(
+    device_objs: List["Device"],
+    checks_dir: Path,
+    pretty: bool = False,
+    compression: ChecksCompression = ChecksCompression.none,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple["Device", DeviceChecksBuild]]:
+    """
+    Builds and saves the check collections of each of the given devices,
+    generating the tuple (device, build) in the same order as the given
+    devices.  The checks of each device are saved in the device directory
+    "<checks-dir>/<design>/<device>", along with the FEATURE_CHECKS_FILENAME
+    file.
+
+    The devices are built across a pool of worker processes when more than
+    one worker is requested and the platform supports forking processes;
+    otherwise the devices are built in this process.
+
+    Parameters
+    ----------
+    device_objs:
+        The devices to build.
+
+    checks_dir:
+        The root checks directory.
+
+    pretty: optional
+        When True the check files are indented for readability.
+
+    compression: optional
+        The compression of the check files.
+
+    workers: optional
+        The number of worker processes, defaults to the number of CPUs.
+    """
+    global _g_build_job
+
+    workers = min(workers or os.cpu_count() or 1, len(device_objs))
+    _g_build_job = (device_objs, checks_dir, pretty, ChecksCompression(compression))
+
+    try:
+        if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            yield from zip(device_objs, map(_build_device, range(len(device_objs))))
+            return
+
+        # chunk the devices so that each worker is handed a few devices at a
+        # time, and results are returned in the same order as the devices.
+
+        chunksize = max(1, len(device_objs) // (workers * 4))
+        mp_ctx = multiprocessing.get_context("fork")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_ctx) as pool:
+            yield from zip(
+                device_objs,
+                pool.map(_build_device, range(len(device_objs)), chunksize=chunksize),
+            )
+
+    finally:
+        _g_build_job = None
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _build_device(index: int) -> DeviceChecksBuild:
+    """
+    Builds and saves the check collections of the device, for each design
+    feature bound to the device.
+    """
+    device_objs, checks_dir, pretty, compression = _g_build_job
+    device = device_objs[index]
+
+    dev_tc_dir = checks_dir / device.design.name / device.name
+    dev_tc_dir.mkdir(parents=True, exist_ok=True)
+
+    build: DeviceChecksBuild = dict()
+
+    for feature in device.features.values():
+        for collection_cls in feature.check_collections:
+            t_start = time.perf_counter()
+
+            if not (collection := collection_cls.build(device, design_feature=feature)):
+                continue
+
+            _save_collection(collection, dev_tc_dir, pretty, compression)
+            build[collection_cls.name] = (feature.name, time.perf_counter() - t_start)
+
+    feature_checks = {name: feature_name for name, (feature_name, _) in build.items()}
+    (dev_tc_dir / FEATURE_CHECKS_FILENAME).write_text(toml.dumps(feature_checks))
+
+    return build
+
+
+def _save_collection(
+    collection: CheckCollection,
+    dev_tc_dir: Path,
+    pretty: bool,
+    compression: ChecksCompression,
+):
+    """
+    Saves the check collection.  The file is written synchronously, see
+    `CheckCollection.save_file`, unless the check collection class overrides
+    the `save` coroutine; in which case the override is used, and is given the
+    pretty and compression options that it accepts.
+    """
+    if (save_kwargs := _save_override_kwargs(type(collection))) is None:
+        collection.save_file(dev_tc_dir, pretty=pretty, compression=compression)
+        return
+
+    options = dict(pretty=pretty, compression=compression)
+    kwargs = {name: options[name] for name in save_kwargs if name in options}
+    asyncio.run(collection.save(dev_tc_dir, **kwargs))
+
+
+@lru_cache(maxsize=None)
+def _save_override_kwargs(collection_cls: type) -> Optional[Tuple[str, ...]]:
+    """
+    Returns the keyword parameter names of the `save` override of the check
+    collection class, or None when the class does not override `save`.
+    """
+    if collection_cls.save is CheckCollection.save:
+        return None
+
+    return tuple(inspect.signature(collection_cls.save).parameters)
@@ -0,0 +1,154 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from pathlib import Path
+import enum
+import gzip
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import aiofiles
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.helpers import StrEnum
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "ChecksCompression",
+    "checks_filepath",
+    "read_checks_file",
+    "write_checks_file",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+# noinspection PyArgumentList
+class ChecksCompression(StrEnum):
+    """
+    The compression of the check collection files.  The "zstd" compression
+    requires the optional "zstandard" package, installed with the "zstd"
+    extra.
+    """
+
+    none = enum.auto()
+    gzip = enum.auto()
+    zstd = enum.auto()
+
+    @property
+    def suffix(self) -> str:
+        return _compression_suffix[self]
+
+
+_compression_suffix = {
+    ChecksCompression.none: ".json",
+    ChecksCompression.gzip: ".json.gz",
+    ChecksCompression.zstd: ".json.zst",
+}
+
+
+def checks_filepath(testcase_dir: Path, name: str) -> Path:
+    """
+    Returns the Path to the existing check collection file for the given name,
+    regardless of the compression that was used to write it.  If there is no
+    file, then the Path of the uncompressed file is returned.  There is only
+    one file for a check collection, since `write_checks_file` removes the file
+    of any other compression.
+    """
+    for compression in ChecksCompression:
+        if (filepath := testcase_dir / f"{name}{compression.suffix}").exists():
+            return filepath
+
+    return testcase_dir / f"{name}{ChecksCompression.none.suffix}"
+
+
+async def read_checks_file(filepath: Path) -> bytes:
+    """
+    Returns the JSON content of the check collection file, decompressed based
+    on the file suffix.
+    """
+    async with aiofiles.open(filepath, "rb") as ifile:
+        content = await ifile.read()
+
+    match filepath.suffix:
+        case ".gz":
+            return gzip.decompress(content)
+        case ".zst":
+            return _zstd().ZstdDecompressor().decompress(content)
+
+    return content
+
+
+def write_checks_file(
+    testcase_dir: Path,
+    name: str,
+    content: bytes,
+    compression: ChecksCompression = ChecksCompression.none,
+) -> Path:
+    """
+    Writes the JSON content of the check collection file using the given
+    compression, and returns the Path of the file.  Any file for the same check
+    collection that was written with a different compression is removed so
+    that readers do not find stale checks.
+
+    The file is written synchronously since the checks are built, and then
+    written, by CPU bound worker processes; see `build_device_checks`.
+    """
+    compression = ChecksCompression(compression)
+
+    match compression:
+        case ChecksCompression.gzip:
+            # the gzip header time is not set, so that the same checks are
+            # written as the same file.
+            content = gzip.compress(content, compresslevel=6, mtime=0)
+        case ChecksCompression.zstd:
+            content = _zstd().ZstdCompressor().compress(content)
+
+    filepath = testcase_dir / f"{name}{compression.suffix}"
+
+    filepath.write_bytes(content)
+
+    for other in ChecksCompression:
+        if other != compression:
+            (testcase_dir / f"{name}{other.suffix}").unlink(missing_ok=True)
+
+    return filepath
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _zstd():
+    """
+    Returns the optional zstandard module, which is imported on first use.
+    """
+    try:
+        import zstandard
+
+    except ImportError:
+        raise RuntimeError(
+            'The "zstandard" package is required for zstd compressed check files, '
+            'install the "zstd" extra'
+        )
+
+    return zstandard
@@ -4,10 +4,10 @@
 from .netcad import script
 from .cli_netcad_main import cli
 
-from . import cli_build_checks
-from . import cli_build_configs
-from . import cli_build_hostsfile
-from . import cli_list_designs
-from . import cli_show_feats
-from . import cli_show_notes
-from . import cli_show_services
+# the commands are imported when they are invoked, see LazyGroup.
+
+cli.add_lazy_command("build", "netcad.cli.clig_build", help="build configs, tests, ...")
+cli.add_lazy_command(
+    "list", "netcad.cli.cli_list_designs", help="List available designs"
+)
+cli.add_lazy_command("show", "netcad.cli.clig_netcad_show", help="show commands ...")
@@ -5,17 +5,16 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Tuple, List
-import asyncio
+from typing import Tuple, List, Optional
 from pathlib import Path
-import toml
+from collections import defaultdict
+from hashlib import sha256
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
 import click
-import aiofiles
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -25,7 +24,11 @@ from netcad.logger import get_logger
 from netcad.config import Environment
 from netcad.cli.common_opts import opt_devices, opt_designs
 from netcad.device import Device
-from netcad.design import load_design
+from netcad.device.device_fingerprint import DeviceFingerprinter
+from netcad.build_manifest import BuildManifest
+from netcad.cli.device_inventory import get_devices_from_designs
+from netcad.checks.checks_file import ChecksCompression
+from netcad.checks.checks_build import build_device_checks, FEATURE_CHECKS_FILENAME
 
 from .clig_build import clig_build
 
@@ -55,7 +58,37 @@ DevicesList = List[Device]
     type=click.Path(path_type=Path, resolve_path=True, exists=True, writable=True),
     envvar=Environment.NETCAD_CHECKSDIR,
 )
-def cli_build_tests(devices: Tuple[str], designs: Tuple[str], checks_dir: Path):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="only build devices whose design inputs changed since the last build",
+)
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="indent the JSON check files for readability",
+)
+@click.option(
+    "--compression",
+    type=click.Choice([comp.value for comp in ChecksCompression]),
+    default=ChecksCompression.none.value,
+    show_default=True,
+    help="compression of the check files",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="number of worker processes, defaults to number of CPUs",
+)
+def cli_build_tests(
+    devices: Tuple[str],
+    designs: Tuple[str],
+    checks_dir: Path,
+    incremental: bool,
+    pretty: bool,
+    compression: str,
+    workers: int,
+):
     """
     Build device test cases to audit live network
 
@@ -66,41 +99,74 @@ def cli_build_tests(devices: Tuple[str], designs: Tuple[str], checks_dir: Path):
     """
     log = get_logger()
 
-    # The set of devices we will build configurations for.  This set will be
-    # sorted before the rendering process begins.
-
-    # Load the specified designs.  As a result the Device registry will be populated
-    # accordingly.  Extract the device objects from the registry into a set that
-    # we can then iterate through.
+    # Load all of the specified designs.  As a result the Device registry will
+    # be populated accordingly.  Filter out any device that is not a "real"
+    # device, and then sort the devices based on their sorting mechanism.
 
-    for design_name in designs:
-        design = load_design(design_name=design_name)
+    device_objs: DevicesList = sorted(
+        dev
+        for dev in get_devices_from_designs(designs, include_devices=devices)
+        if not any((dev.is_pseudo, dev.is_not_managed))
+    )
 
-    device_objs = design.devices.values()  # noqa
+    log.info(f"Building device audits for {len(device_objs)} devices")
 
-    if devices:
-        device_objs = [obj for obj in device_objs if obj.name in devices]
+    # when building incrementally, the checks are only built for the devices
+    # whose fingerprint does not match the one recorded by the last build.
+    # The check file options are part of the fingerprint, since the check
+    # files change when the options change.
 
-    device_objs = [
-        dev for dev in device_objs if not any((dev.is_pseudo, dev.is_not_managed))
-    ]
-    device_objs.sort()
+    manifest = fingerprints = None
+    compression = ChecksCompression(compression)
 
-    log.info(f"Building device audits for {len(device_objs)} devices")
+    if incremental:
+        manifest = BuildManifest("checks")
+        fingerprinter = DeviceFingerprinter()
+        fingerprints = dict()
+        options = f"pretty={pretty},compression={compression}"
 
-    async def run():
-        tasks = [
-            asyncio.create_task(
-                _build_device_checks(
-                    device=device,
-                    tc_dir=checks_dir,
-                )
+        for device in list(device_objs):
+            fingerprint = fingerprints[device] = _options_fingerprint(
+                fingerprinter.fingerprint(device, with_templates=False), options
+            )
+            if manifest.is_current(
+                _feature_checks_file(checks_dir, device), fingerprint
+            ):
+                log.info(f"SKIP: {device.name} checks unchanged")
+                device_objs.remove(device)
+
+    # build the device checks in parallel; the builds are returned in the
+    # device order so that the logging is in the same order regardless of the
+    # number of workers.
+
+    collection_times = defaultdict(lambda: [0, 0.0])
+
+    for device, build in build_device_checks(
+        device_objs,
+        checks_dir=checks_dir,
+        pretty=pretty,
+        compression=compression,
+        workers=workers,
+    ):
+        log.info(f"Built checks for device: {device.name}")
+
+        for name, (_, build_time) in build.items():
+            collection_times[name][0] += 1
+            collection_times[name][1] += build_time
+
+        if manifest:
+            manifest.update(
+                _feature_checks_file(checks_dir, device), fingerprints[device]
             )
-            for device in device_objs
-        ]
-        await asyncio.gather(*tasks)
 
-    asyncio.run(run())
+    for name, (count, build_time) in sorted(collection_times.items()):
+        log.info(
+            f"Built {name} checks for {count} devices in {build_time:.3f}s, "
+            f"{build_time / count * 1000:.1f}ms per device"
+        )
+
+    if manifest:
+        manifest.save()
 
 
 # -----------------------------------------------------------------------------
@@ -110,47 +176,16 @@ def cli_build_tests(devices: Tuple[str], designs: Tuple[str], checks_dir: Path):
 # -----------------------------------------------------------------------------
 
 
-async def _build_device_checks(device: Device, tc_dir: Path):
-    """
-    This function is used to build the collection of test-case files for the
-    given device.  The collection of test-cases will be stored as JSON files,
-    the directory will be the name as the device.name.
-
-    Parameters
-    ----------
-    device:
-        The specific device instance.  Note that the device.name must not
-        contain any special characters that would complicate the directory
-        creation process.
-
-    tc_dir: Path
-        The path instance to the top-level test-case directory where the
-        device-specific directory will be created.
-    """
-    log = get_logger()
-
-    log.info(f"Building checks for device: {device.name}")
-
-    # the checks directory for the device is a subdir under the design-name.
-    # ensure this directory path exists.
+def _feature_checks_file(checks_dir: Path, device: Device) -> Path:
+    return checks_dir / device.design.name / device.name / FEATURE_CHECKS_FILENAME
 
-    dev_tc_dir = tc_dir / device.design.name / device.name
-    dev_tc_dir.mkdir(parents=True, exist_ok=True)
 
-    # for each service that is bound on the device, iterate over each of the
-    # testing features associated with that service; build the test-cases for
-    # the device and save to a JSON data file.
-
-    feature_checks = dict()
-
-    for service_obj in device.features.values():
-        for tc_svccls in service_obj.check_collections:
-            if not (test_cases := tc_svccls.build(device, design_feature=service_obj)):
-                continue
-
-            feature_checks[tc_svccls.name] = service_obj.name
-
-            await test_cases.save(dev_tc_dir)
+def _options_fingerprint(fingerprint: Optional[str], options: str) -> Optional[str]:
+    """
+    Returns the fingerprint of the device checks that includes the check file
+    options; or None when the device design inputs could not be fingerprinted.
+    """
+    if not fingerprint:
+        return None
 
-    async with aiofiles.open(dev_tc_dir / "feature-checks.toml", "w") as f:
-        await f.write(toml.dumps(feature_checks))
+    return sha256(f"{fingerprint}:{options}".encode()).hexdigest()
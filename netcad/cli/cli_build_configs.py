@@ -13,7 +13,6 @@ from pathlib import Path
 # -----------------------------------------------------------------------------
 
 import click
-import jinja2
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -24,6 +23,9 @@ from netcad.cli.common_opts import opt_devices, opt_designs, opt_configs_dir
 from netcad.config import Environment, netcad_globals
 
 from netcad.cli.device_inventory import get_devices_from_designs
+from netcad.device.device_fingerprint import DeviceFingerprinter
+from netcad.build_manifest import BuildManifest
+from netcad.jinja2.j2_render import render_device_configs
 from .clig_build import clig_build
 
 # -----------------------------------------------------------------------------
@@ -53,12 +55,24 @@ __all__ = []
     "template_file",
     help="path to specific template file",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="number of worker processes, defaults to number of CPUs",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="only build devices whose design inputs changed since the last build",
+)
 def cli_render(
     devices: Tuple[str],
     designs: Tuple[str],
     configs_dir: Path,
     template_file: str,
     templates_dir: str,
+    workers: int,
+    incremental: bool,
 ):
     """Build device configuration files"""
 
@@ -87,6 +101,8 @@ def cli_render(
     log.info(f"Building {len(device_objs)} device configurations.")
     log.info(f"Building device configs into directory: {configs_dir.absolute()}")
 
+    config_files = dict()
+
     for dev_obj in device_objs:
         design_obj = dev_obj.design
 
@@ -96,7 +112,6 @@ def cli_render(
             save_folder.insert(0, folder)
 
         save_dir = configs_dir.joinpath(*save_folder)
-        config_file = save_dir / f"{dev_obj.name}.cfg"
         save_dir.mkdir(parents=True, exist_ok=True)
         save_dir.joinpath("backup").mkdir(parents=True, exist_ok=True)
         save_dir.joinpath("diffs").mkdir(parents=True, exist_ok=True)
@@ -107,24 +122,47 @@ def cli_render(
             )
             continue
 
-        log.debug(f"BUILD config for device {dev_obj.name}")
+        config_files[dev_obj] = save_dir / f"{dev_obj.name}.cfg"
 
-        try:
-            dev_obj.init_template_env(templates_dir=Path(templates_dir))
-            config_text = dev_obj.render_config(template_file=template_file)
+    # when building incrementally, skip the devices whose fingerprint matches
+    # the one recorded by the last build, so that the config file is neither
+    # rendered nor rewritten.
 
-        except jinja2.exceptions.TemplateNotFound as exc:
-            raise RuntimeError(
-                f"Jinja2 template not found error: {dev_obj.name} {dev_obj.template}  -  {str(exc)}"
-            )
+    manifest = fingerprints = None
 
-        except jinja2.exceptions.UndefinedError as exc:
-            rt = RuntimeError(
-                f"Jinja2 undefined error: {dev_obj.name} {dev_obj.template}  -  {str(exc)}"
+    if incremental:
+        manifest = BuildManifest("configs")
+        fingerprinter = DeviceFingerprinter(salt=str(template_file or ""))
+        fingerprints = dict()
+
+        for dev_obj, config_file in list(config_files.items()):
+            dev_obj.init_template_env(templates_dir=Path(templates_dir))
+            fingerprint = fingerprints[dev_obj] = fingerprinter.fingerprint(
+                dev_obj, template_file=template_file
             )
-            rt.__traceback__ = exc.__traceback__
-            raise rt
+            if manifest.is_current(config_file, fingerprint):
+                log.info(f"SKIP: {dev_obj.name} config unchanged: {config_file.name}")
+                del config_files[dev_obj]
+
+        log.info(f"Building {len(config_files)} changed device configurations.")
+
+    # render the device configurations in parallel; the rendered configs are
+    # returned in the device order so that the logging is in the same order
+    # regardless of the number of workers.
 
+    for dev_obj, config_text in render_device_configs(
+        device_objs=list(config_files),
+        templates_dir=Path(templates_dir),
+        template_file=template_file,
+        workers=workers,
+    ):
+        config_file = config_files[dev_obj]
         log.info(f"SAVE: {dev_obj.name} config: {config_file.name}")
         with config_file.open("w+") as ofile:
             ofile.write(config_text)
+
+        if manifest:
+            manifest.update(config_file, fingerprints[dev_obj])
+
+    if manifest:
+        manifest.save()
@@ -8,3 +8,18 @@ from netcad.cli.cli_netcad_main import cli
 def clig_build():
     """build configs, tests, ..."""
     pass
+
+
+clig_build.add_lazy_command(
+    "checks",
+    "netcad.cli.cli_build_checks",
+    help="Build device test cases to audit live network",
+)
+clig_build.add_lazy_command(
+    "configs", "netcad.cli.cli_build_configs", help="Build device configuration files"
+)
+clig_build.add_lazy_command(
+    "hostsfile",
+    "netcad.cli.cli_build_hostsfile",
+    help="Create an /etc/hosts file content based on the design devices.",
+)
@@ -14,3 +14,12 @@ from netcad.cli.cli_netcad_main import cli
 def clig_design_show():
     """show commands ..."""
     pass
+
+
+clig_design_show.add_lazy_command(
+    "features", "netcad.cli.cli_show_feats", help="show features in design"
+)
+clig_design_show.add_lazy_command(
+    "notes", "netcad.cli.cli_show_notes", help="show design notes"
+)
+clig_design_show.add_lazy_command("services", "netcad.cli.cli_show_services")
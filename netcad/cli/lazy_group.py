@@ -0,0 +1,125 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Tuple, Optional, List
+import importlib
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+from click.shell_completion import CompletionItem
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["LazyGroup"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class LazyGroup(click.Group):
+    """
+    The LazyGroup is a click group whose subcommands are registered by name,
+    along with the module that defines the subcommand, and the module is only
+    imported when the subcommand is invoked.  The module defines the subcommand
+    as usual, using the group decorators; for example:
+
+        clig_design_show.add_lazy_command(
+            "vlans", "netcad.feats.vlans.cli.cli_show_vlans", help="show vlans"
+        )
+
+    The subcommand help is given when registered, so that the group help does
+    not import the subcommand modules.  Subcommands can also be added to the
+    group directly, as with any click group.
+    """
+
+    def __init__(self, *vargs, **kwargs):
+        super().__init__(*vargs, **kwargs)
+
+        # key=command name, value=(module name, short help)
+        self.lazy_commands: Dict[str, Tuple[str, str]] = dict()
+
+    def add_lazy_command(self, name: str, module: str, help: str = ""):  # noqa
+        """
+        Registers the subcommand `name` that is defined in the given module,
+        with the short help used by the group help.
+        """
+        self.lazy_commands[name] = (module, help)
+
+    def group(self, *vargs, **kwargs):
+        """the subgroups of a lazy group are also lazy groups by default"""
+        kwargs.setdefault("cls", LazyGroup)
+        return super().group(*vargs, **kwargs)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(self.commands.keys() | self.lazy_commands.keys())
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if (cmd := self.commands.get(cmd_name)) is not None:
+            return cmd
+
+        if (lazy := self.lazy_commands.get(cmd_name)) is None:
+            return None
+
+        # importing the module adds the command to this group, using the group
+        # decorators.
+
+        module_name, _ = lazy
+        importlib.import_module(module_name)
+
+        if (cmd := self.commands.get(cmd_name)) is None:
+            raise RuntimeError(
+                f'Command "{cmd_name}" not defined by module: {module_name}'
+            )
+
+        return cmd
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """
+        Writes the subcommands to the group help, using the registered help of
+        the lazy commands that have not been imported.
+        """
+        rows = list()
+
+        for name in self.list_commands(ctx):
+            if (cmd := self.commands.get(name)) is not None:
+                if cmd.hidden:
+                    continue
+                rows.append((name, cmd.get_short_help_str(formatter.width)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        """
+        Completes the subcommand names without importing the lazy commands.
+        """
+        results = list()
+
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+
+            if (cmd := self.commands.get(name)) is not None:
+                if not cmd.hidden:
+                    results.append(CompletionItem(name, help=cmd.get_short_help_str()))
+            else:
+                results.append(CompletionItem(name, help=self.lazy_commands[name][1]))
+
+        # the completion of the group options.
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
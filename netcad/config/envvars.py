@@ -28,6 +28,17 @@ class Environment(StrEnum):
 
     NETCAD_NOVALIDATE = auto()
 
+    # When set to a value other than "0", the designs that have not changed
+    # are loaded from the design snapshot cache rather than created; see the
+    # netcad/netcam `--design-cache` option.
+
+    NETCAD_DESIGNCACHE = auto()
+
+    # The format used to save check results files, "json" (default) or
+    # "ndjson".
+
+    NETCAD_RESULTS_FORMAT = auto()
+
     # When defined instructs the netcad system to use this design name, or
     # collection of design naames when using colon-separated values, so that the
     # User does not need to provide the --design flag option to CLI commands.
@@ -14,7 +14,7 @@ from types import ModuleType
 # -----------------------------------------------------------------------------
 
 from netcad.registry import Registry
-from netcad.device import Device
+from netcad.device import Device, DeviceInterface
 from netcad.notepad import Notepad
 from netcad.ipam import IPAM
 
@@ -156,3 +156,16 @@ class Design(Registry, registry_name="designs"):
     def feature_of(self, svc_cls: Type[DesignFeature]) -> List[DesignFeature]:
         """Return the features that are of the given service type"""
         return [svc for svc in self.features.values() if isinstance(svc, svc_cls)]
+
+    def interfaces_with_profile(self, *profile_classes: type) -> List[DeviceInterface]:
+        """
+        Return the used interfaces of the design devices whose profile is an
+        instance of any of the given profile classes.  The interfaces are found
+        using the index of each device, see `DeviceInterfaces.with_profile`,
+        rather than examining every interface in the design.
+        """
+        return [
+            interface
+            for device in self.devices.values()
+            for interface in device.interfaces.with_profile(*profile_classes).values()
+        ]
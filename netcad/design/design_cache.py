@@ -0,0 +1,393 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, List, Tuple, Dict, Any, Iterable
+from importlib.util import find_spec
+from pathlib import Path
+from hashlib import sha256
+import pickle
+import io
+import json
+import sys
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad import __version__
+from netcad.config import netcad_globals, Environment
+from netcad.registry import Registry
+from netcad.logger import get_logger
+
+from .design import Design
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "DesignSnapshot",
+    "registry_mark",
+    "registry_added",
+    "dumps_design",
+    "loads_design",
+    "module_files",
+    "module_files_current",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+RegistryEntries = List[Tuple[type, str, Any]]
+RegistryMark = Dict[type, dict]
+
+# key=module filepath, value=(mtime_ns, size)
+ModuleFiles = Dict[str, Tuple[int, int]]
+
+
+class DesignSnapshot:
+    """
+    The DesignSnapshot is a cache of a fully built Design instance, so that a
+    CLI command does not need to execute the design `create_design` function
+    when nothing in the design has changed.  The snapshot is stored in the
+    netcad cache directory as "designs/<design-name>.pickle" and contains the
+    design object graph along with the Registry items that were added while
+    the design was created.
+
+    The snapshot cache is only used when enabled by the User, using the
+    `--design-cache` CLI option or the NETCAD_DESIGNCACHE environment
+    variable, since a design can depend on inputs that the snapshot does not
+    track.
+
+    The snapshot is keyed by a hash of the design package files, the design
+    block in the netcad configuration file, the device-type package files,
+    and the inputs declared in the design block:
+
+        [[design]]
+            name = "site1"
+            package = "designs.site1"
+            cache-files = ["data/site1/*.csv"]
+            cache-envvars = ["SITE1_NUM_LEAFS"]
+
+    The `cache-files` are glob patterns relative to the project directory.
+    The snapshot also records the modification time and size of each module
+    file, other than the Python standard library, that is imported when the
+    design is created; for example helper modules outside of the design
+    package and plugin packages.  A snapshot with a different key, or a
+    changed module file, is not used and is replaced once the design is
+    rebuilt.
+
+    The device classes are pickled by reference, so the class template
+    interfaces of the design devices are stored in the snapshot; any other
+    class-level state that is changed by the design `create_design` function
+    is not restored from the snapshot.
+
+    If any part of a design cannot be pickled, for example a lambda function
+    assigned to a design feature, then a snapshot is not stored and the design
+    is rebuilt by each command.
+    """
+
+    def __init__(self, design_name: str, pkg_name: str, design_decl: dict):
+        self.design_name = design_name
+        self.key = self._make_key(pkg_name, design_decl)
+        self.filepath = (
+            netcad_globals.g_netcad_cache_dir / "designs" / f"{design_name}.pickle"
+        )
+        self._registry_mark: RegistryMark = dict()
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return bool(netcad_globals.g_netcad_cache_dir) and os.getenv(
+            Environment.NETCAD_DESIGNCACHE, ""
+        ) not in ("", "0")
+
+    def is_current(self) -> bool:
+        """
+        Returns True when the snapshot exists, the key matches, and the
+        module files used by the design have not changed.
+        """
+        if not (self.key and self.filepath.exists()):
+            return False
+
+        try:
+            with self.filepath.open("rb") as ifile:
+                return self._read_header(ifile)
+        except Exception:  # noqa
+            return False
+
+    def load(self) -> Optional[Design]:
+        """
+        Returns the design from the snapshot, and adds the snapshot Registry
+        items, when the snapshot key matches; otherwise returns None.
+        """
+        if not (self.key and self.filepath.exists()):
+            return None
+
+        log = get_logger()
+
+        try:
+            with self.filepath.open("rb") as ifile:
+                # the key and the module files are stored first so that the
+                # design is only unpickled when the snapshot is current.
+
+                if not self._read_header(ifile):
+                    return None
+
+                design = loads_design(ifile.read())
+
+        except Exception as exc:
+            log.debug(f"Design {self.design_name}: unable to load snapshot: {exc}")
+            return None
+
+        log.debug(f"Design {self.design_name}: loaded from snapshot")
+        return design
+
+    def mark(self):
+        """
+        Marks the Registry contents before the design is created so that
+        `save` can determine the items that were added by the design.
+        """
+        self._registry_mark = registry_mark()
+
+    def save(self, design: Design):
+        """
+        Stores the design and the Registry items added since `mark` was called.
+        """
+        if not self.key:
+            return
+
+        log = get_logger()
+
+        try:
+            data = dumps_design(design, registry_added(self._registry_mark))
+
+        except Exception as exc:
+            self.filepath.unlink(missing_ok=True)
+            log.debug(f"Design {self.design_name}: unable to save snapshot: {exc}")
+            return
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self.filepath.with_suffix(".tmp")
+
+        with tmp_filepath.open("wb") as ofile:
+            pickle.dump(self.key, ofile, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(module_files(), ofile, protocol=pickle.HIGHEST_PROTOCOL)
+            ofile.write(data)
+
+        os.replace(tmp_filepath, self.filepath)
+
+    # -------------------------------------------------------------------------
+    #
+    #                             Private Methods
+    #
+    # -------------------------------------------------------------------------
+
+    def _read_header(self, ifile) -> bool:
+        """
+        Reads the snapshot key and module files, and returns True when the
+        snapshot is current.
+        """
+        if pickle.load(ifile) != self.key:
+            return False
+
+        return module_files_current(pickle.load(ifile))
+
+    @staticmethod
+    def _make_key(pkg_name: str, design_decl: dict) -> Optional[str]:
+        hasher = sha256(f"netcad-{__version__}:{sys.version}".encode())
+        hasher.update(json.dumps(design_decl, sort_keys=True, default=str).encode())
+
+        for env_var in design_decl.get("cache-envvars", ()):
+            hasher.update(json.dumps([env_var, os.getenv(env_var)]).encode())
+
+        project_dir = netcad_globals.g_netcad_project_dir or Path.cwd()
+
+        for pattern in design_decl.get("cache-files", ()):
+            for filepath in sorted(project_dir.glob(pattern)):
+                if filepath.is_file():
+                    hasher.update(str(filepath).encode())
+                    hasher.update(sha256(filepath.read_bytes()).digest())
+
+        pkg_names = [pkg_name] + [
+            dt_cfg["package"]
+            for dt_cfg in netcad_globals.g_config.get("device-types", [])
+            if dt_cfg.get("package")
+        ]
+
+        for each_pkg_name in pkg_names:
+            if not (files := _package_files(each_pkg_name)):
+                return None
+
+            for filepath in files:
+                hasher.update(str(filepath).encode())
+                hasher.update(sha256(filepath.read_bytes()).digest())
+
+        return hasher.hexdigest()
+
+
+def registry_mark() -> RegistryMark:
+    """
+    Returns a copy of the Registry contents so that the items added by creating
+    a design can later be determined by `registry_added`.
+    """
+    return {reg_cls: dict(reg_cls._registry) for reg_cls in _registry_classes()}
+
+
+def registry_added(mark: RegistryMark) -> RegistryEntries:
+    """
+    Returns the Registry items that were added, or replaced, since the mark.
+    """
+    return [
+        (reg_cls, name, obj)
+        for reg_cls in _registry_classes()
+        for name, obj in reg_cls._registry.items()
+        if mark.get(reg_cls, {}).get(name) is not obj
+    ]
+
+
+def dumps_design(design: Design, registry_entries: RegistryEntries) -> bytes:
+    """
+    Returns the pickled design, Registry items, and the class template
+    interfaces of the design devices.  The design module is not pickled; the
+    Caller of `loads_design` must restore it.
+
+    Raises
+    ------
+    Any pickle related exception when the design cannot be pickled.
+    """
+    design_mod, design.module = design.module, None
+
+    # the device templates are pickled first, since the device interfaces are
+    # bound to the class template when they are unpickled.  The same pickler
+    # is used so that the objects shared by both are pickled once.
+
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+
+    try:
+        pickler.dump(_device_templates(design))
+        pickler.dump((design, registry_entries))
+    finally:
+        design.module = design_mod
+
+    return buffer.getvalue()
+
+
+def loads_design(data: bytes) -> Design:
+    """
+    Returns the design from the data created by `dumps_design`, adds the
+    Registry items that were added when the design was created, and restores
+    the class template interfaces of the design devices.
+    """
+    unpickler = pickle.Unpickler(io.BytesIO(data))
+
+    for device_cls, interfaces in unpickler.load():
+        device_cls.interfaces = interfaces
+
+    design, registry_entries = unpickler.load()
+
+    for reg_cls, name, obj in registry_entries:
+        reg_cls.registry_add(name, obj)
+
+    return design
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _registry_classes() -> Iterable[type]:
+    return dict.fromkeys((Registry, *Registry.registry_subclasses()))
+
+
+def module_files() -> ModuleFiles:
+    """
+    Returns the stat of each imported module file, other than the modules of
+    the Python standard library; so that a cache of the objects created by
+    the modules can be invalidated when any of the module files change, see
+    `module_files_current`.
+    """
+    files = dict()
+
+    for mod_name, module in list(sys.modules.items()):
+        if mod_name.partition(".")[0] in sys.stdlib_module_names:
+            continue
+
+        if not isinstance(filepath := getattr(module, "__file__", None), str):
+            continue
+
+        if stat := _file_stat(filepath):
+            files[filepath] = stat
+
+    return files
+
+
+def module_files_current(files: ModuleFiles) -> bool:
+    """
+    Returns True when none of the module files, see `module_files`, have
+    changed.
+    """
+    return all(_file_stat(filepath) == stat for filepath, stat in files.items())
+
+
+def _device_templates(design: Design) -> List[Tuple[type, Any]]:
+    """
+    Returns the list of (device class, template interfaces) of the device
+    classes, and their base classes, of the design devices.
+    """
+    device_classes = dict.fromkeys(
+        klass
+        for device in design.devices.values()
+        for klass in device.__class__.__mro__
+        if vars(klass).get("interfaces") is not None
+    )
+    return [(klass, vars(klass)["interfaces"]) for klass in device_classes]
+
+
+def _file_stat(filepath: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _package_files(pkg_name: str) -> Optional[List[Path]]:
+    """
+    Returns the sorted list of the source files of the top-level package that
+    contains the given package, since a design module can import from any
+    module in the same package.  Returns None if the package is not found.
+    """
+    try:
+        spec = find_spec(pkg_name.split(".")[0])
+    except (ImportError, ValueError):
+        return None
+
+    if not spec:
+        return None
+
+    if not spec.submodule_search_locations:
+        return [Path(spec.origin)] if spec.origin else None
+
+    return sorted(
+        filepath
+        for pkg_dir in spec.submodule_search_locations
+        for filepath in Path(pkg_dir).rglob("*")
+        if filepath.is_file()
+        and not any(
+            part == "__pycache__" or part.startswith(".")
+            for part in filepath.relative_to(pkg_dir).parts
+        )
+    )
@@ -7,7 +7,10 @@
 
 import asyncio
 from inspect import iscoroutinefunction
-from typing import List
+from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -16,6 +19,13 @@ from typing import List
 from netcad.config import netcad_globals
 from netcad.init import netcad_import_package
 from .design import Design
+from .design_cache import (
+    DesignSnapshot,
+    registry_mark,
+    registry_added,
+    dumps_design,
+    loads_design,
+)
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -116,8 +126,21 @@ def load_design_group(
     group_design = Design(name=group_name, config=design_config.get("config"))
     group_design.group = group_members
 
+    # the member designs are independent of each other, so they are created
+    # concurrently in worker processes.  The designs are then added to this
+    # process in the group order, along with the Registry items each design
+    # added, so the result is the same as loading the designs one at a time.
+
+    created = _create_member_designs(group_members)
+
     for design_name in group_members:
-        d_site_obj = load_design(design_name=design_name)
+        if data := created.get(design_name):
+            d_site_obj = loads_design(data)
+            d_site_obj.module = netcad_import_package(
+                netcad_globals.g_netcad_designs[design_name]["package"]
+            )
+        else:
+            d_site_obj = load_design(design_name=design_name)
 
         # need to swap the use of alias as key for the name, since multiple
         # sites will have the same alias values; and that results in only one
@@ -153,6 +176,21 @@ def load_design_singleton(design_name: str, pkg_name: str, design_decl: dict) ->
     Design instance
     """
 
+    # if the design has not changed since it was last created, then load the
+    # design from the snapshot cache rather than creating it again.
+
+    snapshot = None
+
+    if DesignSnapshot.enabled():
+        snapshot = DesignSnapshot(
+            design_name=design_name, pkg_name=pkg_name, design_decl=design_decl
+        )
+        if design_inst := snapshot.load():
+            design_inst.module = netcad_import_package(pkg_name)
+            return design_inst
+
+        snapshot.mark()
+
     try:
         design_mod = netcad_import_package(pkg_name)
 
@@ -203,4 +241,66 @@ def load_design_singleton(design_name: str, pkg_name: str, design_decl: dict) ->
         )
 
     design_inst.module = design_mod
+
+    if snapshot:
+        snapshot.save(design_inst)
+
     return design_inst
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _create_member_designs(group_members: List[str]) -> Dict[str, Optional[bytes]]:
+    """
+    Creates the group member designs in worker processes, returning the dict of
+    design name to the pickled design (see dumps_design).  Only the member
+    designs that are defined by a package, and are not available from the
+    design snapshot cache, are created.  If the platform does not support
+    forking processes, or there are not at least two such designs and two
+    CPUs, then nothing is created; and the Caller loads the designs in this
+    process.
+    """
+    to_create = list()
+
+    for design_name in dict.fromkeys(group_members):
+        design_decl = netcad_globals.g_netcad_designs.get(design_name) or {}
+        if not (pkg_name := design_decl.get("package")):
+            continue
+
+        if DesignSnapshot.enabled() and (
+            DesignSnapshot(design_name, pkg_name, design_decl).is_current()
+        ):
+            continue
+
+        to_create.append(design_name)
+
+    workers = min(len(to_create), os.cpu_count() or 1)
+
+    if workers < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        return dict()
+
+    # the worker processes are forked so that they inherit the netcad
+    # configuration and the imported packages.
+
+    mp_ctx = multiprocessing.get_context("fork")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_ctx) as pool:
+        return dict(zip(to_create, pool.map(_create_member_design, to_create)))
+
+
+def _create_member_design(design_name: str) -> Optional[bytes]:
+    mark = registry_mark()
+    design = load_design(design_name=design_name)
+
+    # if the design cannot be pickled, then the design is loaded by the parent
+    # process instead.
+
+    try:
+        return dumps_design(design, registry_added(mark))
+    except Exception:  # noqa
+        return None
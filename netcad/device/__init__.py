@@ -11,3 +11,4 @@ from .device_type_factory import DeviceTypeFactory
 from .interface_ip import InterfaceIP, to_interface_ip
 from .device_decl import build_devices_from_decl, DeviceDecl
 from .build_device_ports_from_decl import build_device_ports_from_decl
+from .device_fingerprint import DeviceFingerprinter
@@ -8,7 +8,6 @@
 from typing import Optional, TypeVar, List, Type, Dict
 from typing import TYPE_CHECKING
 import os
-from copy import deepcopy
 from pathlib import Path
 from itertools import chain
 from ipaddress import IPv4Interface, IPv6Interface, ip_interface
@@ -26,7 +25,7 @@ import jinja2
 from netcad.registry import Registry
 from netcad.config import Environment
 from netcad.config import netcad_globals
-from netcad.jinja2.j2_env import get_env, expand_templates_dirs
+from netcad.jinja2.j2_env import get_shared_env, expand_templates_dirs
 from netcad.notepad import Notepad
 
 from .device_type import DeviceType, DeviceTypeRegistry
@@ -143,17 +142,15 @@ class Device(Registry, registry_name="devices"):
         self._primary_ip: Optional[IPv4Interface | IPv6Interface] = primary_ip
         self._primary_ip_interface: Optional[DeviceInterface] = None
 
-        # make a copy of the device class interfaces so that the instance can
-        # make any specific changes; i.e. handle the various "one-off" cases
-        # that happen in real-world networks.
+        # make a copy-on-write copy of the device class interfaces so that the
+        # instance can make any specific changes; i.e. handle the various
+        # "one-off" cases that happen in real-world networks.  The class
+        # interfaces are only copied into this instance when they are used.
 
-        self.interfaces: DeviceInterfaces = deepcopy(self.__class__.interfaces)
+        self.interfaces: DeviceInterfaces = DeviceInterfaces(
+            DeviceInterface, template=self.__class__.interfaces
+        )
         self.interfaces_map: Dict[str, str] = dict()
-
-        # TODO: not sure why the device_cls attribute was not copied as part of
-        #       the deepcopy above; need to investigate.  But for now, put the
-        #       value back into the interfaces
-
         self.interfaces.device_cls = self.__class__
 
         # create the back-references from the interfaces instance to this
@@ -287,7 +284,7 @@ class Device(Registry, registry_name="devices"):
             template_dirs.extend(paths)
 
         template_dirs.append("/")
-        self.template_env = get_env(template_dirs)
+        self.template_env = get_shared_env(template_dirs)
 
     def render_config(self, template_file: Optional[Path | str] = None):
         template = self.get_template(template_file)
@@ -349,8 +346,8 @@ class Device(Registry, registry_name="devices"):
         Upon Device subclass definition create a unique set of interface
         definitions.  This step ensures that subclasses do not *step on each
         other* when declaring interface definitions at the class level.  Each
-        Device _instance_ will get a deepcopy of these interfaces so that they
-        can make one-off adjustments to the device standard.
+        Device _instance_ will get a copy-on-write copy of these interfaces so
+        that they can make one-off adjustments to the device standard.
         """
 
         super().__init_subclass__(**kwargs)
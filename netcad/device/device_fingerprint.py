@@ -0,0 +1,399 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict, Set, Iterable, Tuple
+from types import FunctionType, BuiltinFunctionType, MethodType, ModuleType
+from pathlib import Path, PurePath
+from ipaddress import _BaseAddress, _BaseNetwork  # noqa
+from hashlib import sha256
+import enum
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import jinja2
+import jinja2.meta
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad import __version__
+from .device import Device
+from .device_interface import DeviceInterface
+from .profiles import InterfaceProfile
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["DeviceFingerprinter"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# Device instance attributes that are either walked explicitly or are not
+# design inputs.
+
+_DEVICE_SKIP_ATTRS = {"interfaces", "features", "design", "template_env", "notepad"}
+_INTERFACE_SKIP_ATTRS = {"interfaces", "_profile", "cable_peer"}
+
+
+class DeviceFingerprinter:
+    """
+    The DeviceFingerprinter computes a content fingerprint for each device from
+    the design inputs that are used to build the device configuration and
+    checks.  The inputs are:
+
+        * the device attributes,
+        * the device interfaces; each with its profile and cable-peer
+          interface, including the peer attributes and profile,
+        * the design features bound to the device,
+        * the device template files, and the templates they include/import.
+
+    Other references to devices and interfaces are fingerprinted by name so
+    that a change to one device does not change the fingerprint of every other
+    device in the design.  Objects shared by many devices, for example the
+    design features, are fingerprinted once per instance of this class.
+
+    The fingerprinter must only be used once the designs are completely
+    loaded, and a new instance should be used for each build.
+    """
+
+    def __init__(self, salt: str = ""):
+        self.salt = f"netcad-{__version__}:{salt}"
+        self._obj_digests: Dict[int, Tuple[object, str]] = dict()
+        self._cls_digests: Dict[type, str] = dict()
+        self._tmpl_digests: Dict[tuple, Optional[str]] = dict()
+        self._walking: Set[int] = set()
+
+    def fingerprint(
+        self,
+        device: Device,
+        template_file: Optional[Path | str] = None,
+        with_templates: bool = True,
+    ) -> Optional[str]:
+        """
+        Returns the fingerprint for the given device.  When `with_templates` is
+        True the device template environment must be initialized (see
+        Device.init_template_env); if any of the templates use a dynamic
+        include, the dependencies cannot be determined and None is returned
+        so that the device is always rebuilt.
+
+        Parameters
+        ----------
+        device:
+            The device instance.
+
+        template_file: optional
+            The template file used rather than the device template.
+
+        with_templates:
+            When True the template files are part of the fingerprint.
+        """
+        hasher = sha256(self.salt.encode())
+
+        def update(*values):
+            for value in values:
+                hasher.update(self._digest(value).encode())
+
+        update(self._cls_digest(device.__class__))
+        update(
+            {
+                attr: value
+                for attr, value in vars(device).items()
+                if attr not in _DEVICE_SKIP_ATTRS
+            }
+        )
+
+        for if_name, if_obj in device.interfaces.items():
+            peer = if_obj.cable_peer
+            update(
+                if_name,
+                _interface_attrs(if_obj),
+                if_obj.profile,
+                peer and self._peer_digest(peer),
+            )
+
+        for feature_name, feature in device.features.items():
+            update(feature_name, feature)
+
+        if with_templates:
+            if not (
+                tmpl_digest := self._device_templates_digest(device, template_file)
+            ):
+                return None
+            update(tmpl_digest)
+
+        return hasher.hexdigest()
+
+    # -------------------------------------------------------------------------
+    #
+    #                         Design Object Digests
+    #
+    # -------------------------------------------------------------------------
+
+    def _digest(self, obj) -> str:
+        """
+        Returns a stable string that represents the content of the given
+        object, walking through containers and object attributes.
+        """
+        if obj is None or isinstance(obj, (bool, int, float)):
+            return repr(obj)
+
+        if isinstance(obj, str):
+            return f"s{len(obj)}:{obj}"
+
+        if isinstance(obj, enum.Enum):
+            return f"{obj.__class__.__qualname__}.{obj.name}"
+
+        if isinstance(obj, (PurePath, _BaseAddress, _BaseNetwork)):
+            return f"{obj.__class__.__name__}({obj})"
+
+        if isinstance(obj, type):
+            return self._cls_digest(obj)
+
+        if isinstance(obj, (FunctionType, BuiltinFunctionType, MethodType, ModuleType)):
+            return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', obj.__name__)}"
+
+        # references to other devices and interfaces are by name only
+
+        if isinstance(obj, Device):
+            return f"Device({obj.name})"
+
+        if isinstance(obj, DeviceInterface):
+            return f"DeviceInterface({obj.device_ifname})"
+
+        if isinstance(obj, jinja2.Environment):
+            return "jinja2.Environment"
+
+        obj_id = id(obj)
+        if (memo := self._obj_digests.get(obj_id)) is not None:
+            return memo[1]
+
+        # a cycle back to an object that is being walked.
+
+        if obj_id in self._walking:
+            return f"<{obj.__class__.__qualname__}>"
+
+        self._walking.add(obj_id)
+        try:
+            digest = self._walk(obj)
+        finally:
+            self._walking.discard(obj_id)
+
+        # the object is held by the memo so that its id is not reused.
+        self._obj_digests[obj_id] = (obj, digest)
+        return digest
+
+    def _walk(self, obj) -> str:
+        hasher = sha256(obj.__class__.__qualname__.encode())
+
+        # the dict items are sorted since a dict that is populated from a set,
+        # for example the cabling plan, does not have a stable order.
+
+        if isinstance(obj, dict):
+            for item_digest in sorted(
+                self._digest(key) + self._digest(value) for key, value in obj.items()
+            ):
+                hasher.update(item_digest.encode())
+
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                hasher.update(self._digest(item).encode())
+
+        elif isinstance(obj, (set, frozenset)):
+            for item_digest in sorted(map(self._digest, obj)):
+                hasher.update(item_digest.encode())
+
+        elif hasattr(obj, "__dict__") or hasattr(obj, "__slots__"):
+            hasher.update(self._cls_digest(obj.__class__).encode())
+            hasher.update(self._digest(_obj_attrs(obj)).encode())
+
+        else:
+            # the default object repr includes the memory address, which is
+            # not stable between builds.
+            text = repr(obj)
+            hasher.update((text if " at 0x" not in text else "").encode())
+
+        return hasher.hexdigest()
+
+    def _peer_digest(self, peer: DeviceInterface) -> str:
+        """
+        Returns the digest of the cable-peer interface.  The device config and
+        checks commonly use the peer interface, for example its description
+        and profile, so the peer is fingerprinted by content rather than by
+        name; the peer device itself is referenced by name and class.
+        """
+        return self._digest(
+            (
+                peer.device_ifname,
+                self._cls_digest(peer.device.__class__),
+                _interface_attrs(peer),
+                peer.profile,
+            )
+        )
+
+    def _cls_digest(self, cls: type) -> str:
+        """
+        Returns the digest of the class name and the public, non-callable class
+        attributes; for example the interface profile `desc` and `template`
+        values that are typically declared on the class.
+        """
+        if (digest := self._cls_digests.get(cls)) is not None:
+            return digest
+
+        # set a placeholder to stop any recursion back to this class.
+        self._cls_digests[cls] = f"{cls.__module__}.{cls.__qualname__}"
+
+        attrs = dict()
+        for klass in reversed(cls.__mro__[:-1]):
+            for attr, value in vars(klass).items():
+                if (
+                    attr.startswith("_")
+                    or attr == "interfaces"
+                    or callable(value)
+                    or hasattr(value, "__get__")
+                ):
+                    continue
+                attrs[attr] = value
+
+        hasher = sha256(self._cls_digests[cls].encode())
+        hasher.update(self._digest(attrs).encode())
+        digest = self._cls_digests[cls] = hasher.hexdigest()
+        return digest
+
+    # -------------------------------------------------------------------------
+    #
+    #                          Template Digests
+    #
+    # -------------------------------------------------------------------------
+
+    def _device_templates_digest(
+        self, device: Device, template_file: Optional[Path | str] = None
+    ) -> Optional[str]:
+        env = device.template_env
+        hasher = sha256()
+
+        if template_name := template_file or device.template:
+            if not (digest := self._template_digest(env, str(template_name))):
+                return None
+            hasher.update(digest.encode())
+
+        # the interface profile templates are rendered from the device
+        # template; the unused profile is used for interfaces without one.
+
+        profiles = [if_obj.profile for if_obj in device.interfaces.values()]
+        profiles.append(getattr(device, "unused_interface_profile", None))
+        seen = set()
+
+        for profile in profiles:
+            if not isinstance(profile, InterfaceProfile):
+                continue
+
+            if (template := profile.template) in seen:
+                continue
+
+            seen.add(template)
+
+            if isinstance(template, Path):
+                digest = self._template_digest(env, str(template))
+            elif isinstance(template, str):
+                digest = self._source_digest(env, template, None, ())
+            else:
+                continue
+
+            if not digest:
+                return None
+
+            hasher.update(digest.encode())
+
+        return hasher.hexdigest()
+
+    def _template_digest(
+        self, env: jinja2.Environment, name: str, parents: Iterable[str] = ()
+    ) -> Optional[str]:
+        """
+        Returns the digest of the named template source and the sources of all
+        templates that it references, or None if the references can not be
+        determined.
+        """
+        key = (id(env), name)
+        if key in self._tmpl_digests:
+            return self._tmpl_digests[key]
+
+        if name in parents:
+            return f"<{name}>"
+
+        try:
+            source, *_ = env.loader.get_source(env, name)
+        except jinja2.TemplateNotFound:
+            return None
+
+        digest = self._tmpl_digests[key] = self._source_digest(
+            env, source, name, (*parents, name)
+        )
+        return digest
+
+    def _source_digest(
+        self,
+        env: jinja2.Environment,
+        source: str,
+        name: Optional[str],
+        parents: Iterable[str],
+    ) -> Optional[str]:
+        hasher = sha256(source.encode())
+
+        try:
+            refs = jinja2.meta.find_referenced_templates(env.parse(source))
+        except jinja2.TemplateSyntaxError:
+            return hasher.hexdigest()
+
+        for ref in refs:
+            # a dynamic include/import, for example using a variable name.
+            if ref is None:
+                return None
+
+            if name:
+                ref = env.join_path(ref, name)
+
+            if not (digest := self._template_digest(env, ref, parents)):
+                return None
+
+            hasher.update(digest.encode())
+
+        return hasher.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _interface_attrs(if_obj: DeviceInterface) -> dict:
+    return {
+        attr: value
+        for attr, value in if_obj.attributes().items()
+        if attr not in _INTERFACE_SKIP_ATTRS
+    }
+
+
+def _obj_attrs(obj) -> dict:
+    attrs = dict(getattr(obj, "__dict__", {}))
+
+    for klass in obj.__class__.__mro__:
+        for attr in getattr(klass, "__slots__", ()):
+            if attr != "__dict__" and hasattr(obj, attr):
+                attrs[attr] = getattr(obj, attr)
+
+    return attrs
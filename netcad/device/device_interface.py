@@ -7,6 +7,7 @@
 
 from typing import Optional, Union, Iterable, List, Callable
 from typing import TYPE_CHECKING
+import sys
 import re
 
 # -----------------------------------------------------------------------------
@@ -19,6 +20,7 @@ import jinja2
 # Private Imports
 # -----------------------------------------------------------------------------
 from netcad.notepad import Notepad, Note, DateExpiryType
+from .device_interface_parse_name import interned_parse_name
 
 if TYPE_CHECKING:
     from netcad.device.profiles import InterfaceProfile
@@ -95,8 +97,28 @@ class DeviceInterface(object):
         class definition.  This instance will be assigned when the actual
         interface is instantiated.  This back-reference will then provide access
         to the parent device.  See __repr__ for example usage.
+
+    Notes
+    -----
+    A design can have hundreds of thousands of interface instances, so the
+    attributes are stored in slots, and the instances do not have a
+    `__dict__`; additional interface design values are assigned to the
+    interface profile.
     """
 
+    __slots__ = (
+        "name",
+        "_parsed",
+        "_profile",
+        "_desc",
+        "enabled",
+        "label",
+        "cable_id",
+        "_cable_port_id",
+        "cable_peer",
+        "interfaces",
+    )
+
     def __init__(
         self,
         name: str,
@@ -107,16 +129,14 @@ class DeviceInterface(object):
         label: Optional[str] = None,
         interfaces=None,
     ):
-        self.name = name
+        self.name = sys.intern(name)
+        self.interfaces = interfaces
 
         # need the device class, so we know how to parse the interface names.
+        # The parsed name is shared by all interfaces with the same name.
 
         device_cls = interfaces.device_cls
-        ifn_parsed = device_cls.parse_interface_name(name)
-
-        self.short_name = ifn_parsed.short_name
-        self.sort_key = ifn_parsed.sort_key
-        self.port_numbers = ifn_parsed.numbers
+        self._parsed = interned_parse_name(device_cls.parse_interface_name, name)
 
         self._profile = None
         self._desc = desc
@@ -129,7 +149,6 @@ class DeviceInterface(object):
 
         self.profile = profile
         self.cable_peer: Optional[DeviceInterface] = None
-        self.interfaces = interfaces
 
     # -------------------------------------------------------------------------
     #
@@ -163,6 +182,30 @@ class DeviceInterface(object):
     #
     # -------------------------------------------------------------------------
 
+    @property
+    def short_name(self) -> str:
+        return self._parsed.short_name
+
+    @property
+    def sort_key(self) -> tuple:
+        return self._parsed.sort_key
+
+    @property
+    def port_numbers(self) -> tuple:
+        return self._parsed.numbers
+
+    def attributes(self) -> dict:
+        """
+        Returns the dictionary of the interface attribute values.
+        """
+        attrs = {
+            attr: getattr(self, attr)
+            for attr in DeviceInterface.__slots__
+            if hasattr(self, attr)
+        }
+        attrs.update(getattr(self, "__dict__", {}))
+        return attrs
+
     @property
     def device(self):
         """
@@ -256,6 +299,9 @@ class DeviceInterface(object):
         # when a profile is set to None, then the interface.enabled is set to
 
         if not profile:
+            if self._profile is not None:
+                self.interfaces.interface_changed()
+
             self._profile = None
             self.enabled = False
             return
@@ -277,6 +323,9 @@ class DeviceInterface(object):
 
         profile.interface = self
 
+        # the used interfaces of the collection are changed.
+        self.interfaces.interface_changed()
+
     @staticmethod
     def sorted_interface_names(if_names: Iterable[str]) -> List[str]:
         """
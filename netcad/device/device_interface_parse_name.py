@@ -5,7 +5,7 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Tuple, Callable
+from typing import Tuple, Callable, Dict
 import re
 from dataclasses import dataclass
 
@@ -55,3 +55,24 @@ def default_interface_parse_name(name: str):
         short_name=f"{short_prefix}{numstr}",
         sort_key=(short_prefix, *port_numbers),
     )
+
+
+# process wide cache of the parsed interface names, key=(parser, name).  The
+# parser is part of the key since a Device subclass can parse interface names
+# differently.
+
+_interned_names: Dict[Tuple[ParserFunction, str], DeviceInterfaceNameParsed] = dict()
+
+
+def interned_parse_name(parser: ParserFunction, name: str) -> DeviceInterfaceNameParsed:
+    """
+    Returns the parsed interface name, parsing the name only the first time
+    the (parser, name) is used.  The same DeviceInterfaceNameParsed instance
+    is then shared by all the interfaces with the same name, for example
+    "Ethernet1/1" of every device of the same Device class.
+    """
+    key = (parser, name)
+    if (parsed := _interned_names.get(key)) is None:
+        parsed = _interned_names[key] = parser(name)
+
+    return parsed
@@ -5,8 +5,10 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Dict, DefaultDict, Set, Optional, Sequence
+from typing import Dict, DefaultDict, Set, Optional, Sequence, Tuple
 from collections import defaultdict
+from dataclasses import dataclass, field
+from copy import deepcopy
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -14,6 +16,7 @@ from collections import defaultdict
 
 from .profiles import InterfaceIsInVRF
 from .device_interface import DeviceInterface
+from .device_interface_parse_name import DeviceInterfaceNameParsed
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -27,6 +30,33 @@ __all__ = ["DeviceInterfaces"]
 #
 # -----------------------------------------------------------------------------
 
+# attribute values of a template interface that are shared with the device
+# specific copy rather than deep-copied.
+
+_IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    tuple,
+    type(None),
+    DeviceInterfaceNameParsed,
+)
+
+
+@dataclass
+class _InterfaceViews:
+    """
+    The views of the used interfaces of a collection, in the collection order.
+    The views are valid while the collection `key`, see
+    `DeviceInterfaces._views_key`, is unchanged.  The used interfaces by
+    profile type are only indexed when first used, see `with_profile`.
+    """
+
+    key: Tuple
+    used: Dict[str, DeviceInterface] = field(default_factory=dict)
+    by_profile_type: Optional[Dict[type, Dict[str, DeviceInterface]]] = None
+
 
 class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
     """
@@ -35,12 +65,36 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
     the device-type specification.
 
     Ad-hoc, for example, could be Port-Channel interfaces or Vlan interfaces (SVI).
+
+    A Device instance collection is created with the Device class collection
+    as its `template`.  The collection is "copy-on-write": the template
+    interfaces are shared until they are accessed, at which point a
+    device-specific copy of the template interface is created.  Iterating over
+    the collection creates the copies of any remaining template interfaces, so
+    that the interfaces are in the same order as if the template had been
+    copied when the device was created.
+
+    The used and unused interfaces are cached, see `used`, and the cache is
+    invalidated when an interface profile is changed, or an interface is added
+    or removed.  The `version` is incremented for each of these changes.
     """
 
-    def __init__(self, default_factory, **kwargs):
+    def __init__(
+        self, default_factory, template: Optional["DeviceInterfaces"] = None, **kwargs
+    ):
         super(DeviceInterfaces, self).__init__(default_factory, **kwargs)
         self.device_cls = None
         self.device = None
+        self.template = template
+        self.version = 0
+        self._views: Optional[_InterfaceViews] = None
+
+    def interface_changed(self):
+        """
+        Called when an interface in this collection changes in a way that
+        changes the used interfaces, for example its profile is assigned.
+        """
+        self.version += 1
 
     def __missing__(self, key):
         # create a new instance of the device interface. add the back-reference
@@ -48,9 +102,232 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
         # specific interface instance, the Caller can reach back to find the
         # associated device object.
 
-        self[key] = item = DeviceInterface(name=key, interfaces=self)
+        if self.template is not None and key in self.template:
+            item = self._copy_template_interface(self.template, key)
+        else:
+            item = DeviceInterface(name=key, interfaces=self)
+
+        # the new interface does not change the used interfaces, its profile
+        # is assigned after it is added.
+
+        dict.__setitem__(self, key, item)
         return item
 
+    # -------------------------------------------------------------------------
+    #
+    #                       Copy-on-write support
+    #
+    # -------------------------------------------------------------------------
+
+    def _copy_template_interface(
+        self, template: "DeviceInterfaces", if_name: str
+    ) -> DeviceInterface:
+        """
+        Returns a copy of the template interface that is bound to this
+        collection.  The copy is the same as a deepcopy of the template
+        collection would produce; the immutable attribute values are shared,
+        and any other values, for example a profile assigned to the template
+        interface, are deep-copied and bound to the new interface.
+        """
+        tmpl_if = dict.__getitem__(template, if_name)
+        if_obj = tmpl_if.__class__.__new__(tmpl_if.__class__)
+        memo = None
+
+        for attr, value in tmpl_if.attributes().items():
+            if value is template:
+                value = self
+            elif not isinstance(value, _IMMUTABLE_TYPES):
+                memo = memo or {id(template): self, id(tmpl_if): if_obj}
+                value = deepcopy(value, memo)
+
+            setattr(if_obj, attr, value)
+
+        return if_obj
+
+    def _materialize(self):
+        """
+        Copies all of the remaining template interfaces into this collection,
+        in the template order, followed by any ad-hoc interfaces in the order
+        they were added.
+        """
+        # the cached views remain valid, since the views contain the copies of
+        # the used template interfaces.
+
+        views_valid = self._views is not None and self._views.key == self._views_key()
+        template, self.template = self.template, None
+
+        if views_valid:
+            self._views.key = self._views_key()
+
+        added = dict(dict.items(self))
+        dict.clear(self)
+
+        for if_name in dict.keys(template):
+            if (if_obj := added.pop(if_name, None)) is None:
+                if_obj = self._copy_template_interface(template, if_name)
+            dict.__setitem__(self, if_name, if_obj)
+
+        dict.update(self, added)
+
+    def _iter_items(self):
+        """
+        Generates the (name, interface) items in the same order as iterating
+        the collection, without copying the template interfaces.  The
+        interface is None for a template interface that has not been copied.
+        """
+        if (template := self.template) is None:
+            yield from dict.items(self)
+            return
+
+        for if_name in dict.keys(template):
+            yield if_name, dict.get(self, if_name)
+
+        for if_name, if_obj in dict.items(self):
+            if not dict.__contains__(template, if_name):
+                yield if_name, if_obj
+
+    def __reduce__(self):
+        # the template interfaces are not pickled; the template is restored
+        # from the device class when the collection is unpickled.
+
+        return (
+            _unpickle_interfaces,
+            (self.default_factory, self.device_cls, self.template is not None),
+            {"device": self.device},
+            None,
+            iter(dict.items(self)),
+        )
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (
+            self.template is not None and key in self.template
+        )
+
+    def __iter__(self):
+        if self.template is not None:
+            self._materialize()
+        return super().__iter__()
+
+    def __reversed__(self):
+        if self.template is not None:
+            self._materialize()
+        return super().__reversed__()
+
+    def __len__(self):
+        if self.template is not None:
+            self._materialize()
+        return super().__len__()
+
+    def __eq__(self, other):
+        if self.template is not None:
+            self._materialize()
+        return super().__eq__(other)
+
+    def __repr__(self):
+        if self.template is not None:
+            self._materialize()
+        return super().__repr__()
+
+    def __setitem__(self, key, value):
+        self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if self.template is not None:
+            self._materialize()
+        self.version += 1
+        super().__delitem__(key)
+
+    def keys(self):
+        if self.template is not None:
+            self._materialize()
+        return super().keys()
+
+    def values(self):
+        if self.template is not None:
+            self._materialize()
+        return super().values()
+
+    def items(self):
+        if self.template is not None:
+            self._materialize()
+        return super().items()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *vargs, **kwargs):
+        self.version += 1
+        super().update(*vargs, **kwargs)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        # the template interfaces are also removed, so the collection no
+        # longer uses the template.
+
+        self.template = None
+        self.version += 1
+        super().clear()
+
+    def pop(self, key, *default):
+        if self.template is not None:
+            self._materialize()
+        self.version += 1
+        return super().pop(key, *default)
+
+    def popitem(self):
+        if self.template is not None:
+            self._materialize()
+        self.version += 1
+        return super().popitem()
+
+    # -------------------------------------------------------------------------
+    #
+    #                       Used interfaces views
+    #
+    # -------------------------------------------------------------------------
+
+    def _views_key(self) -> Tuple:
+        # the views of a copy-on-write collection also depend on the template
+        # interfaces that have not been copied.
+
+        template = self.template
+        return self.version, (template.version if template is not None else None)
+
+    def _interface_views(self) -> _InterfaceViews:
+        """
+        Returns the cached views of the used interfaces, creating them if any
+        interface has changed since they were created.
+        """
+        key = self._views_key()
+        if (views := self._views) is not None and views.key == key:
+            return views
+
+        views = _InterfaceViews(key=key)
+
+        interface: DeviceInterface
+        for if_name, interface in self._iter_items():
+            # the template interface is checked before it is copied so that the
+            # unused interfaces are not copied into this collection.
+
+            check_if = interface or dict.__getitem__(self.template, if_name)
+
+            if check_if.profile:
+                views.used[if_name] = interface or self[if_name]
+
+        self._views = views
+        return views
+
     def used(
         self, include_disabled=True, include_unused=False
     ) -> Dict[str, "DeviceInterface"]:
@@ -79,35 +356,75 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
         -------
         dict
         """
-        used_interfaces = dict()
 
-        interface: DeviceInterface
-        for if_name, interface in self.items():
-            # if there is no profile bound to the interface, then it is not part
-            # of the design; so skip it unless the caller wants to include unused
-
-            if not interface.profile and include_unused is False:
-                continue
+        # if there is no profile bound to the interface, then it is not part
+        # of the design; so skip it unless the caller wants to include unused
 
-            # if the interface is in the design, but the design indicates to
-            # disable ("shutdown") the interface, then by default include it in
-            # the return.  If the Caller set `include_disabled` to False then
-            # skip it.
+        if include_unused is False:
+            interfaces = self._interface_views().used.items()
+        else:
+            interfaces = self.items()
 
-            if interface.enabled is False and include_disabled is False:
-                continue
+        # if the interface is in the design, but the design indicates to
+        # disable ("shutdown") the interface, then by default include it in
+        # the return.  If the Caller set `include_disabled` to False then
+        # skip it.
 
-            used_interfaces[if_name] = interface
+        if include_disabled is not False:
+            return dict(interfaces)
 
-        return used_interfaces
+        return {
+            if_name: interface
+            for if_name, interface in interfaces
+            if interface.enabled is not False
+        }
 
     def unused(self) -> Dict[str, "DeviceInterface"]:
         """
         Returns a dictiionary of the unused interfaces.
         """
-        return dict(
-            (if_name, if_obj) for if_name, if_obj in self.items() if not if_obj.used
-        )
+        used = self._interface_views().used
+
+        return {
+            if_name: interface or self[if_name]
+            for if_name, interface in self._iter_items()
+            if if_name not in used
+        }
+
+    def with_profile(self, *profile_classes: type) -> Dict[str, "DeviceInterface"]:
+        """
+        Returns the dictionary of the used interfaces whose profile is an
+        instance of any of the given profile classes, in the collection order.
+
+        Parameters
+        ----------
+        profile_classes:
+            The interface profile classes, for example InterfaceL3.
+        """
+        views = self._interface_views()
+
+        if (by_profile_type := views.by_profile_type) is None:
+            by_profile_type = views.by_profile_type = defaultdict(dict)
+            for if_name, interface in views.used.items():
+                by_profile_type[interface.profile.__class__][if_name] = interface
+
+        matching = [
+            profile_type
+            for profile_type in by_profile_type
+            if issubclass(profile_type, profile_classes)
+        ]
+
+        if not matching:
+            return dict()
+
+        if len(matching) == 1:
+            return dict(by_profile_type[matching[0]])
+
+        return {
+            if_name: interface
+            for if_name, interface in views.used.items()
+            if interface.profile.__class__ in matching
+        }
 
     def vrfs_used(self) -> Set[str]:
         """
@@ -121,8 +438,8 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
 
         return {
             if_obj.profile.vrf
-            for if_obj in self.values()
-            if if_obj.profile and isinstance(if_obj.profile, InterfaceIsInVRF)
+            for if_obj in self._interface_views().used.values()
+            if isinstance(if_obj.profile, InterfaceIsInVRF)
         }
 
     def startswith(self, prefix: str | Sequence[str], used: Optional[bool] = None):
@@ -151,15 +468,18 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
         -------
         DeviceInterface matching the filtering criteria
         """
-        prefix_matching = filter(lambda i: i[0].startswith(prefix), self.items())
-
-        for if_name, iface in prefix_matching:
-            # if used is "don't care" then yield
-            if used is None:
-                yield iface
-
-            # if both used and iface.used are the same
-            elif used == iface.used:
+        # if used is "don't care" then yield all, otherwise yield the
+        # interfaces whose used value is the same.
+
+        if used is None:
+            interfaces = self.items()
+        elif used:
+            interfaces = self._interface_views().used.items()
+        else:
+            interfaces = self.unused().items()
+
+        for if_name, iface in interfaces:
+            if if_name.startswith(prefix):
                 yield iface
 
     def alias(self, if_alias):
@@ -183,3 +503,17 @@ class DeviceInterfaces(defaultdict, DefaultDict[str, DeviceInterface]):
             )
 
         return self.device.interfaces[if_name]
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _unpickle_interfaces(default_factory, device_cls, with_template: bool):
+    template = device_cls.interfaces if with_template else None
+    interfaces = DeviceInterfaces(default_factory, template=template)
+    interfaces.device_cls = device_cls
+    return interfaces
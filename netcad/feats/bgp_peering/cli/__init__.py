@@ -1,5 +1,10 @@
 #  Copyright (c) 2021 Jeremy Schulman
 #  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
-from . import cli_show_bgp_peers
-from . import cli_show_bgp_spakers
+from netcad.cli.clig_netcad_show import clig_design_show
+
+# the commands are imported when they are invoked, see LazyGroup.
+
+clig_design_show.add_lazy_command(
+    "bgp", "netcad.feats.bgp_peering.cli.cli_show_bgp", help="show BGP design commands"
+)
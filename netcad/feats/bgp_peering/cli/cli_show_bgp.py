@@ -15,3 +15,15 @@ from netcad.cli.clig_netcad_show import clig_design_show
 def clig_show_bgp():
     """show BGP design commands"""
     pass
+
+
+clig_show_bgp.add_lazy_command(
+    "peers",
+    "netcad.feats.bgp_peering.cli.cli_show_bgp_peers",
+    help="Show the BGP neighbor peers in the design(s)",
+)
+clig_show_bgp.add_lazy_command(
+    "speakers",
+    "netcad.feats.bgp_peering.cli.cli_show_bgp_spakers",
+    help="Show the BGP routers in the design(s)",
+)
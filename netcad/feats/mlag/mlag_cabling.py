@@ -55,7 +55,7 @@ class CableMLagsByCableId(CablePlanner):
         # clear the cable-planner known cables since each call to the 'build'
         # method will create-from-scratch.
 
-        self.cables.clear()
+        self.clear_cables()
 
         # ---------------------------------------------------------------------
         # Find MLag Cables from MLag Device Groups
@@ -1,8 +1,26 @@
 #  Copyright (c) 2021 Jeremy Schulman
 #  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
-from . import cli_show_cabling
-from . import cli_show_devices
-from . import cli_show_interfaces
-from . import cli_show_ipaddrs
-from . import cli_show_lags
+from netcad.cli.clig_netcad_show import clig_design_show
+
+# the commands are imported when they are invoked, see LazyGroup.
+
+_CLI_PKG = "netcad.feats.topology.cli"
+
+clig_design_show.add_lazy_command(
+    "cabling", f"{_CLI_PKG}.cli_show_cabling", help="show cabling between devices"
+)
+clig_design_show.add_lazy_command(
+    "devices", f"{_CLI_PKG}.cli_show_devices", help="show devices in design"
+)
+clig_design_show.add_lazy_command(
+    "interfaces",
+    f"{_CLI_PKG}.cli_show_interfaces",
+    help="show device interfaces usage",
+)
+clig_design_show.add_lazy_command(
+    "ipaddrs", f"{_CLI_PKG}.cli_show_ipaddrs", help="show IP addresses used in design"
+)
+clig_design_show.add_lazy_command(
+    "lags", f"{_CLI_PKG}.cli_show_lags", help="show device lags usage"
+)
@@ -1,5 +1,17 @@
 #  Copyright (c) 2021 Jeremy Schulman
 #  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
-from . import cli_show_switchports
-from . import cli_show_vlans
+from netcad.cli.clig_netcad_show import clig_design_show
+
+# the commands are imported when they are invoked, see LazyGroup.
+
+_CLI_PKG = "netcad.feats.vlans.cli"
+
+clig_design_show.add_lazy_command(
+    "switchports",
+    f"{_CLI_PKG}.cli_show_switchports",
+    help="show interface switchports used by design",
+)
+clig_design_show.add_lazy_command(
+    "vlans", f"{_CLI_PKG}.cli_show_vlans", help="show VLANs used by design"
+)
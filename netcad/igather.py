@@ -6,7 +6,9 @@
 #   Author: Andrey Paramonov (aparamon)
 #
 # in a discussion on how to treat a large collection of tasks.  I've modified the code
-# slightly so that I get back the original coroutine; but beyond that it is as it was found.
+# slightly so that I get back the original coroutine, and so that a slot is
+# released as soon as any task completes (rather than in submission order);
+# this way a single slow task does not hold back the start of the next one.
 
 
 import asyncio
@@ -15,7 +17,7 @@ import asyncio
 DEFAULT_MAX_TASKS = 100
 
 
-__all__ = ["as_completed", "igather"]
+__all__ = ["as_completed", "igather", "DEFAULT_MAX_TASKS"]
 
 
 async def as_completed(coros, limit=None):
@@ -23,31 +25,48 @@ async def as_completed(coros, limit=None):
 
     buf = asyncio.Queue()
     sem = asyncio.Semaphore(limit or DEFAULT_MAX_TASKS)
+    running = set()
+
+    def on_done(_task):
+        # free the slot immediately so the submitter can start the next
+        # coroutine, and hand the completed task to the consumer.
+        running.discard(_task)
+        sem.release()
+        buf.put_nowait(_task)
 
     async def submit(_coros, _buf):
+        n_tasks = 0
         while True:
             await sem.acquire()
             try:
                 # TODO: additionally support async iterators
                 _coro = next(_coros)
             except StopIteration:
+                sem.release()
                 break
             _task = asyncio.create_task(_coro)
-            _buf.put_nowait(_task)
-        await _buf.put(None)
+            running.add(_task)
+            _task.add_done_callback(on_done)
+            n_tasks += 1
+
+        # the sentinel carries the total number of submitted tasks so that the
+        # consumer knows when it has seen all of them.
+        await _buf.put(n_tasks)
 
     async def consume(_buf):
-        while True:
+        n_done = 0
+        n_tasks = None
+        while n_tasks is None or n_done < n_tasks:
             _task = await _buf.get()
-            if _task:
-                v = await asyncio.wait_for(_task, None)
-                sem.release()
-                yield (
-                    _task.get_coro(),
-                    v,
-                )  # the yield will be Tuple(original-coro, task-result)
-            else:
-                break
+            if isinstance(_task, int):
+                n_tasks = _task
+                continue
+
+            n_done += 1
+            yield (
+                _task.get_coro(),
+                _task.result(),
+            )  # the yield will be Tuple(original-coro, task-result)
 
     submit_task = asyncio.create_task(submit(coros, buf))
 
@@ -55,23 +74,21 @@ async def as_completed(coros, limit=None):
         async for result in consume(buf):
             yield result
 
-    except Exception as exc:  # noqa
-        submit_task.cancel()
-        # cancel scheduled
-        while not buf.empty():
-            task = buf.get_nowait()
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except Exception:
-                    pass
-
-        # cancel pending
-        for coro in coros:
-            asyncio.create_task(coro).cancel()
+    finally:
+        # when the consumer raises, is cancelled, or stops early (the generator
+        # is closed), then the submitter and the running tasks are cancelled;
+        # when all the results were consumed there is nothing left to cancel.
 
-        raise exc
+        for task in [submit_task, *running]:
+            task.cancel()
+            try:
+                await task
+            except (Exception, asyncio.CancelledError):
+                pass
+
+        # close pending
+        for coro in coros:
+            coro.close()
 
 
 async def igather(coros, limit=None):
@@ -6,11 +6,13 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import List, Iterable
+from typing import List, Iterable, Optional, Dict, Tuple
+from functools import lru_cache
 import re
 from itertools import chain
 import os
 from os.path import expandvars
+from pathlib import Path
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -27,12 +29,13 @@ import datetime
 from . import j2_filters
 
 from netcad.helpers import range_string
+from netcad.config import netcad_globals
 
 # -----------------------------------------------------------------------------
 # Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["get_env", "expand_templates_dirs"]
+__all__ = ["get_env", "get_shared_env", "get_bytecode_cache", "expand_templates_dirs"]
 
 # -----------------------------------------------------------------------------
 #
@@ -79,13 +82,14 @@ class RelativeEnvironment(jinja2.Environment):
         return super().join_path(template, parent)
 
 
-def get_env(template_dirs):
+def get_env(template_dirs, bytecode_cache: Optional[jinja2.BytecodeCache] = None):
     env = RelativeEnvironment(
         trim_blocks=True,
         lstrip_blocks=True,
         keep_trailing_newline=True,
         loader=jinja2.FileSystemLoader(template_dirs),
         undefined=jinja2.StrictUndefined,
+        bytecode_cache=bytecode_cache,
     )
 
     env.filters.update(_env_filters)
@@ -94,6 +98,50 @@ def get_env(template_dirs):
     return env
 
 
+# key=(tuple of template directories, netcad cache directory), value=Environment
+_shared_envs: Dict[Tuple[Tuple[str, ...], Optional[Path]], jinja2.Environment] = dict()
+
+
+def get_shared_env(template_dirs) -> jinja2.Environment:
+    """
+    Returns the Environment for the given template directories.  The same
+    Environment is returned for each call with the same directories so that
+    devices using the same templates share the compiled templates rather than
+    compiling them for each device.  The Environment uses the persistent
+    bytecode cache, if available, so that templates are not recompiled across
+    netcad invocations either.
+    """
+    key = (tuple(map(str, template_dirs)), netcad_globals.g_netcad_cache_dir)
+
+    if not (env := _shared_envs.get(key)):
+        env = _shared_envs[key] = get_env(
+            template_dirs, bytecode_cache=get_bytecode_cache()
+        )
+
+    return env
+
+
+def get_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """
+    Returns the Jinja2 bytecode cache stored in the netcad cache directory, or
+    None if the netcad cache directory has not been initialized.  The cache
+    validates each template source checksum so that changed templates are
+    recompiled.
+    """
+    if not (cache_dir := netcad_globals.g_netcad_cache_dir):
+        return None
+
+    return _bytecode_cache(Path(cache_dir))
+
+
+@lru_cache
+def _bytecode_cache(cache_dir: Path) -> jinja2.BytecodeCache:
+    """the bytecode cache of each netcad cache directory is created once"""
+    j2_cache_dir = cache_dir / "jinja2"
+    j2_cache_dir.mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(j2_cache_dir))
+
+
 _attr_re = re.compile(
     r"@{(?P<bname>[a-z\d_]+)}" r"|" r"@(?P<name>[^{][a-z_\d]+)", flags=re.IGNORECASE
 )
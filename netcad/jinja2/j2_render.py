@@ -0,0 +1,135 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Optional, Iterator, Tuple
+from typing import TYPE_CHECKING
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import jinja2
+
+if TYPE_CHECKING:
+    from netcad.device import Device
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["render_device_configs"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The render job is stored as a module global before the worker processes are
+# forked so that the workers inherit the loaded designs rather than having the
+# device objects pickled and sent to each of them.
+
+_g_render_job: Optional[Tuple[List["Device"], Optional[Path], Optional[str]]] = None
+
+
+def render_device_configs(
+    device_objs: List["Device"],
+    templates_dir: Optional[Path] = None,
+    template_file: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple["Device", str]]:
+    """
+    Renders the configuration of each of the given devices, generating the
+    tuple (device, config-text) in the same order as the given devices.
+
+    The devices are rendered across a pool of worker processes when more than
+    one worker is requested and the platform supports forking processes;
+    otherwise the devices are rendered in this process.  Devices that use the
+    same template directories share the same Jinja2 Environment, and the
+    compiled templates are stored in the netcad cache directory so they are
+    reused across worker processes and netcad invocations.
+
+    Parameters
+    ----------
+    device_objs:
+        The devices to render.
+
+    templates_dir: optional
+        The root templates directory, used when the configuration file does not
+        declare the template paths.
+
+    template_file: optional
+        The template file to use rather than the device template.
+
+    workers: optional
+        The number of worker processes, defaults to the number of CPUs.
+
+    Raises
+    ------
+    RuntimeError
+        When a device template could not be found or rendered.
+    """
+    global _g_render_job
+
+    workers = min(workers or os.cpu_count() or 1, len(device_objs))
+    _g_render_job = (device_objs, templates_dir, template_file)
+
+    try:
+        if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            for dev_obj, config_text in zip(
+                device_objs, map(_render_device, range(len(device_objs)))
+            ):
+                yield dev_obj, config_text
+            return
+
+        # chunk the devices so that each worker is handed a few devices at a
+        # time, and results are returned in the same order as the devices.
+
+        chunksize = max(1, len(device_objs) // (workers * 4))
+        mp_ctx = multiprocessing.get_context("fork")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_ctx) as pool:
+            for dev_obj, config_text in zip(
+                device_objs,
+                pool.map(_render_device, range(len(device_objs)), chunksize=chunksize),
+            ):
+                yield dev_obj, config_text
+
+    finally:
+        _g_render_job = None
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _render_device(index: int) -> str:
+    device_objs, templates_dir, template_file = _g_render_job
+    dev_obj = device_objs[index]
+
+    try:
+        dev_obj.init_template_env(templates_dir=templates_dir)
+        return dev_obj.render_config(template_file=template_file)
+
+    except jinja2.exceptions.TemplateNotFound as exc:
+        raise RuntimeError(
+            f"Jinja2 template not found error: {dev_obj.name} {dev_obj.template}  -  {str(exc)}"
+        )
+
+    except jinja2.exceptions.UndefinedError as exc:
+        rt = RuntimeError(
+            f"Jinja2 undefined error: {dev_obj.name} {dev_obj.template}  -  {str(exc)}"
+        )
+        rt.__traceback__ = exc.__traceback__
+        raise rt
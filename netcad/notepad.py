@@ -6,6 +6,7 @@
 # -----------------------------------------------------------------------------
 
 from typing import Optional, List, Union, Any, Callable
+from typing import TYPE_CHECKING
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -13,7 +14,8 @@ from dataclasses import dataclass
 # Public Imports
 # -----------------------------------------------------------------------------
 
-import maya
+if TYPE_CHECKING:
+    import maya
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -32,7 +34,7 @@ DateExpiryType = Union[datetime, str]
 class Note:
     signatory: Any
     message: str
-    expires: Optional[maya.MayaDT] = None
+    expires: Optional["maya.MayaDT"] = None
     _signature: Optional[Callable] = str
 
     def signature(self):
@@ -79,6 +81,12 @@ class Notepad:
             represent the string-name of the signatory.  By default, this will
             be the str(signatory) value.
         """
+        # the maya package is slow to import, so it is only imported when a note
+        # with an expiration is added.
+
+        if expires is not None:
+            import maya
+
         if isinstance(expires, str):
             expires_dt = maya.when(expires)
         elif isinstance(expires, datetime):
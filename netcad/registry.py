@@ -20,6 +20,20 @@ __all__ = ["Registry"]
 #
 # -----------------------------------------------------------------------------
 
+# The flattened lookup index of each registry class, including the items of its
+# subclasses; key=registry class, value=dict(key=name, value=(owner, item)).
+# The indexes are created on first use.  When an item is added or removed, or
+# a registry subclass is declared, the indexes that include the registry of
+# the class are discarded; that is the indexes of the class and its ancestors.
+
+_g_registry_indexes: Dict[type, Dict[str, Tuple[Any, Any]]] = dict()
+
+
+def _discard_indexes(reg_cls: type):
+    """discard the indexes that include the registry of the given class"""
+    for each_cls in reg_cls.__mro__:
+        _g_registry_indexes.pop(each_cls, None)
+
 
 class _RegistryFactory(object):
     """
@@ -34,6 +48,8 @@ class _RegistryFactory(object):
         if not getattr(cls, "_registry", None):
             cls._registry = dict()
 
+        _discard_indexes(cls)
+
     @classmethod
     def registry_is_private(cls):
         return cls._registry_is_private
@@ -48,6 +64,33 @@ class _RegistryFactory(object):
     def registry_add(cls, name, obj):
         """add the named object to the registry"""
         cls._registry[name] = obj
+        _discard_indexes(cls)
+
+    @classmethod
+    def registry_index(cls) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Returns the flattened lookup index of this class registry and the
+        subclassed registries.  When the same name is registered by more than
+        one class, the index uses the item of the class that is found first:
+        this class, and then the subclasses, see `registry_subclasses`.
+
+        The index is cached, and must not be modified by the Caller.
+
+        Returns
+        -------
+        Dictionary key=name, value=(owner registry class, item).
+        """
+        if (index := _g_registry_indexes.get(cls)) is not None:
+            return index
+
+        index = dict()
+
+        for each_cls in (cls, *cls.registry_subclasses()):
+            for name, item in each_cls._registry.items():
+                index.setdefault(name, (each_cls, item))
+
+        _g_registry_indexes[cls] = index
+        return index
 
     @classmethod
     def registry_get(
@@ -71,18 +114,10 @@ class _RegistryFactory(object):
             registry class that "ownes" the item. When False (default) only
             the item is returned.
         """
-        owner, item = next(
-            (
-                # return the object given by name
-                (each_cls, each_cls._registry.get(name))
-                # check _this_ class, and then any subclasses.
-                for each_cls in (cls, *cls.registry_subclasses())
-                # if the name is in the registry then return this object
-                if name in each_cls._registry
-            ),
-            # Nothing found, so return None to Caller
-            (None, None),
-        )
+        # check _this_ class, and then any subclasses; or return None to
+        # Caller if nothing found.
+
+        owner, item = cls.registry_index().get(name, (None, None))
 
         return item if not with_registry else (item, owner)
 
@@ -94,7 +129,8 @@ class _RegistryFactory(object):
             #       for now, return None
             return None
 
-        del reg_cls._registry[item.name]  # noqa
+        del reg_cls._registry[name]
+        _discard_indexes(reg_cls)
         return item
 
     @classmethod
@@ -117,11 +153,7 @@ class _RegistryFactory(object):
         if not subclasses:
             return set(cls._registry)
 
-        return {
-            name
-            for each_cls in (cls, *cls.registry_subclasses())
-            for name in each_cls._registry.keys()
-        }
+        return set(cls.registry_index())
 
     @classmethod
     def registry_items(cls, subclasses=False) -> Dict:
@@ -142,13 +174,7 @@ class _RegistryFactory(object):
         if not subclasses:
             return cls._registry
 
-        items = {
-            item
-            for each_cls in (cls, *cls.registry_subclasses())
-            for item in each_cls._registry.items()
-        }
-
-        return dict(items)
+        return {name: item for name, (_, item) in cls.registry_index().items()}
 
 
 class Registry(_RegistryFactory):
@@ -174,3 +200,4 @@ class Registry(_RegistryFactory):
             cls._registry[registry_name] = cls
 
         cls._registry = dict()
+        _discard_indexes(cls)
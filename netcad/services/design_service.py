@@ -11,6 +11,7 @@ from typing import Any, TYPE_CHECKING
 # Public Imports
 # -----------------------------------------------------------------------------
 
+import igraph
 from rich.table import Table
 from rich.pretty import Pretty
 from rich.text import Text, Style
@@ -19,7 +20,7 @@ from rich.text import Text, Style
 # Private Imports
 # -----------------------------------------------------------------------------
 
-from netcad.checks import CheckResult
+from netcad.checks import CheckResult, CheckStatus
 
 from .service_report import DesignServiceReport
 
@@ -84,6 +85,24 @@ class DesignService:
 
         self.report: DesignServiceReport = None
 
+    def __getstate__(self):
+        # the failed list contains the analysis graph vertices, which cannot
+        # be pickled; so they are stored as the (graph, index) of each vertex.
+
+        state = self.__dict__.copy()
+        state["failed"] = [
+            (item.graph, item.index) if isinstance(item, igraph.Vertex) else item
+            for item in self.failed
+        ]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.failed = [
+            item[0].vs[item[1]] if isinstance(item, tuple) else item
+            for item in self.failed
+        ]
+
     def build(self, ai: "ServicesAnalyzer"):
         # add a root level service node to th graph.  This will be used for
         # root level analysis later.  Init the status to PASS.  It could be
@@ -128,7 +147,7 @@ class DesignService:
         )
 
         for check in sorted(self.failed, key=lambda i: i.device):
-            fail_logs = [log for log in check.logs.root if log[0] == "FAIL"]
+            fail_logs = check.logs.expand(CheckStatus.FAIL)
             device = check.device
             check_id = check.check_id
             table.add_row(device, check.check.check_type, check_id, Pretty(fail_logs))
@@ -148,7 +167,7 @@ class DesignService:
             title_justify="left",
         )
 
-        for log in check.logs.root:
+        for log in check.logs.expand():
             match log[0]:
                 case "PASS":
                     color = green
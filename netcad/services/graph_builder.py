@@ -0,0 +1,142 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Any, Dict, List, Tuple
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import igraph
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .services_typedefs import NodeObjIDMapT
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["GraphBuilder"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class GraphBuilder:
+    """
+    The GraphBuilder stages the vertices and edges that are added to an igraph
+    graph, and then adds them with one `add_vertices` and one `add_edges` call
+    when `commit` is called.  Adding the vertices and edges one at a time is
+    slow for large graphs since igraph reallocates the attribute storage on
+    each call.
+
+    The staged vertices are assigned their graph index when they are added, so
+    that edges can be staged between them.  The graph vertex for each object is
+    added to the nodes map when the vertices are committed.
+
+    Attributes
+    ----------
+    graph: igraph.Graph
+        The graph that is built.
+
+    nodes_map: NodeObjIDMapT
+        The mapping of object to graph vertex for all the committed vertices.
+    """
+
+    def __init__(self, graph: igraph.Graph, nodes_map: NodeObjIDMapT):
+        self.graph = graph
+        self.nodes_map = nodes_map
+
+        # staged vertices; key=object, value=vertex index
+        self._vertices: Dict[Any, int] = dict()
+        self._vertex_count = 0
+        self._vertex_attrs: Dict[str, List] = dict()
+
+        # staged edges; (source-index, target-index)
+        self._edges: List[Tuple[int, int]] = list()
+        self._edge_attrs: Dict[str, List] = dict()
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._vertices or obj in self.nodes_map
+
+    def index(self, obj) -> int:
+        """
+        Returns the graph index of the vertex for the given object, which is
+        either staged or committed.
+        """
+        if (index := self._vertices.get(obj)) is not None:
+            return index
+
+        return self.nodes_map[obj].index
+
+    def add_vertex(self, obj, **attrs) -> int:
+        """
+        Stages a new vertex for the given object and returns its graph index.
+        """
+        index = self.graph.vcount() + self._vertex_count
+        self._vertices[obj] = index
+        _append_row(self._vertex_attrs, self._vertex_count, attrs)
+        self._vertex_count += 1
+        return index
+
+    def add_edge(self, source, target, **attrs):
+        """
+        Stages a new edge between the vertices of the given objects.
+        """
+        _append_row(self._edge_attrs, len(self._edges), attrs)
+        self._edges.append((self.index(source), self.index(target)))
+
+    def commit(self):
+        """
+        Adds the staged vertices and edges to the graph, and the new vertices
+        to the nodes map.
+        """
+        if self._vertex_count:
+            self.graph.add_vertices(self._vertex_count, attributes=self._vertex_attrs)
+            vs = self.graph.vs
+            self.nodes_map.update(
+                (obj, vs[index]) for obj, index in self._vertices.items()
+            )
+
+        if self._edges:
+            self.graph.add_edges(self._edges, attributes=self._edge_attrs)
+
+        self._vertices = dict()
+        self._vertex_count = 0
+        self._vertex_attrs = dict()
+        self._edges = list()
+        self._edge_attrs = dict()
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _append_row(columns: Dict[str, List], row: int, attrs: dict):
+    """
+    Appends the attribute values to the attribute columns, the columns that
+    are not in the attributes are given None, as igraph does for attributes
+    that are not set.
+    """
+    for key, value in attrs.items():
+        if (column := columns.get(key)) is None:
+            column = columns[key] = [None] * row
+        column.append(value)
+
+    if len(attrs) != len(columns):
+        for column in columns.values():
+            if len(column) == row:
+                column.append(None)
@@ -5,22 +5,20 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Callable
-from operator import attrgetter
+from typing import Callable, Optional, Iterable
 from collections import deque, defaultdict
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
-from first import first
 import igraph
 
 # -----------------------------------------------------------------------------
 # Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["GraphQuery"]
+__all__ = ["GraphQuery", "GraphIndex"]
 
 # -----------------------------------------------------------------------------
 #
@@ -29,19 +27,178 @@ __all__ = ["GraphQuery"]
 # -----------------------------------------------------------------------------
 
 
+class GraphIndex:
+    """
+    The GraphIndex provides the precomputed lookups that are used by the
+    GraphQuery for the equality queries on the indexed edge and node
+    attributes:
+
+        * the adjacency of each node, split by the edge `kind` and `service`
+        * the nodes by `check_type`, `service`, and `status`
+
+    Each lookup is built on first use, and the lookups are rebuilt when nodes
+    or edges are added.  The lookups must be reset, see `reset`, when nodes or
+    edges are deleted; since the graph size alone does not show that the
+    graph was changed.  The node lookups must be invalidated, see
+    `invalidate`, when the indexed node attribute values are changed; for
+    example the node status.
+    """
+
+    EDGE_KEYS = frozenset(("kind", "service"))
+    NODE_KEYS = frozenset(("check_type", "service", "status"))
+
+    def __init__(self, graph: igraph.Graph):
+        self.graph = graph
+        self._size = (0, 0)
+        self._adjacency = dict()
+        self._nodes = dict()
+
+    def invalidate(self):
+        """
+        Removes the node lookups so that they are rebuilt on next use.
+        """
+        self._nodes.clear()
+
+    def reset(self):
+        """
+        Removes all of the lookups so that they are rebuilt on next use.
+        """
+        self._size = (0, 0)
+        self._adjacency.clear()
+        self._nodes.clear()
+
+    def neighbors(
+        self, node_ids: Iterable[int], mode: str, query: dict
+    ) -> Optional[list[int]]:
+        """
+        Returns the list of nodes connected to the given nodes by the edges,
+        in the given mode ("out" or "in"), that match the query; or None when
+        the query does not use only the indexed edge attributes.
+        """
+        if not query.keys() <= self.EDGE_KEYS:
+            return None
+
+        keys = tuple(sorted(query))
+        adjacency = self._get_adjacency(mode, keys)
+        values = tuple(query[key] for key in keys)
+
+        return [
+            neighbor
+            for node_id in node_ids
+            for neighbor in adjacency.get((node_id, values), ())
+        ]
+
+    def incident(self, node_ids: Iterable[int], mode: str) -> list[int]:
+        """
+        Returns the list of edges of the given nodes in the given mode.
+        """
+        incidence = self._get_adjacency(mode, keys=None)
+        return [edge_id for node_id in node_ids for edge_id in incidence[node_id]]
+
+    def nodes(self, query: dict) -> Optional[list[int]]:
+        """
+        Returns the list of nodes that match the query; or None when the query
+        does not use only the indexed node attributes.
+        """
+        if not query.keys() <= self.NODE_KEYS:
+            return None
+
+        self._check_size()
+        keys = tuple(sorted(query))
+
+        if (lookup := self._nodes.get(keys)) is None:
+            lookup = self._nodes[keys] = defaultdict(list)
+            columns = [self._vertex_column(key) for key in keys]
+            for node_id, values in enumerate(zip(*columns)):
+                lookup[values].append(node_id)
+
+        return lookup.get(tuple(query[key] for key in keys), [])
+
+    # -------------------------------------------------------------------------
+    #
+    #                             Private Methods
+    #
+    # -------------------------------------------------------------------------
+
+    def _check_size(self):
+        if (size := (self.graph.vcount(), self.graph.ecount())) != self._size:
+            self._size = size
+            self._adjacency.clear()
+            self._nodes.clear()
+
+    def _get_adjacency(self, mode: str, keys: Optional[tuple]) -> dict:
+        """
+        Returns the adjacency of the nodes for the given mode, keyed by the
+        node and the values of the given edge attributes; or the incident edges
+        of each node when keys is None.
+        """
+        self._check_size()
+
+        if (adjacency := self._adjacency.get((mode, keys))) is not None:
+            return adjacency
+
+        graph = self.graph
+        end = 1 if mode == "out" else 0
+        edge_list = graph.get_edgelist()
+        node_ends = [edge[1 - end] for edge in edge_list]
+        neighbor_ends = [edge[end] for edge in edge_list]
+        edge_values = list(zip(*map(self._edge_column, keys))) if keys else None
+
+        adjacency = self._adjacency[(mode, keys)] = defaultdict(list)
+
+        # igraph orders the incident edges of a node by the neighbor node, and
+        # then by the most recently added edge.  The same order is used so that
+        # the indexed queries produce the same results as the graph queries.
+
+        edge_ids = sorted(
+            range(len(edge_list) - 1, -1, -1), key=neighbor_ends.__getitem__
+        )
+
+        if keys is None:
+            for edge_id in edge_ids:
+                adjacency[node_ends[edge_id]].append(edge_id)
+
+        else:
+            for edge_id in edge_ids:
+                values = edge_values[edge_id] if edge_values else ()
+                adjacency[node_ends[edge_id], values].append(neighbor_ends[edge_id])
+
+        return adjacency
+
+    def _edge_column(self, key: str) -> list:
+        if key in self.graph.es.attribute_names():
+            return self.graph.es[key]
+        return [None] * self.graph.ecount()
+
+    def _vertex_column(self, key: str) -> list:
+        if key in self.graph.vs.attribute_names():
+            return self.graph.vs[key]
+        return [None] * self.graph.vcount()
+
+
 class GraphQuery:
     """
     A class to query an igraph graph using a very simplified gremlin inspired
     syntax.
-    """
 
-    target_vertex = attrgetter("target_vertex")
-    source_vertex = attrgetter("source_vertex")
-    index = attrgetter("index")
+    When a GraphIndex is given, the queries that use only the indexed
+    attributes are answered from the index; otherwise each step queries the
+    graph for the current set of nodes at once.
+    """
 
-    def __init__(self, graph):
+    def __init__(self, graph: igraph.Graph, graph_index: Optional[GraphIndex] = None):
         self.graph = graph
-        self.nodes: deque[igraph.Vertex] = deque()
+        self.graph_index = graph_index
+        self.node_ids: list[int] = list()
+
+    @property
+    def nodes(self) -> deque[igraph.Vertex]:
+        vs = self.graph.vs
+        return deque(vs[node_id] for node_id in self.node_ids)
+
+    @nodes.setter
+    def nodes(self, nodes: Iterable[igraph.Vertex]):
+        self.node_ids = [node.index for node in nodes]
 
     def groupby(self, key: Callable):
         pf = defaultdict(list)
@@ -51,28 +208,14 @@ class GraphQuery:
 
     def first(self) -> igraph.Vertex | None:
         """returns the first node in the current set of nodes, or None"""
-        return first(self.nodes)
+        return self.graph.vs[self.node_ids[0]] if self.node_ids else None
 
     def out_(self, **query) -> "GraphQuery":
         """
         Query the current set of graph nodes that are connected to the current
         nodes by an outgoing edge that matches the query.
         """
-        found_nodes = deque()
-        while True:
-            try:
-                node = self.nodes.popleft()
-            except IndexError:
-                break
-
-            found_nodes.extend(
-                map(
-                    self.target_vertex,
-                    self.graph.es.select(map(self.index, node.out_edges()), **query),
-                )
-            )
-
-        self.nodes = found_nodes
+        self.node_ids = self._neighbors("out", query)
         return self
 
     def in_(self, **query) -> "GraphQuery":
@@ -80,39 +223,62 @@ class GraphQuery:
         Query the current set of graph nodes that are connected to the current
         nodes by an incoming edge that matches the query.
         """
-        found_nodes = deque()
-        while True:
-            try:
-                node = self.nodes.popleft()
-            except IndexError:
-                break
-
-            found_nodes.extend(
-                map(
-                    self.source_vertex,
-                    self.graph.es.select(map(self.index, node.in_edges()), **query),
-                )
-            )
-
-        self.nodes = found_nodes
+        self.node_ids = self._neighbors("in", query)
         return self
 
     def node(self, **query) -> "GraphQuery":
         """
         Query the current set of nodes that match the query.
         """
-        self.nodes = deque(self.graph.vs.select(map(self.index, self.nodes), **query))
+        self.node_ids = [
+            node.index for node in self.graph.vs.select(self.node_ids, **query)
+        ]
+        return self
+
+    def select(self, **query) -> "GraphQuery":
+        """
+        Set the current nodes to all of the graph nodes that match the query.
+        """
+        if self.graph_index and (node_ids := self.graph_index.nodes(query)) is not None:
+            self.node_ids = list(node_ids)
+        else:
+            self.node_ids = [node.index for node in self.graph.vs.select(**query)]
+
         return self
 
     def __call__(self, *start_nodes: igraph.Vertex):
         """
         Set the starting nodes for the query.
         """
-        self.nodes = deque(start_nodes)
+        self.nodes = start_nodes
         return self
 
     def __len__(self):
         """
         Get the number of nodes in the current set of nodes.
         """
-        return len(self.nodes)
+        return len(self.node_ids)
+
+    # -------------------------------------------------------------------------
+    #
+    #                             Private Methods
+    #
+    # -------------------------------------------------------------------------
+
+    def _neighbors(self, mode: str, query: dict) -> list[int]:
+        if self.graph_index:
+            if (
+                node_ids := self.graph_index.neighbors(self.node_ids, mode, query)
+            ) is not None:
+                return node_ids
+
+            edge_ids = self.graph_index.incident(self.node_ids, mode)
+        else:
+            edge_ids = [
+                edge_id
+                for node_id in self.node_ids
+                for edge_id in self.graph.incident(node_id, mode=mode)
+            ]
+
+        end = "target" if mode == "out" else "source"
+        return [getattr(edge, end) for edge in self.graph.es.select(edge_ids, **query)]
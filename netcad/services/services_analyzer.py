@@ -5,10 +5,12 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import TYPE_CHECKING, Iterator
-from collections import defaultdict, deque
-import json
+from typing import TYPE_CHECKING, Iterator, Optional, Iterable
+from collections import defaultdict, deque, Counter
+from itertools import chain
+from functools import partial
 from pathlib import Path
+import json
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -23,19 +25,39 @@ from rich.console import Console
 # -----------------------------------------------------------------------------
 
 from ..config import netcad_globals
-from ..checks import CheckCollectionT, CheckResult, CheckStatus
+from ..checks import CheckCollectionT, CheckResult, CheckStatus, LazyCheckResult
+from ..checks.check_results_file import results_filepath, iter_results_file
+from ..checks.check_results_db import CheckResultsDB
 
 if TYPE_CHECKING:
     from netcad.device import Device
     from netcad.design import Design, DesignFeature
 
 from .design_service import DesignService
+from .graph_builder import GraphBuilder
+from .graph_query import GraphQuery, GraphIndex
 from .services_typedefs import ResultMapT, NodeObjIDMapT
 
 
 class ServicesAnalyzer:
-    def __init__(self, design: "Design"):
+    """
+    The ServicesAnalyzer builds the analysis graph of the design services and
+    the check results, and rolls-up the service pass/fail status.
+
+    Parameters
+    ----------
+    design:
+        The design whose services are analyzed.
+
+    lazy_results: optional
+        When True, the check results are not parsed when loaded; the result
+        nodes are given LazyCheckResult objects that parse the CheckResult
+        only when it is used by a service report.
+    """
+
+    def __init__(self, design: "Design", lazy_results: bool = False):
         self.design = design
+        self.lazy_results = lazy_results
 
         # initalize the top level status to pass.  Could be set to FAIL if any
         # managed service status is "FAIL".
@@ -69,13 +91,61 @@ class ServicesAnalyzer:
         # maps any object to a graph-node.
         self.nodes_map: NodeObjIDMapT = bidict()
 
+        # the nodes and edges are staged by the builder, and added to the
+        # graph at the end of each phase; see `commit`.
+        self.builder = GraphBuilder(self.graph, self.nodes_map)
+
+        # the indexes used by the service report queries, see `query`.
+        self.graph_index = GraphIndex(self.graph)
+
         # this queue is used for processing services; so that a service can
         # define a subservice within itself, and the subservice can be
         # processed after the parent service is processed.
         self.services_queue = deque()
 
+        # the results loaded for each (device-name, collection-name), so that
+        # the results can be replaced; see `reload_results`.
+        self.collection_results: dict[tuple[str, str], list[CheckResult]] = dict()
+
         # load all check results so they can be incorporated into the analysis graph.
         self._load_feature_results()
+        self.commit()
+
+    # -------------------------------------------------------------------------
+    # pickle support, see ServicesSnapshot
+    # -------------------------------------------------------------------------
+
+    def __getstate__(self):
+        # the graph vertices cannot be pickled, so the nodes map is stored as
+        # the vertex index of each object; and the builder and graph index are
+        # created again when unpickled.
+
+        state = self.__dict__.copy()
+        del state["builder"], state["graph_index"]
+
+        state["nodes_map"] = [
+            (obj, vertex.index) for obj, vertex in self.nodes_map.items()
+        ]
+
+        state["results_map"] = {
+            device: dict(check_types)
+            for device, check_types in self.results_map.items()
+        }
+        return state
+
+    def __setstate__(self, state: dict):
+        results_map = state.pop("results_map")
+        nodes_map = state.pop("nodes_map")
+        self.__dict__.update(state)
+
+        self.results_map = defaultdict(lambda: defaultdict(dict))
+        for device, check_types in results_map.items():
+            self.results_map[device].update(check_types)
+
+        vs = self.graph.vs
+        self.nodes_map = bidict((obj, vs[index]) for obj, index in nodes_map)
+        self.builder = GraphBuilder(self.graph, self.nodes_map)
+        self.graph_index = GraphIndex(self.graph)
 
     # -------------------------------------------------------------------------
     # node methods
@@ -94,10 +164,10 @@ class ServicesAnalyzer:
         True when the node was created
         False when the node already existed
         """
-        if self.nodes_map.get(obj):
+        if obj in self.builder:
             return False
 
-        self.nodes_map[obj] = self.graph.add_vertex(obj, **kwargs)
+        self.builder.add_vertex(obj, name=obj, **kwargs)
         return True
 
     def add_service_node(self, service: "DesignService"):
@@ -143,9 +213,7 @@ class ServicesAnalyzer:
     # -------------------------------------------------------------------------
 
     def add_edge(self, source, target, **kwargs):
-        self.graph.add_edge(
-            self.nodes_map[source].index, self.nodes_map[target].index, **kwargs
-        )
+        self.builder.add_edge(source, target, **kwargs)
 
     def add_design_edge(self, source, target, **kwargs):
         self.add_edge(source, target, kind="d", **kwargs)
@@ -162,6 +230,22 @@ class ServicesAnalyzer:
     #
     # -------------------------------------------------------------------------
 
+    def query(self, *start_nodes: igraph.Vertex) -> GraphQuery:
+        """
+        Returns a GraphQuery for the analysis graph, starting from the given
+        nodes, that uses the analyzer graph indexes.
+        """
+        return GraphQuery(self.graph, graph_index=self.graph_index)(*start_nodes)
+
+    def commit(self):
+        """
+        Adds the nodes and edges that were added since the last commit to the
+        analysis graph, and to the nodes_map.  This function is called at the
+        end of each analyzer phase; a service that needs to query the graph
+        for the nodes it added in the same phase must call it first.
+        """
+        self.builder.commit()
+
     def build(self):
         """
         This function is responsible for producing the services results graphs
@@ -175,11 +259,218 @@ class ServicesAnalyzer:
                 break
             svc.build(ai=self)
 
+        self.commit()
+
     async def check(self):
         for svc in self.design.services.values():
-            await svc.check(ai=self)
+            await self._check_service(svc)
             self.analyze(svc)
 
+    async def _check_service(self, svc: "DesignService"):
+        """
+        Executes the service checks, and marks the nodes and edges that are
+        added by the service checks with the "check_service" attribute, so
+        that they can be removed when the service is checked again; see
+        `reload_results`.
+        """
+        graph = self.graph
+        v_start, e_start = graph.vcount(), graph.ecount()
+
+        await svc.check(ai=self)
+        self.commit()
+
+        for seq, start, count in (
+            (graph.vs, v_start, graph.vcount()),
+            (graph.es, e_start, graph.ecount()),
+        ):
+            if "check_service" not in seq.attribute_names():
+                seq["check_service"] = None
+            seq.select(range(start, count))["check_service"] = svc.name
+
+    async def reload_results(self, changed: Iterable[tuple[str, str]]) -> bool:
+        """
+        Replaces the check results of the given (device-name, collection-name)
+        with the results that are currently stored, for example when the
+        checks of a few devices were executed again, and checks and analyzes
+        again the services whose subgraphs contain the replaced results.
+
+        The new results are given the graph nodes, and so the edges, of the
+        existing results with the same check-type and check-id.  The services
+        are not built again.  The nodes added by the checks of the affected
+        services are removed and the service checks are executed again, since
+        the service checks use the results.  The counts of the nodes in the
+        affected services subgraphs are reset, and then the services are
+        checked and rolled-up in the same service order as `check`; so that
+        the outcome is the same as analyzing the new results from the start.
+
+        Returns
+        -------
+        True when the results were replaced.  False when the new results are
+        not for the same checks as the existing results, that is the graph
+        would change, or the service check nodes are not marked, in which case
+        this analyzer must not be used and a new analyzer built.
+        """
+        if self.design.services and (
+            "check_service" not in self.graph.vs.attribute_names()
+        ):
+            return False
+
+        devices = {device.name: device for device in self.devices}
+        collections = {
+            check_type.get_name(): check_type
+            for feat in self.design.features.values()
+            for check_type in feat.check_collections
+        }
+        checks_dir = netcad_globals.g_netcad_checks_dir
+        replace = list()
+
+        # load all of the new results before changing the graph, so that the
+        # analyzer is not changed when False is returned.
+
+        for dev_name, check_name in changed:
+            device = devices.get(dev_name)
+            check_type = collections.get(check_name)
+            if not (device and check_type):
+                continue
+
+            results_db = CheckResultsDB.open_existing(checks_dir, device.design.name)
+            loaded = self._load_check_type_db_results(
+                results_db,
+                results_db.stored() if results_db else set(),
+                devices={dev_name: device},
+                check_type=check_type,
+            )
+
+            new_results = sorted(loaded[0][1] if loaded else [], key=_result_key)
+            old_results = sorted(
+                self.collection_results.get((dev_name, check_name), []),
+                key=_result_key,
+            )
+
+            if list(map(_result_key, new_results)) != list(
+                map(_result_key, old_results)
+            ):
+                return False
+
+            replace.append((device, check_name, old_results, new_results))
+
+        # give each new result the node of the existing result.
+
+        changed_nodes = set()
+        new_nodes = list()
+
+        for device, check_name, old_results, new_results in replace:
+            self.collection_results[(device.name, check_name)] = new_results
+
+            for old_obj, new_obj in zip(old_results, new_results):
+                node = self.nodes_map.pop(old_obj)
+                self.nodes_map[new_obj] = node
+                node["status"] = str(new_obj.status)
+                changed_nodes.add(node.index)
+                new_nodes.append(new_obj)
+
+                check_ids = self.results_map[device][_result_check_type(new_obj)]
+                if check_ids.get(new_obj.check_id) is old_obj:
+                    check_ids[new_obj.check_id] = new_obj
+
+        if not changed_nodes:
+            return True
+
+        # find the services that contain the changed nodes, and the services
+        # that share nodes with those services, since the node counts include
+        # the roll-up of each service that contains the node.
+
+        subgraphs = {
+            svc: set(self._walk_service_node(svc, self.nodes_map[svc])[1])
+            for svc in self.design.services.values()
+        }
+
+        affected = set()
+        reset_nodes = changed_nodes
+
+        while more := [
+            svc
+            for svc, svc_nodes in subgraphs.items()
+            if svc not in affected and not reset_nodes.isdisjoint(svc_nodes)
+        ]:
+            affected.update(more)
+            reset_nodes = reset_nodes.union(*map(subgraphs.get, more))
+
+        # remove the nodes of the affected services checks, so that the
+        # service checks are executed again; and then reset the node counts
+        # to those given when the nodes were added, the result nodes count the
+        # result and all others are zero.
+
+        self._remove_service_checks({svc.name for svc in affected})
+
+        reset_nodes = {node.index for node in map(self.nodes_map.get, new_nodes)}
+        reset_nodes.update(
+            *(self._walk_service_node(svc, self.nodes_map[svc])[1] for svc in affected)
+        )
+        nodes = self.graph.vs.select(sorted(reset_nodes))
+        counts = [
+            (int(status == "PASS"), int(status != "PASS")) if feature else (0, 0)
+            for feature, status in zip(nodes["feature"], nodes["status"])
+        ]
+        nodes["pass_count"] = [pass_c for pass_c, _ in counts]
+        nodes["fail_count"] = [fail_c for _, fail_c in counts]
+
+        for svc in self.design.services.values():
+            if svc in affected:
+                svc.status = "PASS"
+                svc.failed.clear()
+                self.nodes_map[svc]["status"] = "PASS"
+                await self._check_service(svc)
+                self.analyze(svc)
+
+        self.graph_index.invalidate()
+        return True
+
+    def _remove_service_checks(self, svc_names: set[str]):
+        """
+        Removes the nodes and edges that were added by the checks of the named
+        services, see `_check_service`.  The graph vertices are renumbered, so
+        the nodes map and the failed lists of the services are updated.
+        """
+        graph = self.graph
+
+        if "check_service" not in graph.vs.attribute_names():
+            return
+
+        graph.delete_edges(graph.es.select(check_service_in=svc_names))
+        self.graph_index.reset()
+
+        if not (del_vids := set(graph.vs.select(check_service_in=svc_names).indices)):
+            return
+
+        kept = [vid for vid in range(graph.vcount()) if vid not in del_vids]
+        new_index = dict(zip(kept, range(len(kept))))
+
+        nodes = [
+            (obj, new_index[vertex.index])
+            for obj, vertex in self.nodes_map.items()
+            if vertex.index in new_index
+        ]
+        failed = {
+            svc: [
+                new_index[vertex.index]
+                for vertex in svc.failed
+                if vertex.index in new_index
+            ]
+            for svc in self.design.services.values()
+        }
+
+        graph.delete_vertices(del_vids)
+        vs = graph.vs
+
+        self.nodes_map.clear()
+        self.nodes_map.update((obj, vs[index]) for obj, index in nodes)
+
+        for svc, indexes in failed.items():
+            svc.failed = [vs[index] for index in indexes]
+
+        self.graph_index.reset()
+
     def build_reports(self, flags):
         for svc in self.design.services.values():
             svc.build_report(ai=self, flags=flags)
@@ -205,30 +496,180 @@ class ServicesAnalyzer:
         if node["fail_count"]:
             node["status"] = "FAIL"
             svc.status = "FAIL"
+            self.graph_index.invalidate()
 
     def _analyze_service_node(self, svc: "DesignService", start_node: igraph.Vertex):
-        edges = [
-            edge
-            for edge in start_node.out_edges()
-            if edge["service"] == svc.name and not edge["stop"]
-        ]
-        targets = [edge.target_vertex for edge in edges]
+        """
+        Rolls up the pass/fail counts of the nodes in the service subgraph,
+        that is the nodes reachable from the start node by the service edges
+        that are not "stop" edges, so that each node count includes the counts
+        of the distinct nodes below it.  A node that is reached by more than
+        one path, for example a check result that is shared by two design
+        nodes, is counted once.  The nodes are processed bottom-up, in a
+        topological order, so that each node count is computed once.  The
+        failed check nodes are added to the service failed list, once each,
+        in the depth-first order that they are first reached from the start
+        node.
+        """
+        graph = self.graph
+        start_id = start_node.index
+        targets, order = self._walk_service_node(svc, start_node)
+
+        # ---------------------------------------------------------------------
+        # roll-up the counts, bottom-up, and store them back into the graph.
+        # The nodes below a node that has no shared nodes below it form a tree,
+        # so the node count is the sum of its target counts.  Otherwise the
+        # node count is the sum over the distinct set of nodes below it; where
+        # a tree node stands in for the nodes below it.
+        # ---------------------------------------------------------------------
+
+        nodes = graph.vs.select(order)
+        own_counts = {
+            vid: (pass_count, fail_count)
+            for vid, pass_count, fail_count in zip(
+                order, nodes["pass_count"], nodes["fail_count"]
+            )
+        }
+        counts = dict()
+
+        n_parents = Counter(chain.from_iterable(targets.values()))
+        shared = {vid for vid, count in n_parents.items() if count > 1}
+        below: dict[int, set[int]] = dict()
 
-        for target in targets:
-            if target["check_id"] and target["status"] == "FAIL":
-                svc.failed.append(target)
+        for vid in order:
+            vid_targets = targets[vid]
 
-            self._analyze_service_node(svc, target)
+            if any(t in shared or t in below for t in vid_targets):
+                reached = below[vid] = set(vid_targets)
+                for target in vid_targets:
+                    reached.update(below.get(target, ()))
+
+                sum_counts = [
+                    own_counts[t] if t in below else counts[t] for t in reached
+                ]
+            else:
+                sum_counts = [counts[t] for t in vid_targets]
 
             try:
-                start_node["pass_count"] += target["pass_count"]
-                start_node["fail_count"] += target["fail_count"]
+                counts[vid] = (
+                    sum((n_pass for n_pass, _ in sum_counts), own_counts[vid][0]),
+                    sum((n_fail for _, n_fail in sum_counts), own_counts[vid][1]),
+                )
 
             except TypeError:
+                bad_vid = next(t for t in (vid, *vid_targets) if None in own_counts[t])
                 raise ValueError(
-                    f"Analyzer failed due to missing counters in node: {target.attributes()}"
+                    f"Analyzer failed due to missing counters in node: {graph.vs[bad_vid].attributes()}"
                 )
 
+        nodes["pass_count"] = [counts[vid][0] for vid in order]
+        nodes["fail_count"] = [counts[vid][1] for vid in order]
+
+        # ---------------------------------------------------------------------
+        # find the failed checks in depth-first order, only descending into
+        # the nodes that have failed checks below them.
+        # ---------------------------------------------------------------------
+
+        if "check_id" not in graph.vs.attribute_names():
+            return
+
+        failed = {
+            vid
+            for vid, check_id, status in zip(order, nodes["check_id"], nodes["status"])
+            if check_id and status == "FAIL"
+        }
+
+        has_failed = set()
+        for vid in order:
+            if any(t in failed or t in has_failed for t in targets[vid]):
+                has_failed.add(vid)
+
+        if start_id not in has_failed:
+            return
+
+        visited = {start_id}
+        stack = [iter(targets[start_id])]
+        while stack:
+            for target in stack[-1]:
+                if target in visited:
+                    continue
+                visited.add(target)
+                if target in failed:
+                    svc.failed.append(graph.vs[target])
+                if target in has_failed:
+                    stack.append(iter(targets[target]))
+                    break
+            else:
+                stack.pop()
+
+    def _walk_service_node(
+        self, svc: "DesignService", start_node: igraph.Vertex
+    ) -> tuple[dict[int, list[int]], list[int]]:
+        """
+        Walks the service subgraph, that is the nodes reachable from the start
+        node by the service edges that are not "stop" edges.
+
+        Returns
+        -------
+        The target nodes of each node in the subgraph, and the nodes in
+        post-order; which is a topological order with the targets before their
+        source.
+
+        Raises
+        ------
+        ValueError
+            When there is a cycle in the service subgraph.
+        """
+        graph = self.graph
+        edge_list = graph.get_edgelist()
+        edge_service = graph.es["service"]
+        edge_stop = (
+            graph.es["stop"]
+            if "stop" in graph.es.attribute_names()
+            else [None] * len(edge_list)
+        )
+
+        def svc_targets(vid: int) -> list[int]:
+            return [
+                edge_list[eid][1]
+                for eid in graph.incident(vid, mode="out")
+                if edge_service[eid] == svc.name and not edge_stop[eid]
+            ]
+
+        # ---------------------------------------------------------------------
+        # walk the service subgraph to find the target nodes of each node, and
+        # the nodes in post-order; which is a topological order with the
+        # targets before their source.
+        # ---------------------------------------------------------------------
+
+        start_id = start_node.index
+        targets = {start_id: svc_targets(start_id)}
+        order = list()
+        walking = {start_id}
+        stack = [(start_id, iter(targets[start_id]))]
+
+        while stack:
+            vid, next_targets = stack[-1]
+
+            for target in next_targets:
+                if target in walking:
+                    raise ValueError(
+                        f"Analyzer failed due to a cycle in service {svc.name} at node: "
+                        f"{graph.vs[target].attributes()}"
+                    )
+
+                if target not in targets:
+                    targets[target] = svc_targets(target)
+                    walking.add(target)
+                    stack.append((target, iter(targets[target])))
+                    break
+            else:
+                stack.pop()
+                walking.discard(vid)
+                order.append(vid)
+
+        return targets, order
+
     def service_graph(self, svc: "DesignService") -> Iterator[DesignService]:
         """
         This function returns the set of service nodes that are associated with the given service.
@@ -267,39 +708,131 @@ class ServicesAnalyzer:
     # -------------------------------------------------------------------------
 
     def _load_feature_results(self):
+        # the results of each device are stored in the results database of the
+        # design that the device belongs to, which is not the same as this
+        # design when this design is a group of designs.
+
+        devices_by_design = defaultdict(dict)
+        for device in self.devices:
+            devices_by_design[device.design.name][device.name] = device
+
+        checks_dir = netcad_globals.g_netcad_checks_dir
+
+        results_dbs = {
+            design_name: CheckResultsDB.open_existing(checks_dir, design_name)
+            for design_name in devices_by_design
+        }
+        stored_by_design = {
+            design_name: results_db.stored() if results_db else set()
+            for design_name, results_db in results_dbs.items()
+        }
+
         for feat in self.design.features.values():
             for check_type in feat.check_collections:
-                for device in self.devices:
-                    result_objs = self._load_check_type_results(device, check_type)
-                    self._add_result_nodes(device, feature=feat, results=result_objs)
+                check_name = check_type.get_name()
+                for design_name, devices in devices_by_design.items():
+                    for device, results in self._load_check_type_db_results(
+                        results_dbs[design_name],
+                        stored_by_design[design_name],
+                        devices=devices,
+                        check_type=check_type,
+                    ):
+                        self._add_result_nodes(device, feature=feat, results=results)
+                        self.collection_results[(device.name, check_name)] = results
+
+    def _load_check_type_db_results(
+        self,
+        results_db: Optional[CheckResultsDB],
+        stored: set[tuple[str, str]],
+        devices: dict[str, "Device"],
+        check_type: CheckCollectionT,
+    ) -> list[tuple["Device", list[CheckResult]]]:
+        """
+        Load the results for the given devices and check collection from the
+        design results database, with the status filtering done by the
+        database.  Devices that do not have results in the database have their
+        results loaded from the results files.
+
+        Returns
+        -------
+        The list of (device, results) for the devices that have results.
+        """
+        check_name = check_type.get_name()
+        db_devices = [
+            dev_name for dev_name in devices if (dev_name, check_name) in stored
+        ]
+        loaded = list()
+
+        if db_devices:
+            db_results = defaultdict(list)
+
+            for (
+                dev_name,
+                res_check_type,
+                check_id,
+                status,
+                payload,
+            ) in results_db.query_rows(
+                ("device", "check_type", "check_id", "status", "payload"),
+                devices=db_devices,
+                collections=[check_name],
+                statuses=("PASS", "FAIL"),
+            ):
+                db_results[dev_name].append(
+                    LazyCheckResult(
+                        check_type,
+                        payload,
+                        device=dev_name,
+                        check_type=res_check_type,
+                        check_id=check_id,
+                        status=status,
+                    )
+                    if self.lazy_results
+                    else check_type.parse_result(json.loads(payload))
+                )
+
+            loaded.extend(
+                (devices[dev_name], results) for dev_name, results in db_results.items()
+            )
+
+        for dev_name in devices.keys() - set(db_devices):
+            device = devices[dev_name]
+            loaded.append(
+                (device, list(self._load_check_type_results(device, check_type)))
+            )
+
+        return loaded
 
     def _load_check_type_results(
         self, device: "Device", check_type: CheckCollectionT
-    ) -> Iterator[dict]:
+    ) -> Iterator[CheckResult]:
         # if the check results file does not exist, then return an empty
         # iterator so the calling scope is AOK.
 
-        results_file = self._device_results_file(device, check_type)
-
-        if not results_file.exists():
+        if not (results_file := self._device_results_file(device, check_type)):
             return ()
 
         # TODO: for now only include the PASS/FAIL status results.  We should
         #       add the INFO nodes to the graph as there could be meaningful
         #       use of these nodes for report processing.
 
+        parse = (
+            partial(LazyCheckResult.from_dict, check_type)
+            if self.lazy_results
+            else check_type.parse_result
+        )
+
         return (
-            check_type.parse_result(res_obj)
-            for res_obj in json.load(results_file.open())
+            parse(res_obj)
+            for res_obj in iter_results_file(results_file)
             if res_obj["status"] in ("PASS", "FAIL")
         )
 
     def _add_result_nodes(
-        self, device: "Device", feature: "DesignFeature", results: Iterator[CheckResult]
+        self, device: "Device", feature: "DesignFeature", results: Iterable[CheckResult]
     ):
         for res_obj in results:
-            check = res_obj.check
-            check_type = check.check_type
+            check_type = _result_check_type(res_obj)
 
             # add the node to the design results-graph so features can
             # cross-functionally use them.
@@ -308,7 +841,8 @@ class ServicesAnalyzer:
             else:
                 counts = {"pass_count": 0, "fail_count": 1}
 
-            self.nodes_map[res_obj] = self.graph.add_vertex(
+            self.builder.add_vertex(
+                res_obj,
                 feature=feature.name,
                 check_type=check_type,
                 check_id=res_obj.check_id,
@@ -321,13 +855,29 @@ class ServicesAnalyzer:
             self.results_map[device][check_type][res_obj.check_id] = res_obj
 
     @staticmethod
-    def _device_results_file(device: "Device", check_type: CheckCollectionT) -> Path:
+    def _device_results_file(
+        device: "Device", check_type: CheckCollectionT
+    ) -> Optional[Path]:
         check_name = check_type.get_name()
         base_dir = netcad_globals.g_netcad_checks_dir
-        return (
-            base_dir
-            / device.design.name
-            / device.name
-            / "results"
-            / f"{check_name}.json"
+        return results_filepath(
+            base_dir / device.design.name / device.name / "results", check_name
         )
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _result_check_type(res_obj: CheckResult) -> str:
+    if isinstance(res_obj, LazyCheckResult):
+        return res_obj.check_type
+
+    return res_obj.check.check_type
+
+
+def _result_key(res_obj: CheckResult) -> tuple[str, str]:
+    return _result_check_type(res_obj), res_obj.check_id or ""
@@ -0,0 +1,283 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict, Tuple, Set
+from hashlib import sha256
+from pathlib import Path
+import asyncio
+import pickle
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.config import netcad_globals
+from netcad.init import netcad_import_package
+from netcad.logger import get_logger
+from netcad.checks.check_results_file import ResultsFormat
+from netcad.design.design_cache import (
+    DesignSnapshot,
+    RegistryMark,
+    RegistryEntries,
+    registry_mark,
+    registry_added,
+    module_files,
+    module_files_current,
+)
+
+from .services_analyzer import ServicesAnalyzer
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ServicesSnapshot", "ResultsManifest"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# key=(device-name, results-filename), value=(size, modified-time) of the
+# results file.  The key is the filename, rather than the collection name, so
+# that the results of a collection written in another format are a change.
+ResultsManifest = Dict[Tuple[str, str], Tuple[int, int]]
+
+
+class ServicesSnapshot:
+    """
+    The ServicesSnapshot is a cache of the built and checked ServicesAnalyzer,
+    that is the analysis graph with the rolled-up service status, so that the
+    `netcam services` commands do not need to load the check results and
+    rebuild the graph when nothing has changed.  The snapshot is stored in
+    the netcad cache directory as "services/<design-name>.pickle", rather than
+    with the check results that can be shared with other Users, since loading
+    a pickle file can execute arbitrary code.  The snapshot contains the
+    analyzer, its design, and the Registry items that were added while the
+    design was loaded.
+
+    The snapshot is keyed by the design snapshot keys, see DesignSnapshot, of
+    the design (or each group member design), the checks directory, and the
+    analyzer `lazy_results` option.  The snapshot also records the module
+    files used by the design, in the same manner as the DesignSnapshot.  A
+    snapshot with a different key, or a changed module file, is not used and
+    is replaced once the analyzer is rebuilt.
+
+    The snapshot also stores the manifest of the results files, that is the
+    size and modified time of the results file of each device and check
+    collection.  When only some of the results files have changed, for example
+    the checks were executed again for a few devices, the analyzer reloads
+    just those results and re-analyzes the affected services; see
+    `ServicesAnalyzer.reload_results`.  The updated analyzer is then saved.
+
+    The snapshot cache is only used when the design snapshot cache is enabled,
+    see DesignSnapshot, and is not used when the design cannot be pickled.
+    """
+
+    def __init__(self, design_name: str, lazy_results: bool = False):
+        self.design_name = design_name
+        self.key = self._make_key(design_name, lazy_results)
+        self.manifest = _results_manifest(design_name)
+        self.filepath = (
+            netcad_globals.g_netcad_cache_dir / "services" / f"{design_name}.pickle"
+        )
+
+        # the results that changed since the snapshot was saved, and so were
+        # reloaded by `load`.
+        self.changed: Set[Tuple[str, str]] = set()
+
+        self._registry_mark: RegistryMark = dict()
+        self._registry_entries: Optional[RegistryEntries] = None
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return DesignSnapshot.enabled() and bool(netcad_globals.g_netcad_checks_dir)
+
+    def load(self) -> Optional[ServicesAnalyzer]:
+        """
+        Returns the analyzer from the snapshot, and adds the snapshot Registry
+        items, when the snapshot key matches; otherwise returns None.  The
+        results that have changed since the snapshot was saved are reloaded;
+        None is returned if the changed results require the analyzer to be
+        built again.
+        """
+        if not (self.key and self.filepath.exists()):
+            return None
+
+        log = get_logger()
+
+        try:
+            with self.filepath.open("rb") as ifile:
+                # the key and the module files are stored first so that the
+                # analyzer is only unpickled when the snapshot is current.
+
+                if pickle.load(ifile) != self.key:
+                    return None
+
+                if not module_files_current(pickle.load(ifile)):
+                    return None
+
+                manifest = pickle.load(ifile)
+                ai, registry_entries = pickle.load(ifile)
+
+        except Exception as exc:
+            log.debug(f"Services {self.design_name}: unable to load snapshot: {exc}")
+            return None
+
+        for reg_cls, name, obj in registry_entries:
+            reg_cls.registry_add(name, obj)
+
+        for design in _analyzer_designs(ai):
+            if pkg_name := netcad_globals.g_netcad_designs[design.name].get("package"):
+                design.module = netcad_import_package(pkg_name)
+
+        self._registry_entries = registry_entries
+
+        self.changed = {
+            (dev_name, Path(filename).stem)
+            for dev_name, filename in manifest.keys() | self.manifest.keys()
+            if manifest.get((dev_name, filename))
+            != self.manifest.get((dev_name, filename))
+        }
+
+        if self.changed and not asyncio.run(ai.reload_results(self.changed)):
+            log.debug(f"Services {self.design_name}: snapshot results changed")
+            return None
+
+        log.debug(
+            f"Services {self.design_name}: loaded from snapshot, "
+            f"{len(self.changed)} results reloaded"
+        )
+        return ai
+
+    def mark(self):
+        """
+        Marks the Registry contents before the design is loaded so that `save`
+        can determine the items that were added by the design.
+        """
+        self._registry_mark = registry_mark()
+        self._registry_entries = None
+
+    def save(self, ai: ServicesAnalyzer):
+        """
+        Stores the analyzer and the Registry items added since `mark` was
+        called, or those loaded from the snapshot.
+        """
+        if not self.key:
+            return
+
+        log = get_logger()
+
+        # the design modules are not pickled; they are imported again when the
+        # snapshot is loaded.
+
+        designs = _analyzer_designs(ai)
+        modules = [design.module for design in designs]
+
+        try:
+            for design in designs:
+                design.module = None
+
+            if (registry_entries := self._registry_entries) is None:
+                registry_entries = registry_added(self._registry_mark)
+
+            data = pickle.dumps(
+                (ai, registry_entries), protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        except Exception as exc:
+            self.filepath.unlink(missing_ok=True)
+            log.debug(f"Services {self.design_name}: unable to save snapshot: {exc}")
+            return
+
+        finally:
+            for design, module in zip(designs, modules):
+                design.module = module
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self.filepath.with_suffix(".tmp")
+
+        with tmp_filepath.open("wb") as ofile:
+            pickle.dump(self.key, ofile, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(module_files(), ofile, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.manifest, ofile, protocol=pickle.HIGHEST_PROTOCOL)
+            ofile.write(data)
+
+        os.replace(tmp_filepath, self.filepath)
+
+    # -------------------------------------------------------------------------
+    #
+    #                             Private Methods
+    #
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _make_key(design_name: str, lazy_results: bool) -> Optional[str]:
+        designs = netcad_globals.g_netcad_designs
+        design_decl = designs.get(design_name, {})
+        hasher = sha256(design_name.encode())
+        hasher.update(str(netcad_globals.g_netcad_checks_dir.absolute()).encode())
+        hasher.update(f"lazy_results={lazy_results}".encode())
+
+        for member_name in design_decl.get("group") or [design_name]:
+            member_decl = designs.get(member_name, {})
+            if not (pkg_name := member_decl.get("package")):
+                return None
+
+            design_key = DesignSnapshot(member_name, pkg_name, member_decl).key
+            if not design_key:
+                return None
+
+            hasher.update(design_key.encode())
+
+        return hasher.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _analyzer_designs(ai: ServicesAnalyzer) -> list:
+    """
+    Returns the design of the analyzer, and when it is a group the designs of
+    the group member devices.
+    """
+    return list(
+        dict.fromkeys(
+            (ai.design, *(device.design for device in ai.design.devices.values()))
+        )
+    )
+
+
+def _results_manifest(design_name: str) -> ResultsManifest:
+    """
+    Returns the manifest of the results files of the design, or of each group
+    member design.  The results database is not included since it is written
+    along with the results files, nor are the temporary files of the results
+    that are being written.
+    """
+    designs = netcad_globals.g_netcad_designs
+    suffixes = {f".{results_fmt.value}" for results_fmt in ResultsFormat}
+    manifest = dict()
+
+    for member_name in designs.get(design_name, {}).get("group") or [design_name]:
+        design_dir = netcad_globals.g_netcad_checks_dir / member_name
+
+        for filepath in design_dir.glob("*/results/*"):
+            if filepath.suffix in suffixes and filepath.is_file():
+                stat = filepath.stat()
+                manifest[(filepath.parent.parent.name, filepath.name)] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                )
+
+    return manifest
@@ -18,12 +18,10 @@ from rich.table import Table
 # Private Imports
 # -----------------------------------------------------------------------------
 
-from netcad.device.profiles import InterfaceProfile
 from netcad.feats.vlans import InterfaceL2, VlanProfile, InterfaceVlan
 from netcad.feats.vlans.checks.check_switchports import SwitchportCheck
 
 from .design_service import DesignService
-from .graph_query import GraphQuery
 from .service_report import DesignServiceReport
 from .service_check import DesignServiceCheck
 from .topology_service import TopologyService
@@ -112,8 +110,8 @@ class SwitchportService(DesignService):
         # the SVIs so that we can validate the IP address configuration.
         # ---------------------------------------------------------------------
 
-        def is_my_svi(_ipf: InterfaceProfile):
-            return isinstance(_ipf, InterfaceVlan) and _ipf.vlan in self.vlans
+        def is_my_svi(_ipf: InterfaceVlan):
+            return _ipf.vlan in self.vlans
 
         self.svi_topology = TopologyService(
             design=self.design,
@@ -123,6 +121,7 @@ class SwitchportService(DesignService):
             config=TopologyService.Config(
                 topology_feature=self.config.topology.config.topology_feature,
                 match_interface_profile=is_my_svi,
+                match_profile_classes=(InterfaceVlan,),
             ),
         )
 
@@ -203,12 +202,8 @@ class SwitchportService(DesignService):
         # ---------------------------------------------------------------------
 
         pass_fail = (
-            GraphQuery(ai.graph)(
-                *ai.graph.vs.select(
-                    service=self.name,
-                    check_type=self.CheckSwitchports.check_type,
-                )
-            )
+            ai.query()
+            .select(service=self.name, check_type=self.CheckSwitchports.check_type)
             .out_()
             .groupby(itemgetter("status"))
         )
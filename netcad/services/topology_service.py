@@ -5,8 +5,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Callable, ClassVar, Any
-from dataclasses import dataclass
+from typing import Callable, ClassVar, Any, Optional
+from dataclasses import dataclass, field
 from operator import attrgetter, itemgetter
 from collections import Counter, defaultdict
 
@@ -22,7 +22,7 @@ from rich.table import Table
 
 from netcad.checks import CheckStatus
 from netcad.device import Device, DeviceInterface
-from netcad.device.profiles import InterfaceL3
+from netcad.device.profiles import InterfaceL3, InterfaceProfile
 
 from netcad.feats.topology import TopologyDesignFeature
 from netcad.feats.topology.checks.check_device_info import DeviceInformationCheck
@@ -31,7 +31,6 @@ from netcad.feats.topology.checks.check_cabling_nei import InterfaceCablingCheck
 from netcad.feats.topology.checks.check_ipaddrs import IPInterfaceCheck
 from netcad.feats.topology.checks.check_transceivers import TransceiverCheck
 
-from .graph_query import GraphQuery
 from .service_check import DesignServiceCheck
 from .service_report import DesignServiceReport, color_pass_fail
 from .design_service import DesignService
@@ -95,7 +94,42 @@ class TopologyService(DesignService):
         #
         #       lambda ifp: ifp.is_network
 
-        match_interface_profile: Callable
+        match_interface_profile: Optional[Callable] = None
+
+        # the declarative form of the match criteria, which is answered by the
+        # design interface index rather than calling the above function for
+        # every interface in the design.  The interface profile must be an
+        # instance of one of the profile classes, when given, and have each of
+        # the attribute values.  The same example as above would be:
+        #
+        #       match_profile_attrs={"is_network": True}
+        #
+        # When the function is also given, then the interface must match both.
+
+        match_profile_classes: tuple[type, ...] = ()
+        match_profile_attrs: dict[str, Any] = field(default_factory=dict)
+
+        def __post_init__(self):
+            if not (
+                self.match_interface_profile
+                or self.match_profile_classes
+                or self.match_profile_attrs
+            ):
+                raise ValueError("Topology service requires interface match criteria")
+
+        def match_profile(self, profile: InterfaceProfile) -> bool:
+            """
+            Returns True if the profile matches the attribute values, and the
+            match function; the profile classes are not checked.
+            """
+            for attr, value in self.match_profile_attrs.items():
+                if getattr(profile, attr, None) != value:
+                    return False
+
+            if self.match_interface_profile:
+                return bool(self.match_interface_profile(profile))
+
+            return True
 
     # -------------------------------------------------------------------------
     # Service Check Types
@@ -129,16 +163,17 @@ class TopologyService(DesignService):
     def match_interfaces(self) -> bool:
         """
         Find all interfaces in the topology that match the service search
-        criteria.
+        criteria.  The interfaces with the matching profile classes, or all of
+        the used interfaces, are found using the design interface index.
         """
+        config = self.config
+        profile_classes = config.match_profile_classes or (InterfaceProfile,)
 
         self.interfaces = {
             interface
-            for device in self.design.devices.values()
-            if not device.is_pseudo
-            for interface in device.interfaces.values()
-            if interface.profile
-            and self.config.match_interface_profile(interface.profile)
+            for interface in self.design.interfaces_with_profile(*profile_classes)
+            if not interface.device.is_pseudo
+            and config.match_profile(interface.profile)
         }
 
         self.devices = set(if_obj.device for if_obj in self.interfaces)
@@ -347,7 +382,7 @@ class TopologyService(DesignService):
         # ---------------------------------------------------------------------
 
         svc_cable_node = (
-            GraphQuery(ai.graph)(ai.nodes_map[self])
+            ai.query(ai.nodes_map[self])
             .out_()
             .node(check_type=self.CheckCabling.check_type)
             .first()
@@ -382,9 +417,7 @@ class TopologyService(DesignService):
             # find all the device specific checks (really only one right now,
             # but could be more in the future).
 
-            pass_fail = (
-                GraphQuery(ai.graph)(dev_node).out_().groupby(itemgetter("status"))
-            )
+            pass_fail = ai.query(dev_node).out_().groupby(itemgetter("status"))
             dev_fail = bool(pass_fail["FAIL"])
             pass_fail_c[not dev_fail] += 1
 
@@ -433,9 +466,7 @@ class TopologyService(DesignService):
         for if_obj, if_node in pass_fail_nodes[False]:
             table = Table()
 
-            check_nodes = (
-                GraphQuery(ai.graph)(if_node).out_(service=self.name, kind="r").nodes
-            )
+            check_nodes = ai.query(if_node).out_(service=self.name, kind="r").nodes
 
             for check_obj in map(ai.nodes_map.inv.__getitem__, check_nodes):
                 table.add_row(self.build_feature_logs_table(check_obj))
@@ -461,9 +492,7 @@ class TopologyService(DesignService):
         pass_table = Table("Device", "Interface", "Desc", "Profile", "Logs")
         for if_obj, if_node in pass_fail_nodes[True]:
             table = Table()
-            check_nodes = (
-                GraphQuery(ai.graph)(if_node).out_(service=self.name, kind="r").nodes
-            )
+            check_nodes = ai.query(if_node).out_(service=self.name, kind="r").nodes
             for check_obj in map(ai.nodes_map.inv.__getitem__, check_nodes):
                 table.add_row(self.build_feature_logs_table(check_obj))
 
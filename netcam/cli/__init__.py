@@ -1,6 +1,19 @@
 from .netcam import script
 from .cli_netcam_main import cli
-from . import cli_check_devices
-from . import config
-from . import show_checks
-from . import services
+
+# the commands are imported when they are invoked, see LazyGroup.
+
+cli.add_lazy_command(
+    "check",
+    "netcam.cli.cli_check_devices",
+    help="Execute checks to validate the operational state of devices.",
+)
+cli.add_lazy_command(
+    "config",
+    "netcam.cli.config.cli_config_main",
+    help="device configuration subcommands ...",
+)
+cli.add_lazy_command("show", "netcam.cli.cli_netcam_show", help="show commands ...")
+cli.add_lazy_command(
+    "services", "netcam.cli.services.clig_services", help="Services commands"
+)
@@ -35,11 +35,20 @@ from netcad.cli.device_inventory import get_devices_from_designs
 from netcam.cli import cli
 
 from netcam.execute_checks import (
-    execute_device_checks,
+    execute_devices_checks,
     cv_check_list,
     cv_service_list,
+    cv_collection_limit,
+    cv_collection_timeout,
+    cv_results_format,
+    DEFAULT_DEVICE_LIMIT,
+    DEFAULT_COLLECTION_LIMIT,
 )
 from netcad.cli.keywords import color_pass_fail
+from netcad.checks.check_results_file import ResultsFormat
+from netcad.checks.check_results_db import CheckResultsDB
+from netcad.checks.check_result_log import cv_log_pass_details
+from netcam.connection_pool import close_connection_pool
 
 
 # -----------------------------------------------------------------------------
@@ -77,12 +86,55 @@ __all__ = []
     type=click.Path(path_type=Path, resolve_path=True, exists=True, writable=True),
     envvar=Environment.NETCAD_CHECKSDIR,
 )
+@click.option(
+    "--max-devices",
+    "max_devices",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DEVICE_LIMIT,
+    show_default=True,
+    help="maximum number of devices checked at the same time",
+)
+@click.option(
+    "--max-device-checks",
+    "max_device_checks",
+    type=click.IntRange(min=1),
+    default=DEFAULT_COLLECTION_LIMIT,
+    show_default=True,
+    help="maximum number of check collections run in parallel per device",
+)
+@click.option(
+    "--check-timeout",
+    "check_timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="maximum seconds allowed for a check collection to run",
+)
+@click.option(
+    "--results-format",
+    "results_format",
+    type=click.Choice([fmt.value for fmt in ResultsFormat]),
+    default=ResultsFormat.json.value,
+    show_default=True,
+    envvar=Environment.NETCAD_RESULTS_FORMAT,
+    help="format of the check results files",
+)
+@click.option(
+    "--pass-details/--no-pass-details",
+    "pass_details",
+    default=True,
+    show_default=True,
+    help="store the details of the check fields that pass",
+)
 def cli_test_device(
     devices: Tuple[str],
     designs: Tuple[str],
     check_list: Tuple[str],
     checks_dir: Path,
     service_list: Tuple[str],
+    max_devices: int,
+    max_device_checks: int,
+    check_timeout: float,
+    results_format: str,
+    pass_details: bool,
 ):
     """
     Execute checks to validate the operational state of devices.
@@ -113,6 +165,29 @@ def cli_test_device(
     checks_dir:
         The Path instance to the parent directory of checks.  Subdirectories
         exist for each device by hostname.
+
+    max_devices:
+        The maximum number of devices that are checked at the same time.  As
+        soon as one device completes, the next device is started.
+
+    max_device_checks:
+        The maximum number of check collections that are executed in parallel
+        on the same device.
+
+    check_timeout: optional
+        The maximum number of seconds that a check collection is allowed to
+        execute.  When exceeded, the check collection is aborted and counted as
+        a failure.
+
+    results_format:
+        The format of the check results files.  The "json" format is a
+        pretty-printed JSON list.  The "ndjson" format is one result per line
+        and is written incrementally.
+
+    pass_details:
+        When False, the check-result logs store only the number of the fields
+        that pass rather than the expected and measured values of each; which
+        reduces the size of the results files.
     """
 
     log = get_logger()
@@ -137,6 +212,10 @@ def cli_test_device(
     async def run_tests():
         cv_check_list.set(check_list)
         cv_service_list.set(service_list)
+        cv_collection_limit.set(max_device_checks)
+        cv_collection_timeout.set(check_timeout)
+        cv_results_format.set(ResultsFormat(results_format))
+        cv_log_pass_details.set(pass_details)
 
         for dev_obj in device_objs:
             if not (pg_obj := netcam_plugins.get(dev_obj.os_name)):
@@ -157,17 +236,26 @@ def cli_test_device(
         for dev_obj in remove_unsupported:
             del duts[dev_obj]
 
-        log.info(f"Starting tests for {len(duts)} devices.")
+        log.info(
+            f"Starting tests for {len(duts)} devices, "
+            f"{min(max_devices, len(duts))} at a time."
+        )
 
         # execute the tests concurrently to minimize the time it takes to run
-        # through all the tests.
+        # through all the tests, limiting the number of devices that are being
+        # checked at the same time so as not to overwhelm the devices APIs or
+        # the AAA servers.
 
         # TODO: this _presumes_ that the underlying "netcam" plugin was written to
         #       support asyncio.  This might not always be the case, so need to put
         #       in a check and execute the plugin running differently. For now, only
         #       asyncio plugins are supported.
 
-        await asyncio.gather(*(execute_device_checks(dut) for dut in duts.values()))
+        try:
+            await execute_devices_checks(duts.values(), limit=max_devices)
+        finally:
+            await close_connection_pool()
+            CheckResultsDB.close_all()
 
     ts_start = datetime.now()
     asyncio.run(run_tests())
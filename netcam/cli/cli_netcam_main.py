@@ -1,15 +1,27 @@
 #  Copyright (c) 2021 Jeremy Schulman
 #  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import os
+
 import click
 
 from netcad import __version__
+from netcad.cli.lazy_group import LazyGroup
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__)
-def cli():
+@click.option(
+    "--design-cache",
+    is_flag=True,
+    help="Load unchanged designs from the design snapshot cache",
+)
+def cli(design_cache: bool):
     """
     netcam - network automation 'manufacturing'
     """
-    pass
+    # the environment variable is used so that the setting is inherited by
+    # the design worker processes.
+
+    if design_cache:
+        os.environ["NETCAD_DESIGNCACHE"] = "1"
@@ -7,3 +7,10 @@ from .cli_netcam_main import cli
 @cli.group(name="show")
 def clig_show():
     """show commands ..."""
+
+
+clig_show.add_lazy_command(
+    "check",
+    "netcam.cli.show_checks.cli_show_checks",
+    help="Show check results in tablular form.",
+)
@@ -1,3 +0,0 @@
-from . import cli_config_backup
-from . import cli_config_check
-from . import cli_config_push
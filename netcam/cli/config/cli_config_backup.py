@@ -17,6 +17,7 @@ from netcad.config import netcad_globals
 from netcad.logger import get_logger
 from netcad.device import Device
 from netcam.dcfg import AsyncDeviceConfigurable
+from netcam.connection_pool import close_connection_pool
 from netcad.cli.device_inventory import get_devices_from_designs
 from netcad.cli.common_opts import opt_devices, opt_designs, opt_configs_dir
 
@@ -84,4 +85,7 @@ async def run_fetch_configs(device_objs: list[Device], configs_dir: Path):
             )
         )
 
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await close_connection_pool()
@@ -20,6 +20,7 @@ from netcad.device import Device, DeviceNonExclusive
 from netcad.cli.device_inventory import get_devices_from_designs
 from netcad.cli.common_opts import opt_devices, opt_designs, opt_configs_dir
 from netcam.dcfg import AsyncDeviceConfigurable
+from netcam.connection_pool import close_connection_pool
 from netcam.config import check_device_config
 from netcam.cli.netcam_filter_devices import netcam_filter_devices
 
@@ -96,4 +97,7 @@ async def run_check_configs(device_objs: list[Device], configs_dir: Path):
         tasks.append(asyncio.create_task(check_device_config(dev_cfg)))
 
     # TODO: need to check for excpeitons
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await close_connection_pool()
@@ -8,3 +8,18 @@ from ..cli_netcam_main import cli
 def clig_config():
     """device configuration subcommands ..."""
     pass
+
+
+clig_config.add_lazy_command(
+    "backup", "netcam.cli.config.cli_config_backup", help="Backup device configurations"
+)
+clig_config.add_lazy_command(
+    "check",
+    "netcam.cli.config.cli_config_check",
+    help="Given the built configuration, check that it will load and save...",
+)
+clig_config.add_lazy_command(
+    "push",
+    "netcam.cli.config.cli_config_push",
+    help="Deploy the design build configurations to device(s)",
+)
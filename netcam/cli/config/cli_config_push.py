@@ -24,6 +24,7 @@ from netcad.config import netcad_globals
 from netcad.logger import get_logger
 from netcad.device import Device, DeviceNonExclusive
 from netcam.dcfg import AsyncDeviceConfigurable
+from netcam.connection_pool import close_connection_pool
 from netcad.cli.device_inventory import get_devices_from_designs
 from netcad.cli.common_opts import opt_devices, opt_designs, opt_configs_dir
 from netcam.cli.netcam_filter_devices import netcam_filter_devices
@@ -118,9 +119,13 @@ async def run_deploy_configs(
         # TODO: need to check for exceptions
         tasks.append(push_device_config(dev_cfg, rollback_timeout=rollback_timeout))
 
-    if concurrent:
-        await asyncio.gather(*tasks)
+    try:
+        if concurrent:
+            await asyncio.gather(*tasks)
 
-    else:
-        for task in tasks:
-            await task
+        else:
+            for task in tasks:
+                await task
+
+    finally:
+        await close_connection_pool()
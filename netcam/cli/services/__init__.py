@@ -1 +0,0 @@
-from . import clig_services
@@ -19,6 +19,7 @@ from rich.text import Text, Style
 
 from netcad.design import load_design
 from netcad.services import ServicesAnalyzer, DesignService
+from netcad.services.services_snapshot import ServicesSnapshot
 from netcad.cli.common_opts import opt_designs
 from ..cli_netcam_main import cli
 
@@ -42,17 +43,57 @@ def clig_services():
 @click.option(
     "--all", "all_results", is_flag=True, help="show all results, not just failed"
 )
-def clig_reports(designs: Tuple[str], service_names: Sequence[str], **flags):
+@click.option(
+    "--lazy",
+    "lazy_results",
+    is_flag=True,
+    help="parse the check results only when used by a report",
+)
+@click.option(
+    "--graphml",
+    "write_graphml",
+    is_flag=True,
+    help="write the analysis graph to <design>.graphml",
+)
+def clig_reports(
+    designs: Tuple[str],
+    service_names: Sequence[str],
+    lazy_results: bool,
+    write_graphml: bool,
+    **flags,
+):
     """generate report"""
 
     design_name = designs[0]
-    design = load_design(design_name=design_name)
 
-    ai = ServicesAnalyzer(design=design)
-    ai.build()
-    asyncio.run(ai.check())
+    # the analyzer is reused from the snapshot when the design has not changed
+    # since the snapshot was saved, with any changed check results reloaded.
+
+    snapshot = (
+        ServicesSnapshot(design_name, lazy_results=lazy_results)
+        if ServicesSnapshot.enabled()
+        else None
+    )
+
+    if not (snapshot and (ai := snapshot.load())):
+        if snapshot:
+            snapshot.mark()
+
+        design = load_design(design_name=design_name)
+        ai = ServicesAnalyzer(design=design, lazy_results=lazy_results)
+        ai.build()
+        asyncio.run(ai.check())
+
+        if snapshot:
+            snapshot.save(ai)
+
+    elif snapshot.changed:
+        snapshot.save(ai)
+
+    design = ai.design
 
-    ai.graph.write_graphml(f"{design.name}.graphml")
+    if write_graphml:
+        ai.graph.write_graphml(f"{design.name}.graphml")
 
     if not service_names:
         _show_all(ai, flags)
@@ -1 +0,0 @@
-from . import cli_show_checks
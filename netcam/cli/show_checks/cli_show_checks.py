@@ -22,6 +22,7 @@ from rich.console import Console
 
 from netcad.config import Environment, netcad_globals
 from netcad.logger import get_logger
+from netcad.checks.check_results_db import CheckResultsDB
 
 from netcad.cli.common_opts import opt_devices, opt_designs
 from netcad.cli.device_inventory import get_devices_from_designs
@@ -126,6 +127,7 @@ def cli_report_tests(
         # privately used within this CLI module.
 
         device.tcr_dir = dev_tcr_dir
+        device.results_db = CheckResultsDB.open_existing(tc_dir, device.design.name)
         if not dev_tcr_dir.exists():
             log.error(
                 f"Missing {device.name}, expected test results directory: {dev_tcr_dir.name}"
@@ -0,0 +1,85 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Dict, Optional
+from collections import Counter
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.device import Device
+from netcad.checks.check_results_db import CheckResultsDB
+from netcad.checks.check_results_file import results_filepath, iter_results_file
+
+from .filter_results import filter_results, filter_query
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def device_results(device: Device, check_name: str, optionals: dict) -> List[Dict]:
+    """
+    Returns the filtered list of results for the given device and check
+    collection.  The results are queried from the design results database when
+    it contains the results for this device; otherwise the results are loaded
+    from the device results file.
+    """
+    if results_db := _device_results_db(device, check_name):
+        return list(
+            results_db.query(
+                devices=[device.name],
+                collections=[check_name],
+                **filter_query(optionals),
+            )
+        )
+
+    if not (results_file := results_filepath(device.tcr_dir, check_name)):
+        return []
+
+    return filter_results(results=iter_results_file(results_file), optionals=optionals)
+
+
+def device_results_counts(device: Device, check_name: str, optionals: dict) -> Counter:
+    """
+    Returns the Counter of the filtered results status values for the given
+    device and check collection.
+    """
+    if not (results_db := _device_results_db(device, check_name)):
+        return Counter(
+            res["status"] for res in device_results(device, check_name, optionals)
+        )
+
+    return Counter(
+        {
+            status: count
+            for status, count in results_db.status_counts(
+                group_by=(),
+                devices=[device.name],
+                collections=[check_name],
+                **filter_query(optionals),
+            )
+        }
+    )
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def _device_results_db(device: Device, check_name: str) -> Optional[CheckResultsDB]:
+    results_db: Optional[CheckResultsDB] = device.results_db
+    if results_db and (device.name, check_name) in results_db.stored():
+        return results_db
+
+    return None
@@ -1,7 +1,42 @@
-from typing import List, Dict
+from typing import List, Dict, Set
 from netcad.checks import CheckStatus
 
 
+def filter_statuses(optionals: dict) -> Set[CheckStatus]:
+    """
+    This function returns the set of check status values that should be
+    included in the report based on the User CLI flags.
+    """
+    inc_all = optionals["include_all"]
+
+    if optionals["pass_only"]:
+        status_allows = {CheckStatus.PASS}
+    else:
+        status_allows = {CheckStatus.FAIL}
+
+    if optionals["include_info"] or inc_all:
+        status_allows.add(CheckStatus.INFO)
+        status_allows.add(CheckStatus.SKIP)
+
+    if optionals["include_pass"] or inc_all:
+        status_allows.add(CheckStatus.PASS)
+
+    return status_allows
+
+
+def filter_query(optionals: dict) -> dict:
+    """
+    This function returns the results database query filters that are
+    equivalent to the `filter_results` function, so that the filtering can be
+    done by the database.
+    """
+    return dict(
+        statuses=filter_statuses(optionals),
+        include_fields=optionals["include_fields"],
+        exclude_fields=optionals["exclude_fields"],
+    )
+
+
 def filter_results(results: dict, optionals: dict) -> List[Dict]:
     """
     This function filters the test cases results based on the User CLI flags.
@@ -19,23 +54,11 @@ def filter_results(results: dict, optionals: dict) -> List[Dict]:
     List of the filtered results.  If the results include a "skip" indicator,
     then an empty list is returned.
     """
-    inc_all = optionals["include_all"]
-
-    if optionals["pass_only"]:
-        status_allows = {CheckStatus.PASS}
-    else:
-        status_allows = {CheckStatus.FAIL}
+    status_allows = filter_statuses(optionals)
 
     inc_fields = optionals["include_fields"]
     exc_fields = optionals["exclude_fields"]
 
-    if optionals["include_info"] or inc_all:
-        status_allows.add(CheckStatus.INFO)
-        status_allows.add(CheckStatus.SKIP)
-
-    if optionals["include_pass"] or inc_all:
-        status_allows.add(CheckStatus.PASS)
-
     filter_flds_in = lambda i: i.get("field") in inc_fields
     filter_flds_out = lambda i: i.get("field") not in exc_fields
     filter_status = lambda i: i["status"] in status_allows
@@ -5,7 +5,6 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-import json
 from typing import Tuple
 from collections import Counter
 
@@ -25,7 +24,7 @@ from netcad.checks import CheckStatus
 from netcad.cli.keywords import color_pass_fail
 
 from .find_check_services import find_check_services
-from .filter_results import filter_results
+from .device_results import device_results_counts
 
 
 def show_design_summary_table(
@@ -67,16 +66,9 @@ def show_design_summary_table(
             # not executed.  For now, silently skip.  TODO: may show User warning?
 
             tc_name = check_svc.get_name()
-            results_file = device.tcr_dir.joinpath(f"{tc_name}.json")
-            if not results_file.exists():
+            if not (tcr_cntrs := device_results_counts(device, tc_name, optionals)):
                 continue
 
-            results = json.load(results_file.open())
-
-            if not (results := filter_results(results=results, optionals=optionals)):
-                continue
-
-            tcr_cntrs = Counter(res["status"] for res in results)
             dev_cntrs.update(tcr_cntrs)
 
         dev_tc_counts = sum(dev_cntrs.values())
@@ -1,14 +1,6 @@
 #  Copyright (c) 2021 Jeremy Schulman
 #  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
-# -----------------------------------------------------------------------------
-# System Imports
-# -----------------------------------------------------------------------------
-
-import json
-from pathlib import Path
-from collections import Counter
-
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
@@ -25,12 +17,10 @@ from netcad.checks import CheckStatus
 from netcad.cli.keywords import color_pass_fail
 
 from .find_check_services import find_check_services
-from .filter_results import filter_results
+from .device_results import device_results_counts
 
 
 def show_device_brief_table(console: Console, device: Device, optionals: dict):
-    tcr_dir: Path = device.tcr_dir
-
     table = Table(
         "Test Cases",
         "Status",
@@ -50,16 +40,9 @@ def show_device_brief_table(console: Console, device: Device, optionals: dict):
         # not executed.  For now, silently skip.  TODO: may show User warning?
         tc_name = check_svc.get_name()
 
-        results_file = tcr_dir.joinpath(f"{tc_name}.json")
-        if not results_file.exists():
-            continue
-
-        results = json.load(results_file.open())
-
-        if not (results := filter_results(results=results, optionals=optionals)):
+        if not (tcr_cntrs := device_results_counts(device, tc_name, optionals)):
             continue
 
-        tcr_cntrs = Counter(res["status"] for res in results)
         tcr_total = sum(tcr_cntrs.values())
         dev_tc_count += tcr_total
 
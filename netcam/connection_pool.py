@@ -0,0 +1,463 @@
+#  Copyright (c) 2025 Jeremy Schulman
+#  GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict, List, Tuple, Any, AsyncIterator
+from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from weakref import WeakKeyDictionary
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import asyncssh
+
+if TYPE_CHECKING:
+    import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcad.registry import Registry
+from netcad.logger import get_logger
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "ConnectionPool",
+    "PoolTransport",
+    "SSHTransport",
+    "HTTPTransport",
+    "get_connection_pool",
+    "close_connection_pool",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+PoolKey = Tuple[str, str, tuple]
+
+
+class PoolTransport(Registry):
+    """
+    The PoolTransport is the base class for the transports that are managed
+    by the ConnectionPool.  A netcam plugin registers a transport by
+    subclassing with a registry name, for example:
+
+        class EosApiTransport(PoolTransport, registry_name="eos-api"):
+            ...
+
+    and then uses the pool by that name from the DUT and DCFG instances.
+
+    Attributes
+    ----------
+    shared: bool
+        When True a connection can be used by concurrent tasks, for example an
+        SSH connection that supports many channels, or an HTTP client that
+        supports many requests.  When False each task is given a connection
+        for its exclusive use.
+    """
+
+    shared = True
+
+    def __init__(self, pool: "ConnectionPool"):
+        self.pool = pool
+
+    async def connect(self, host: str, **params) -> Any:
+        """
+        Returns a new connection to the host using the transport specific
+        parameters; for example the login credentials.
+        """
+        raise NotImplementedError()
+
+    async def close(self, conn: Any):
+        """
+        Closes the connection; it will not be used again.
+        """
+        raise NotImplementedError()
+
+    def is_alive(self, conn: Any) -> bool:
+        """
+        Returns False when the connection was closed, for example by the remote
+        host, so that it will not be reused.
+        """
+        return True
+
+
+class SSHTransport(PoolTransport, registry_name="ssh"):
+    """
+    SSH transport using asyncssh, the parameters are those of asyncssh.connect.
+    An SSH keepalive is sent on idle connections so that the remote host does
+    not close a connection that is held by the pool.
+    """
+
+    keepalive_interval = 30
+
+    async def connect(self, host: str, **params) -> asyncssh.SSHClientConnection:
+        params.setdefault("keepalive_interval", self.keepalive_interval)
+        return await asyncssh.connect(host, **params)
+
+    async def close(self, conn: asyncssh.SSHClientConnection):
+        conn.close()
+        await conn.wait_closed()
+
+    def is_alive(self, conn: asyncssh.SSHClientConnection) -> bool:
+        return not conn.is_closed()
+
+
+class HTTPTransport(PoolTransport, registry_name="http"):
+    """
+    HTTP transport using an httpx.AsyncClient whose base URL is the host. The
+    parameters "scheme" (default https) and "port" are used to form the base
+    URL; the other parameters are those of the httpx.AsyncClient.  The client
+    keeps the HTTP connections alive for the pool idle timeout.
+
+    The transport requires the optional "httpx" package, see the netcad
+    "http" extra.
+    """
+
+    async def connect(
+        self, host: str, scheme: str = "https", port: Optional[int] = None, **params
+    ) -> "httpx.AsyncClient":
+        httpx = _httpx()
+        params.setdefault(
+            "limits",
+            httpx.Limits(
+                max_connections=self.pool.host_limit,
+                keepalive_expiry=self.pool.idle_timeout,
+            ),
+        )
+        base_url = f"{scheme}://{host}" + (f":{port}" if port else "")
+        return httpx.AsyncClient(base_url=base_url, **params)
+
+    async def close(self, conn: "httpx.AsyncClient"):
+        await conn.aclose()
+
+    def is_alive(self, conn: "httpx.AsyncClient") -> bool:
+        return not conn.is_closed
+
+
+class ConnectionPool:
+    """
+    The ConnectionPool holds the open connections to the devices so that they
+    are reused by the DUT and DCFG instances, rather than each of them opening
+    a new connection, and performing the SSH/TLS handshakes, for each
+    operation.  The connections are keyed by the transport name, the host, and
+    the transport parameters.
+
+    A connection that is not in use is kept open for `idle_timeout` seconds.
+    The number of concurrent users of the connections to a host is limited to
+    `host_limit`, so as not to overwhelm the device API or the AAA servers;
+    additional users wait until a connection is released.  The users are
+    counted by asyncio task, so that a task that holds a connection to a host
+    and acquires another connection to the same host, for example a
+    different transport, does not wait on itself.
+
+    The pool is bound to an asyncio event loop, use `get_connection_pool` to
+    obtain the pool for the running loop.
+
+    Examples
+    --------
+        async with pool.connection("ssh", host, username=user) as conn:
+            await conn.run("show version")
+    """
+
+    DEFAULT_HOST_LIMIT = 4
+    DEFAULT_IDLE_TIMEOUT = 60
+
+    def __init__(
+        self,
+        host_limit: int = DEFAULT_HOST_LIMIT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self.host_limit = host_limit
+        self.idle_timeout = idle_timeout
+        self._transports: Dict[str, PoolTransport] = dict()
+        self._entries: Dict[PoolKey, List[_PoolEntry]] = dict()
+        self._key_locks: Dict[PoolKey, asyncio.Lock] = dict()
+        self._host_limits: Dict[str, asyncio.Semaphore] = dict()
+
+        # key=(host, task), value=number of connections held by the task
+        self._host_holders: Dict[Tuple[str, asyncio.Task], int] = dict()
+
+    @asynccontextmanager
+    async def connection(
+        self, transport: str, host: str, **params
+    ) -> AsyncIterator[Any]:
+        """
+        Context manager that provides a connection to the host using the named
+        transport, see `acquire`.
+        """
+        entry = await self._acquire(transport, host, **params)
+        try:
+            yield entry.conn
+        finally:
+            await self._release(entry)
+
+    async def acquire(self, transport: str, host: str, **params) -> Any:
+        """
+        Returns a connection to the host using the named transport, opening a
+        new connection if there is no connection that can be reused.  The
+        Caller must call `release` when it is done with the connection.
+
+        Parameters
+        ----------
+        transport:
+            The registered transport name, for example "ssh".
+
+        host:
+            The target host name or IP address.
+
+        params:
+            The transport specific connection parameters.
+
+        Raises
+        ------
+        RuntimeError
+            When the transport name is not registered.
+        """
+        return (await self._acquire(transport, host, **params)).conn
+
+    async def release(self, conn: Any):
+        """
+        Returns the connection obtained from `acquire` to the pool.  The
+        connection should be released by the task that acquired it.
+        """
+        for entries in self._entries.values():
+            for entry in entries:
+                if entry.conn is conn and entry.leases:
+                    await self._release(entry)
+                    return
+
+    async def close_idle(self):
+        """
+        Closes the connections that have not been used within the idle timeout.
+        """
+        for key in list(self._entries):
+            async with self._key_lock(key):
+                await self._close_expired(key, force=False)
+
+    async def close_all(self):
+        """
+        Closes all of the connections, including those that are in use.
+        """
+        for key in list(self._entries):
+            async with self._key_lock(key):
+                await self._close_expired(key, force=True)
+
+        self._entries.clear()
+        self._key_locks.clear()
+
+    # -------------------------------------------------------------------------
+    #
+    #                             Private Methods
+    #
+    # -------------------------------------------------------------------------
+
+    def _transport(self, name: str) -> PoolTransport:
+        if transport := self._transports.get(name):
+            return transport
+
+        if not (transport_cls := PoolTransport.registry_get(name)):
+            raise RuntimeError(f"Connection pool transport not registered: {name}")
+
+        transport = self._transports[name] = transport_cls(self)
+        return transport
+
+    def _key_lock(self, key: PoolKey) -> asyncio.Lock:
+        if not (lock := self._key_locks.get(key)):
+            lock = self._key_locks[key] = asyncio.Lock()
+        return lock
+
+    async def _host_acquire(self, host: str, task: asyncio.Task):
+        """
+        Waits for the host limit, unless the task already holds a connection to
+        the host.
+        """
+        holder = (host, task)
+
+        if not (count := self._host_holders.get(holder, 0)):
+            if not (host_limit := self._host_limits.get(host)):
+                host_limit = self._host_limits[host] = asyncio.Semaphore(
+                    self.host_limit
+                )
+            await host_limit.acquire()
+
+        self._host_holders[holder] = count + 1
+
+    def _host_release(self, host: str, task: asyncio.Task):
+        holder = (host, task)
+
+        if count := self._host_holders.pop(holder) - 1:
+            self._host_holders[holder] = count
+        else:
+            self._host_limits[host].release()
+
+    async def _acquire(self, transport_name: str, host: str, **params) -> "_PoolEntry":
+        transport = self._transport(transport_name)
+        key = (transport_name, host, _params_key(params))
+        task = asyncio.current_task()
+
+        await self._host_acquire(host, task)
+
+        try:
+            async with self._key_lock(key):
+                await self._close_expired(key, force=False)
+                entries = self._entries.setdefault(key, [])
+
+                entry = next(
+                    (each for each in entries if transport.shared or not each.leases),
+                    None,
+                )
+
+                if not entry:
+                    get_logger().debug(f"{host}: open {transport_name} connection")
+                    conn = await transport.connect(host, **params)
+                    entry = _PoolEntry(key, transport, conn)
+                    entries.append(entry)
+
+                entry.holders.append(task)
+                return entry
+
+        except BaseException:
+            self._host_release(host, task)
+            raise
+
+    async def _release(self, entry: "_PoolEntry"):
+        # the lease of the current task, or if the connection is released by
+        # another task, the oldest lease.
+
+        task = asyncio.current_task()
+        if task not in entry.holders:
+            task = entry.holders[0]
+
+        entry.holders.remove(task)
+        entry.last_used = asyncio.get_running_loop().time()
+        self._host_release(entry.key[1], task)
+
+        if not entry.leases and not entry.transport.is_alive(entry.conn):
+            async with self._key_lock(entry.key):
+                if entry in (entries := self._entries.get(entry.key, [])):
+                    entries.remove(entry)
+                    await entry.close()
+
+    async def _close_expired(self, key: PoolKey, force: bool):
+        """
+        Closes the connections for the key that are closed by the remote host,
+        or are not in use and have not been used within the idle timeout; or
+        all the connections when force is True.
+        """
+        now = asyncio.get_running_loop().time()
+        keep = list()
+
+        for entry in self._entries.get(key, []):
+            if force or not entry.transport.is_alive(entry.conn):
+                await entry.close()
+            elif not entry.leases and now - entry.last_used > self.idle_timeout:
+                await entry.close()
+            else:
+                keep.append(entry)
+
+        self._entries[key] = keep
+
+
+# The connection pools are bound to the event loop since the connections,
+# and the asyncio locks, can only be used by the loop that created them.
+
+_g_connection_pools: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """
+    Returns the connection pool for the running asyncio event loop, creating
+    it on first use.
+    """
+    loop = asyncio.get_running_loop()
+
+    if not (pool := _g_connection_pools.get(loop)):
+        pool = _g_connection_pools[loop] = ConnectionPool()
+
+    return pool
+
+
+async def close_connection_pool():
+    """
+    Closes all the connections of the pool bound to the running asyncio event
+    loop.  This function is called by the netcam commands once the device
+    operations are completed.
+    """
+    if pool := _g_connection_pools.pop(asyncio.get_running_loop(), None):
+        await pool.close_all()
+
+
+# -----------------------------------------------------------------------------
+#
+#                          PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class _PoolEntry:
+    __slots__ = ("key", "transport", "conn", "holders", "last_used")
+
+    def __init__(self, key: PoolKey, transport: PoolTransport, conn: Any):
+        self.key = key
+        self.transport = transport
+        self.conn = conn
+
+        # the task of each lease of the connection.
+        self.holders: List[asyncio.Task] = list()
+        self.last_used = asyncio.get_running_loop().time()
+
+    @property
+    def leases(self) -> int:
+        return len(self.holders)
+
+    async def close(self):
+        try:
+            await self.transport.close(self.conn)
+        except Exception as exc:
+            get_logger().debug(f"{self.key[1]}: error closing connection: {exc}")
+
+
+def _httpx():
+    """
+    Returns the optional httpx module, which is imported on first use.
+    """
+    try:
+        import httpx
+
+    except ImportError:
+        raise RuntimeError(
+            'The "httpx" package is required for the connection pool http transport'
+        )
+
+    return httpx
+
+
+def _params_key(params: dict) -> tuple:
+    """
+    Returns the hashable key for the transport parameters; parameters that are
+    not hashable, for example an SSL context, are keyed by identity.
+    """
+    key = list()
+
+    for name, value in sorted(params.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = id(value)
+        key.append((name, value))
+
+    return tuple(key)
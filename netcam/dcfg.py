@@ -22,6 +22,7 @@ import aiofiles.os
 # -----------------------------------------------------------------------------
 
 from netcad.device import Device
+from netcam.connection_pool import get_connection_pool
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -120,6 +121,27 @@ class DeviceConfigurable:
     def _set_config_id(self, name: str):
         raise NotImplementedError()
 
+    def connection(self, transport: str, host: Optional[str] = None, **params):
+        """
+        Returns the async context manager that provides a connection to the
+        device from the netcam connection pool, so that the connection is
+        shared with the DUT and other operations on the same device.
+
+        Parameters
+        ----------
+        transport:
+            The registered pool transport name, for example "ssh".
+
+        host: optional
+            The target host, defaults to the device name.
+
+        params:
+            The transport specific connection parameters.
+        """
+        return get_connection_pool().connection(
+            transport, host or self.device.name, **params
+        )
+
     def __lt__(self, other):
         """
         Sort the device DUT instances by the underlying device hostname. This
@@ -298,8 +320,8 @@ class AsyncDeviceConfigurable(DeviceConfigurable):
         username, password = self._scp_creds
         dst_fp = dst_filename or self.config_file.name
 
-        async with asyncssh.connect(
-            host, username=username, password=password, known_hosts=None
+        async with self.connection(
+            "ssh", host, username=username, password=password, known_hosts=None
         ) as conn:
             await asyncssh.scp(self.config_file, (conn, dst_fp))
 
@@ -9,14 +9,13 @@ from typing import Optional, Dict
 from typing import TYPE_CHECKING
 from functools import singledispatchmethod
 from pathlib import Path
-import json
 from collections import Counter
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
-import aiofiles
+from pydantic_core import from_json
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -24,6 +23,8 @@ import aiofiles
 
 from netcad.device import Device
 from netcad.checks import CheckCollection
+from netcad.checks.checks_file import checks_filepath, read_checks_file
+from netcam.connection_pool import get_connection_pool
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +56,28 @@ class _BaseDeviceUnderTest:
         self.device_info: Optional[Dict] = None
         self.result_counts = Counter()
 
+    def connection(self, transport: str, host: Optional[str] = None, **params):
+        """
+        Returns the async context manager that provides a connection to the
+        device from the netcam connection pool.  The plugin DUT should use
+        this method rather than opening its own connection so that the
+        connection is reused by the checks and the config operations.
+
+        Parameters
+        ----------
+        transport:
+            The registered pool transport name, for example "ssh".
+
+        host: optional
+            The target host, defaults to the device name.
+
+        params:
+            The transport specific connection parameters.
+        """
+        return get_connection_pool().connection(
+            transport, host or self.device.name, **params
+        )
+
     def __lt__(self, other):
         """
         Sort the device DUT instances by the underlying device hostname. This
@@ -86,9 +109,8 @@ class AsyncDeviceUnderTest(_BaseDeviceUnderTest):
         setup via super, and then perform any pluging/DUT specific setup action;
         generally opening a connection to the DUT API/SSH/etc.
         """
-        async with aiofiles.open(str(self.testcases_dir / "device.json")) as ifile:
-            payload = await ifile.read()
-            self.device_info = json.loads(payload)
+        payload = await read_checks_file(checks_filepath(self.testcases_dir, "device"))
+        self.device_info = from_json(payload)
 
     @singledispatchmethod
     async def execute_checks(
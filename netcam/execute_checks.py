@@ -5,6 +5,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
+from typing import Iterable
+import asyncio
 from collections import Counter
 from logging import Logger
 from contextvars import ContextVar
@@ -14,19 +16,35 @@ from contextvars import ContextVar
 # -----------------------------------------------------------------------------
 
 from netcad.logger import get_logger
+from netcad.igather import as_completed
 from netcad.cli.keywords import markup_color
 from netcad.debug import debug_enabled, format_exc_message
 from netcam.dut import SetupError
 
 from netcad.checks import CheckStatus, CheckResult, Check
-from .save_check_results import device_checks_save_results
+from netcad.checks.check_results_file import ResultsFormat
+from netcad.checks.check_results_db import CheckResultsDB
+from .save_check_results import (
+    device_checks_save_results,
+    device_checks_remove_results,
+)
 from .dut import AsyncDeviceUnderTest
 
 # -----------------------------------------------------------------------------
 # Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["execute_device_checks", "cv_check_list", "cv_service_list"]
+__all__ = [
+    "execute_device_checks",
+    "execute_devices_checks",
+    "cv_check_list",
+    "cv_service_list",
+    "cv_collection_limit",
+    "cv_collection_timeout",
+    "cv_results_format",
+    "DEFAULT_DEVICE_LIMIT",
+    "DEFAULT_COLLECTION_LIMIT",
+]
 
 # -----------------------------------------------------------------------------
 #
@@ -34,9 +52,26 @@ __all__ = ["execute_device_checks", "cv_check_list", "cv_service_list"]
 #
 # -----------------------------------------------------------------------------
 
+# The default maximum number of devices that are checked at the same time, and
+# the default maximum number of check collections that are executed in parallel
+# on a single device.
+
+DEFAULT_DEVICE_LIMIT = 100
+DEFAULT_COLLECTION_LIMIT = 1
+
 cv_check_list = ContextVar("check_list")
 cv_service_list = ContextVar("service_list")
 
+# The time (seconds) allowed for any one check collection to execute.  A timeout
+# of None means there is no time limit.
+
+cv_collection_limit = ContextVar("collection_limit", default=DEFAULT_COLLECTION_LIMIT)
+cv_collection_timeout = ContextVar("collection_timeout", default=None)
+
+# The format used to save the check results files.
+
+cv_results_format = ContextVar("results_format", default=ResultsFormat.json)
+
 
 PASS_CLRD = markup_color("PASS", "green")
 FAIL_CLRD = markup_color("FAIL", "red")
@@ -44,6 +79,34 @@ SKIP_CLRD = markup_color("SKIP", "grey70")
 SUMMARY_CLRD = markup_color("DONE", "bright_yellow")
 
 
+async def execute_devices_checks(
+    duts: Iterable[AsyncDeviceUnderTest], limit: int = DEFAULT_DEVICE_LIMIT
+):
+    """
+    This function executes the checks for each of the given DUTs, running at
+    most `limit` devices at the same time.  As soon as a device completes its
+    checks the next device is started.
+
+    Parameters
+    ----------
+    duts:
+        The device-under-test instances to check.
+
+    limit:
+        The maximum number of devices that are checked concurrently.
+    """
+    duts = list(duts)
+    n_duts = len(duts)
+    log = get_logger()
+
+    n_done = 0
+    async for _ in as_completed(
+        (execute_device_checks(dut) for dut in duts), limit=limit
+    ):
+        n_done += 1
+        log.debug(f"Completed checks on {n_done} of {n_duts} devices.")
+
+
 async def execute_device_checks(dut: AsyncDeviceUnderTest):
     device = dut.device
     dev_name = device.name
@@ -129,11 +192,12 @@ async def execute_device_checks(dut: AsyncDeviceUnderTest):
 async def run_tests(dut: AsyncDeviceUnderTest, log: Logger):
     device = dut.device
     dev_tc_dir = dut.testcases_dir
-    dut_name = f"{device.name:<16}"
 
     check_service_list = cv_check_list.get()
     service_list = cv_service_list.get()
 
+    tc_to_run = list()
+
     for ds_name, design_service in device.features.items():
         # Handle User provided service list, if provided; only execute the
         # features the User requested explicitly.
@@ -166,85 +230,142 @@ async def run_tests(dut: AsyncDeviceUnderTest, log: Logger):
                 # leaving it out for now.
                 continue
 
-            testcases = await testing_service.load(testcase_dir=dev_tc_dir)
+            tc_to_run.append((tc_name, testing_service))
 
-            if not len(testcases.checks):
-                # if the test file was generated with an empty set of tests,
-                # which could happen depending on the Developer of the testing
-                # service, then skill this and go onto the next one.
-                continue
+    # the results directory is created once, before any of the check
+    # collections are run, since they could be running concurrently.
 
-            try:
-                results = await dut.execute_checks(testcases)
-
-                # if the testing plugin returns None, then these tests are
-                # marked as "skipped"
-
-                if not results:
-                    results = [
-                        CheckResult[Check](
-                            device=device,
-                            status=CheckStatus.SKIP,
-                            check=Check(check_type="skip", expected_results={}),
-                            measurement=(
-                                f"Missing: device {device.name} support for "
-                                f"Checks: {tc_name}",
-                            ),
-                        )
-                    ]
-
-            except IndexError as exc:
-                tc_registry = dut.__class__.__dict__[
-                    "execute_checks"
-                ].dispatcher.registry
-                tc_type = type(testcases)
-                if not tc_registry.get(tc_type):
-                    log.error(
-                        f"{dut_name}: No DUT check processor for {tc_type.__name__}, skipping."
-                    )
-                    continue
-
-                raise exc
-
-            except Exception as exc:
-                import traceback
-
-                exc_info = traceback.format_tb(exc.__traceback__, -2)
-                trace_txt = "\n".join(exc_info)
-                log.critical(
-                    f"{dut_name}: Exception during exection: {repr(exc)}, aborting {tc_name}\n"
-                )
-                log.critical(f"{dut_name}: Trace: \n{trace_txt}")
-                continue
+    if tc_to_run:
+        (dev_tc_dir / "results").mkdir(exist_ok=True)
 
-            result_counts = Counter(r.status for r in results)
-            dut.result_counts.update(result_counts)
+    # run the check collections for this device.  By default the collections
+    # are run one at a time; the User can allow more than one collection to run
+    # in parallel on the same device if the DUT plugin supports doing so.
 
-            c_pass, c_fail, c_info, c_skip = (
-                result_counts[CheckStatus.PASS],
-                result_counts[CheckStatus.FAIL],
-                result_counts[CheckStatus.INFO],
-                result_counts[CheckStatus.SKIP],
-            )
+    async for _ in as_completed(
+        (
+            run_check_collection(dut, tc_name, testing_service, log)
+            for tc_name, testing_service in tc_to_run
+        ),
+        limit=cv_collection_limit.get(),
+    ):
+        pass
 
-            dev_resuls_dir = dev_tc_dir / "results"
-            dev_resuls_dir.mkdir(exist_ok=True)
 
-            if c_fail:
-                log.warning(
-                    f"{dut_name}: {FAIL_CLRD}\tChecks: {tc_name}: "
-                    f"PASS={c_pass}, FAIL={c_fail}, INFO={c_info}",
-                )
-            elif c_skip:
-                log.info(
-                    f"{dut_name}: {SKIP_CLRD}\tChecks: {tc_name}",
-                )
-            else:
-                log.info(
-                    f"{dut_name}: {PASS_CLRD}\tChecks: {tc_name}: "
-                    f"PASS={c_pass}, INFO={c_info}",
+async def run_check_collection(
+    dut: AsyncDeviceUnderTest, tc_name: str, testing_service, log: Logger
+):
+    device = dut.device
+    dev_tc_dir = dut.testcases_dir
+    dut_name = f"{device.name:<16}"
+    timeout = cv_collection_timeout.get()
+
+    testcases = await testing_service.load(testcase_dir=dev_tc_dir)
+
+    if not len(testcases.checks):
+        # if the test file was generated with an empty set of tests,
+        # which could happen depending on the Developer of the testing
+        # service, then skill this and go onto the next one.
+        return
+
+    try:
+        results = await asyncio.wait_for(dut.execute_checks(testcases), timeout)
+
+        # if the testing plugin returns None, then these tests are
+        # marked as "skipped"
+
+        if not results:
+            results = [
+                CheckResult[Check](
+                    device=device,
+                    status=CheckStatus.SKIP,
+                    check=Check(check_type="skip", expected_results={}),
+                    measurement=(
+                        f"Missing: device {device.name} support for "
+                        f"Checks: {tc_name}",
+                    ),
                 )
+            ]
 
-            await device_checks_save_results(
-                dut, tc_name, results, results_dir=dev_resuls_dir
+    except asyncio.TimeoutError:
+        log.error(
+            f"{dut_name}: {FAIL_CLRD}\tChecks: {tc_name}: "
+            f"Timeout after {timeout}s, aborting {tc_name}"
+        )
+        dut.result_counts[CheckStatus.FAIL] += 1
+
+        # remove the results of any prior execution so that they are not
+        # reported as the results of this execution.
+
+        await device_checks_remove_results(
+            dut,
+            tc_name,
+            results_dir=dev_tc_dir / "results",
+            results_db=CheckResultsDB.open(
+                checks_dir=dev_tc_dir.parent.parent, design_name=device.design.name
+            ),
+        )
+        return
+
+    except IndexError as exc:
+        tc_registry = dut.__class__.__dict__["execute_checks"].dispatcher.registry
+        tc_type = type(testcases)
+        if not tc_registry.get(tc_type):
+            log.error(
+                f"{dut_name}: No DUT check processor for {tc_type.__name__}, skipping."
             )
+            return
+
+        raise exc
+
+    except Exception as exc:
+        import traceback
+
+        exc_info = traceback.format_tb(exc.__traceback__, -2)
+        trace_txt = "\n".join(exc_info)
+        log.critical(
+            f"{dut_name}: Exception during exection: {repr(exc)}, aborting {tc_name}\n"
+        )
+        log.critical(f"{dut_name}: Trace: \n{trace_txt}")
+        return
+
+    result_counts = Counter(r.status for r in results)
+    dut.result_counts.update(result_counts)
+
+    c_pass, c_fail, c_info, c_skip = (
+        result_counts[CheckStatus.PASS],
+        result_counts[CheckStatus.FAIL],
+        result_counts[CheckStatus.INFO],
+        result_counts[CheckStatus.SKIP],
+    )
+
+    if c_fail:
+        log.warning(
+            f"{dut_name}: {FAIL_CLRD}\tChecks: {tc_name}: "
+            f"PASS={c_pass}, FAIL={c_fail}, INFO={c_info}",
+        )
+    elif c_skip:
+        log.info(
+            f"{dut_name}: {SKIP_CLRD}\tChecks: {tc_name}",
+        )
+    else:
+        log.info(
+            f"{dut_name}: {PASS_CLRD}\tChecks: {tc_name}: "
+            f"PASS={c_pass}, INFO={c_info}",
+        )
+
+    # the device checks directory is "<checks-dir>/<design>/<device>", and the
+    # design results database is stored in the design directory.
+
+    results_db = CheckResultsDB.open(
+        checks_dir=dev_tc_dir.parent.parent, design_name=device.design.name
+    )
+
+    await device_checks_save_results(
+        dut,
+        tc_name,
+        results,
+        results_dir=dev_tc_dir / "results",
+        results_format=cv_results_format.get(),
+        results_db=results_db,
+    )
@@ -5,29 +5,24 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-import json
-from typing import List
+from typing import List, Optional
 from pathlib import Path
-
-
-# -----------------------------------------------------------------------------
-# Public Imports
-# -----------------------------------------------------------------------------
-
-import aiofiles
+import asyncio
 
 # -----------------------------------------------------------------------------
 # Private Imports
 # -----------------------------------------------------------------------------
 
 from netcad.checks import CheckResult
+from netcad.checks.check_results_file import ResultsFormat, ResultsFileWriter
+from netcad.checks.check_results_db import CheckResultsDB
 from .dut import AsyncDeviceUnderTest
 
 # -----------------------------------------------------------------------------
 # Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["device_checks_save_results"]
+__all__ = ["device_checks_save_results", "device_checks_remove_results"]
 
 
 async def device_checks_save_results(
@@ -35,32 +30,101 @@ async def device_checks_save_results(
     filename: str,
     results: List[CheckResult],
     results_dir: Path,
+    results_format: ResultsFormat = ResultsFormat.json,
+    results_db: Optional[CheckResultsDB] = None,
 ):
     """
-    This function saves the testcase results to a JSON file.
+    This function saves the testcase results to a results file.  Each result
+    is serialized and written to the file in turn, rather than first creating
+    the complete JSON payload of the results.
+
+    When the results database is provided, the serialized results are also
+    collected as the database rows, and the rows are written to the database by
+    a worker thread so that the database write does not block the checks of
+    the other devices.
+
     Parameters
     ----------
     dut:
         The device under test.
 
     filename:
-        The name of the JSON file to save, without the .json extension.
+        The name of the results file to save, without the file extension.
 
     results:
         The list of testcase results.
 
     results_dir:
-        The Path instance where the JSON file will be stored to the filesystem.
+        The Path instance where the results file will be stored to the
+        filesystem.
+
+    results_format:
+        The results file format, JSON (default) or NDJSON.
 
+    results_db: optional
+        When provided, the results are also stored into the design results
+        database, replacing any prior results for this device and check
+        collection.
     """
-    results_file = results_dir / f"{filename}.json"
-    json_payload = list()
+    dev_name = dut.device.name
+    db_rows = list()
+
+    # the results are serialized by pydantic directly to JSON, rather than
+    # to the payload dict and then to JSON.  The compact JSON is serialized
+    # once, and used for both the NDJSON file and the database rows.
+
+    async with ResultsFileWriter(results_dir, filename, results_format) as writer:
+        compact = results_db or writer.format == ResultsFormat.ndjson
+
+        for res in results:
+            res.device = dev_name
+            res.check_id = res.check.check_id()
+            payload = res.model_dump_json(warnings="none") if compact else None
+            await writer.write_model(res, payload)
+
+            if results_db:
+                db_rows.append(
+                    (
+                        res.check.check_type,
+                        res.check_id,
+                        str(res.status),
+                        res.field,
+                        payload,
+                    )
+                )
+
+    if results_db:
+        await asyncio.to_thread(results_db.save_rows, dev_name, filename, db_rows)
+
+
+async def device_checks_remove_results(
+    dut: AsyncDeviceUnderTest,
+    filename: str,
+    results_dir: Path,
+    results_db: Optional[CheckResultsDB] = None,
+):
+    """
+    This function removes the prior testcase results, in any results format,
+    for example when the checks could not be executed.  This way the prior
+    results are not reported as the current results.
+
+    Parameters
+    ----------
+    dut:
+        The device under test.
 
-    for res in results:
-        res.device = dut.device.name
-        payload = res.model_dump(warnings="none")
-        payload["check_id"] = res.check.check_id()
-        json_payload.append(payload)
+    filename:
+        The name of the results file, without the file extension.
+
+    results_dir:
+        The Path instance where the results file is stored.
+
+    results_db: optional
+        When provided, the results are also removed from the design results
+        database.
+    """
+    for fmt in ResultsFormat:
+        (results_dir / f"{filename}.{fmt}").unlink(missing_ok=True)
 
-    async with aiofiles.open(results_file, "w+") as ofile:
-        await ofile.write(json.dumps(json_payload, indent=3))
+    if results_db:
+        await asyncio.to_thread(results_db.save_rows, dut.device.name, filename, ())
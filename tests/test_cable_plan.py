@@ -0,0 +1,144 @@
+import pickle
+
+import pytest
+
+from netcad.cabling import CablePlanner
+from netcad.device import Device, DeviceType, DeviceTypeRegistry
+from netcad.device.device_type import DeviceInterfaceType
+
+# -----------------------------------------------------------------------------
+# a device-type with four ethernet ports, and the cable planners that cable
+# the ports of the devices by the cable-id; one using add_endpoint, and one
+# that changes the cables directly.
+# -----------------------------------------------------------------------------
+
+PRODUCT_MODEL = "TEST-CABLING"
+
+DeviceTypeRegistry.registry_add(
+    PRODUCT_MODEL,
+    DeviceType(
+        model=PRODUCT_MODEL,
+        product_model=PRODUCT_MODEL,
+        interfaces={
+            f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+            for port in range(1, 5)
+        },
+    ),
+)
+
+
+class CableSwitch(Device):
+    os_name = "eos"
+    product_model = PRODUCT_MODEL
+
+
+CableSwitch.init_device_spec()
+
+
+class EndpointCabler(CablePlanner):
+    def build(self):
+        for device in sorted(self.devices, key=lambda dev: dev.name):
+            for iface in device.interfaces.values():
+                if iface.cable_id:
+                    self.add_endpoint(iface.cable_id, iface)
+
+        return self.validate()
+
+
+class DirectCabler(CablePlanner):
+    def build(self):
+        for device in sorted(self.devices, key=lambda dev: dev.name):
+            for iface in device.interfaces.values():
+                if iface.cable_id:
+                    self.cables[iface.cable_id].add(iface)
+
+        return self.validate()
+
+
+@pytest.fixture()
+def devices():
+    switch1, switch2, switch3 = (
+        CableSwitch(name) for name in ("switch1", "switch2", "switch3")
+    )
+
+    # switch1 is cabled to switch2 and switch3; Ethernet4 is not cabled.
+
+    switch1.interfaces["Ethernet1"].cable_id = "cable-1-2"
+    switch2.interfaces["Ethernet1"].cable_id = "cable-1-2"
+    switch1.interfaces["Ethernet2"].cable_id = "cable-1-3"
+    switch3.interfaces["Ethernet1"].cable_id = "cable-1-3"
+    switch2.interfaces["Ethernet2"].cable_id = "cable-2-3"
+    switch3.interfaces["Ethernet2"].cable_id = "cable-2-3"
+
+    yield switch1, switch2, switch3
+
+    for name in ("switch1", "switch2", "switch3"):
+        Device.registry_remove(name)
+
+
+@pytest.fixture(params=[EndpointCabler, DirectCabler])
+def cabler(request, devices):
+    cabler = request.param(name="test-cabling")
+    cabler.add_devices(*devices)
+    assert cabler.build() == 3
+
+    yield cabler
+
+    CablePlanner.registry_remove("test-cabling")
+
+
+def test_cable_plan_find_cables_by_device(cabler, devices):
+    switch1, switch2, switch3 = devices
+
+    assert [
+        (cable_id, {(iface.device.name, iface.name) for iface in ends})
+        for cable_id, ends in CablePlanner.find_cables_by_device(switch1)
+    ] == [
+        ("cable-1-2", {("switch1", "Ethernet1"), ("switch2", "Ethernet1")}),
+        ("cable-1-3", {("switch1", "Ethernet2"), ("switch3", "Ethernet1")}),
+    ]
+
+    assert [
+        cable_id for cable_id, _ in CablePlanner.find_cables_by_device(switch3)
+    ] == [
+        "cable-1-3",
+        "cable-2-3",
+    ]
+
+
+def test_cable_plan_cable_peers(cabler, devices):
+    switch1, switch2, switch3 = devices
+
+    assert cabler.cable_peers(switch1.interfaces["Ethernet1"]) == {
+        switch2.interfaces["Ethernet1"]
+    }
+    assert cabler.cable_peers(switch3.interfaces["Ethernet2"]) == {
+        switch2.interfaces["Ethernet2"]
+    }
+    assert cabler.cable_peers(switch1.interfaces["Ethernet4"]) == set()
+
+
+def test_cable_plan_clear_cables(cabler, devices):
+    switch1 = devices[0]
+    cabler.clear_cables()
+
+    assert not cabler.cables
+    assert CablePlanner.find_cables_by_device(switch1) == []
+    assert cabler.cable_peers(switch1.interfaces["Ethernet1"]) == set()
+
+
+def test_cable_plan_pickle(cabler):
+    # the indexes are not pickled, and are rebuilt from the cables.
+
+    state = cabler.__getstate__()
+    assert "device_cables" not in state
+    assert "interface_cables" not in state
+
+    restored = pickle.loads(pickle.dumps(cabler))
+    if_a, if_b = sorted(
+        restored.cables["cable-1-2"], key=lambda iface: iface.device.name
+    )
+
+    assert restored.cable_peers(if_a) == {if_b}
+    assert list(restored.device_cables[if_a.device]) == ["cable-1-2", "cable-1-3"]
+    assert list(restored.device_cables[if_b.device]) == ["cable-1-2", "cable-2-3"]
@@ -0,0 +1,72 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from netcad.checks import CheckStatus, LazyCheckResult
+
+
+class StandInCollection:
+    n_parsed = 0
+
+    @classmethod
+    def parse_result(cls, payload: dict):
+        cls.n_parsed += 1
+        return SimpleNamespace(**payload, logs=["parsed"])
+
+
+PAYLOAD = {
+    "device": "dev1",
+    "check": {"check_type": "interfaces"},
+    "check_id": "interfaces-Ethernet1",
+    "status": "FAIL",
+    "measurement": {"speed": 1000},
+}
+
+
+@pytest.fixture()
+def collection():
+    StandInCollection.n_parsed = 0
+    return StandInCollection
+
+
+def test_lazy_result_ids_not_parsed(collection):
+    res = LazyCheckResult.from_dict(collection, PAYLOAD)
+
+    assert res.device == "dev1"
+    assert res.check_type == "interfaces"
+    assert res.check_id == "interfaces-Ethernet1"
+    assert res.status == CheckStatus.FAIL
+    assert "interfaces-Ethernet1" in repr(res)
+    assert collection.n_parsed == 0
+
+
+def test_lazy_result_delegates_attrs(collection):
+    res = LazyCheckResult(
+        collection,
+        json.dumps(PAYLOAD),
+        device="dev1",
+        check_type="interfaces",
+        check_id="interfaces-Ethernet1",
+        status="FAIL",
+    )
+
+    # the result is parsed on the first use of a CheckResult attribute, and
+    # only once.
+
+    assert res.measurement == {"speed": 1000}
+    assert res.logs == ["parsed"]
+    assert res.result.check == {"check_type": "interfaces"}
+    assert collection.n_parsed == 1
+
+    with pytest.raises(AttributeError):
+        _ = res.not_an_attribute
+
+
+def test_lazy_result_private_attrs_not_delegated(collection):
+    res = LazyCheckResult.from_dict(collection, PAYLOAD)
+
+    with pytest.raises(AttributeError):
+        _ = res.__deepcopy__
+
+    assert collection.n_parsed == 0
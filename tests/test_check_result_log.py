@@ -0,0 +1,134 @@
+import contextvars
+import json
+
+import pytest
+from rich.console import Console
+
+from netcad.checks import CheckResult, CheckStatus
+from netcad.checks.check_result_log import (
+    CheckResultLogs,
+    LogColumns,
+    cv_log_pass_details,
+    PASS_COUNT_FIELD,
+)
+from netcad.feats.topology.checks.check_interfaces import (
+    InterfaceCheck,
+    InterfaceCheckParams,
+    InterfaceCheckResult,
+    InterfaceCheckUsedExpectations,
+)
+
+
+def interface_result() -> InterfaceCheckResult:
+    check = InterfaceCheck(
+        check_params=InterfaceCheckParams(interface="Ethernet1", interface_flags=None),
+        expected_results=InterfaceCheckUsedExpectations(
+            used=True, desc="uplink", oper_up=True, speed=100_000
+        ),
+    )
+    return InterfaceCheckResult(
+        device="switch1",
+        check=check,
+        measurement=dict(used=True, desc="uplink", oper_up=False, speed=100_000),
+    ).measure()
+
+
+def test_check_result_logs_round_trip():
+    result = interface_result()
+    logs = result.logs
+
+    assert result.status == CheckStatus.FAIL
+    assert ["FAIL", "oper_up", {"expected": True, "measured": False}] in (
+        logs.model_dump()
+    )
+
+    payload = json.loads(result.model_dump_json())
+    loaded = CheckResultLogs.model_validate(payload["logs"])
+
+    assert loaded == logs
+    assert loaded.model_dump() == payload["logs"]
+
+
+def test_check_result_logs_no_pass_details():
+    def measure():
+        cv_log_pass_details.set(False)
+        return interface_result()
+
+    logs = contextvars.copy_context().run(measure).logs
+    rows = logs.model_dump()
+
+    # only the number of the PASS fields is stored, the FAIL field details are
+    # stored as usual.
+
+    assert [CheckStatus.PASS, PASS_COUNT_FIELD, 3] in logs.root
+    assert not [row for row in rows if row[0] == "PASS" and row[1] != PASS_COUNT_FIELD]
+    assert ["FAIL", "oper_up", {"expected": True, "measured": False}] in rows
+    assert CheckResultLogs.model_validate(rows).root.pass_count == 3
+
+
+def test_check_result_logs_root_sequence():
+    logs = CheckResultLogs()
+    logs.FAIL("speed", 1000)
+
+    # the code that used the list of log entries is not changed.
+
+    logs.root.append(["INFO", "desc", {"note": "text"}])
+    logs.root.append([CheckStatus.PASS, "used", {"expected": True, "measured": True}])
+
+    assert isinstance(logs.root, LogColumns)
+    assert len(logs.root) == 3
+    assert logs.root[0] == [CheckStatus.FAIL, "speed", 1000]
+    assert logs.root[-1] == [
+        CheckStatus.PASS,
+        "used",
+        {"expected": True, "measured": True},
+    ]
+    assert [field for _, field, _ in logs.root] == ["speed", "desc", "used"]
+    assert logs.root.measured[-1] is True
+
+
+def test_check_result_logs_root_index():
+    columns = LogColumns(pass_details=False)
+    columns.add(CheckStatus.FAIL, "speed", 1000, 100)
+    columns.add(CheckStatus.PASS, "used", True, True)
+    columns.add(CheckStatus.INFO, "desc", "uplink")
+
+    entries = list(columns)
+
+    # the entries are read from the columns, and are the same as the entries
+    # of the expanded list; including the PASS count entry.
+
+    assert len(entries) == len(columns) == 3
+    assert [columns[index] for index in range(-3, 3)] == entries + entries
+    assert columns[0] == [
+        CheckStatus.FAIL,
+        "speed",
+        {"expected": 1000, "measured": 100},
+    ]
+    assert columns[-1] == [CheckStatus.PASS, PASS_COUNT_FIELD, 1]
+    assert columns[1:] == entries[1:]
+    assert columns[::-1] == entries[::-1]
+
+    for index in (3, -4):
+        with pytest.raises(IndexError):
+            columns[index]  # noqa
+
+
+def test_check_result_logs_json_schema():
+    schema = CheckResult.model_json_schema()
+    assert schema["$defs"]["CheckResultLogs"]["type"] == "array"
+
+
+def test_check_result_logs_pretty_table():
+    table = interface_result().logs.pretty_table()
+
+    console = Console(width=120, record=True)
+    console.print(table)
+    lines = console.export_text().splitlines()
+
+    # the FAIL entries are shown first, and the PASS entries show the expected
+    # value.
+
+    assert table.row_count == 4
+    assert lines[0].split()[:2] == ["FAIL", "oper_up"]
+    assert any(line.split() == ["PASS", "speed", "100000"] for line in lines)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from netcad.checks.check_results_db import CheckResultsDB
+from netcad.checks.check_results_file import ResultsFileWriter
+from netcam.cli.show_checks.device_results import (
+    device_results,
+    device_results_counts,
+)
+
+
+def payload(status, field, check_type="interfaces"):
+    return {
+        "status": status,
+        "field": field,
+        "check_id": f"{check_type}-{field}",
+        "check": {"check_type": check_type},
+    }
+
+
+PAYLOADS = [
+    payload("PASS", "speed"),
+    payload("FAIL", "speed"),
+    payload("FAIL", "desc"),
+    payload("INFO", None),
+    payload("FAIL", None),
+]
+
+OPTIONALS = dict(
+    include_all=False,
+    pass_only=False,
+    include_info=False,
+    include_pass=False,
+    include_fields=(),
+    exclude_fields=(),
+)
+
+
+@pytest.fixture()
+def results_db(tmp_path):
+    results_db = CheckResultsDB.open(tmp_path, "design")
+    results_db.save_results("dev1", "interfaces", PAYLOADS)
+    results_db.save_results("dev2", "interfaces", PAYLOADS[:2])
+    yield results_db
+    CheckResultsDB.close_all()
+
+
+def test_results_db_save_replaces(results_db):
+    assert results_db.stored() == {("dev1", "interfaces"), ("dev2", "interfaces")}
+
+    results_db.save_rows("dev2", "interfaces", ())
+    assert results_db.stored() == {("dev1", "interfaces")}
+    assert list(results_db.query(devices=["dev2"])) == []
+    assert list(results_db.query(devices=["dev1"])) == PAYLOADS
+
+
+def test_results_db_query_filters(results_db):
+    def fields(**filters):
+        return [res["field"] for res in results_db.query(devices=["dev1"], **filters)]
+
+    assert fields(statuses=["FAIL"]) == ["speed", "desc", None]
+    assert fields(include_fields=["speed"]) == ["speed", "speed"]
+
+    # the results without a field are not excluded by the field names.
+    assert fields(exclude_fields=["speed"]) == ["desc", None, None]
+    assert fields(statuses=["FAIL"], exclude_fields=["speed", "desc"]) == [None]
+
+    assert list(results_db.query_rows(("device",), check_types=["other"])) == []
+
+
+def test_results_db_status_counts(results_db):
+    assert sorted(results_db.status_counts()) == [
+        ("dev1", "interfaces", "FAIL", 3),
+        ("dev1", "interfaces", "INFO", 1),
+        ("dev1", "interfaces", "PASS", 1),
+        ("dev2", "interfaces", "FAIL", 1),
+        ("dev2", "interfaces", "PASS", 1),
+    ]
+    assert dict(results_db.status_counts(group_by=(), statuses=["FAIL"])) == {"FAIL": 4}
+
+
+def test_results_db_save_from_thread(results_db):
+    asyncio.run(asyncio.to_thread(results_db.save_results, "dev3", "lags", PAYLOADS))
+    assert len(list(results_db.query(devices=["dev3"], collections=["lags"]))) == 5
+
+
+@pytest.mark.parametrize(
+    "optionals",
+    [
+        {},
+        {"include_all": True},
+        {"pass_only": True},
+        {"include_info": True, "exclude_fields": ("speed",)},
+        {"include_pass": True, "include_fields": ("speed",)},
+    ],
+)
+def test_show_device_results_db(tmp_path, results_db, optionals):
+    optionals = {**OPTIONALS, **optionals}
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+
+    async def write_file():
+        async with ResultsFileWriter(results_dir, "interfaces") as writer:
+            await writer.write_all(PAYLOADS)
+
+    asyncio.run(write_file())
+
+    # the show commands filter the results in the database the same as the
+    # results in the results file.
+
+    db_device = SimpleNamespace(name="dev1", results_db=results_db, tcr_dir=None)
+    file_device = SimpleNamespace(name="dev1", results_db=None, tcr_dir=results_dir)
+
+    from_db = device_results(db_device, "interfaces", optionals)
+    from_file = device_results(file_device, "interfaces", optionals)
+
+    assert json.dumps(from_db) == json.dumps(from_file)
+    assert device_results_counts(
+        db_device, "interfaces", optionals
+    ) == device_results_counts(file_device, "interfaces", optionals)
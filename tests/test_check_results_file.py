@@ -0,0 +1,117 @@
+from typing import ClassVar
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from netcad.checks.check_results_file import (
+    ResultsFormat,
+    ResultsFileWriter,
+    iter_results_file,
+    results_filepath,
+)
+
+PAYLOADS = [
+    {"status": "PASS", "field": f"field{num}", "value": num} for num in range(5)
+]
+
+
+class Result(BaseModel):
+    status: str
+    field: str
+    value: int
+
+
+class CountedResult(Result):
+    n_dumps: ClassVar[int] = 0
+
+    def model_dump_json(self, **kwargs) -> str:
+        CountedResult.n_dumps += 1
+        return super().model_dump_json(**kwargs)
+
+
+async def write_results(results_dir, fmt, chunk_size=None):
+    writer = ResultsFileWriter(results_dir, "checks", fmt)
+    if chunk_size:
+        writer.CHUNK_SIZE = chunk_size
+
+    async with writer:
+        await writer.write_all(PAYLOADS[:2])
+        for payload in PAYLOADS[2:]:
+            await writer.write_model(Result(**payload))
+
+    return writer.filepath
+
+
+@pytest.mark.parametrize("fmt", list(ResultsFormat))
+@pytest.mark.parametrize("chunk_size", [None, 10])
+def test_results_file_round_trip(tmp_path, fmt, chunk_size):
+    filepath = asyncio.run(write_results(tmp_path, fmt, chunk_size))
+
+    assert filepath.name == f"checks.{fmt}"
+    assert results_filepath(tmp_path, "checks") == filepath
+    assert list(iter_results_file(filepath)) == PAYLOADS
+
+    if fmt == ResultsFormat.json:
+        assert json.loads(filepath.read_text()) == PAYLOADS
+        assert filepath.read_text() == json.dumps(PAYLOADS, indent=3)
+    else:
+        assert len(filepath.read_text().splitlines()) == len(PAYLOADS)
+
+
+def test_results_file_empty(tmp_path):
+    async def run():
+        async with ResultsFileWriter(tmp_path, "checks") as writer:
+            pass
+        return writer.filepath
+
+    assert list(iter_results_file(asyncio.run(run()))) == []
+
+
+def test_results_file_replaces_other_format(tmp_path):
+    asyncio.run(write_results(tmp_path, ResultsFormat.json))
+    filepath = asyncio.run(write_results(tmp_path, ResultsFormat.ndjson))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [filepath.name]
+
+
+def test_results_file_error_not_finalized(tmp_path):
+    asyncio.run(write_results(tmp_path, ResultsFormat.json))
+
+    async def run():
+        async with ResultsFileWriter(tmp_path, "checks") as writer:
+            await writer.write(PAYLOADS[0])
+            raise RuntimeError("crashed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+    # neither a truncated file, nor the prior results file, remain.
+    assert list(tmp_path.iterdir()) == []
+    assert results_filepath(tmp_path, "checks") is None
+
+
+@pytest.mark.parametrize("fmt", list(ResultsFormat))
+def test_results_file_serialized_payload(tmp_path, fmt):
+    results = [CountedResult(**payload) for payload in PAYLOADS]
+    payloads = [json.dumps(payload, separators=(",", ":")) for payload in PAYLOADS]
+    CountedResult.n_dumps = 0
+
+    async def run():
+        async with ResultsFileWriter(tmp_path, "checks", fmt) as writer:
+            for result, payload in zip(results, payloads):
+                await writer.write_model(result, payload)
+        return writer.filepath
+
+    filepath = asyncio.run(run())
+    assert list(iter_results_file(filepath)) == PAYLOADS
+
+    # the serialized payload is written as is to the NDJSON file, only the
+    # pretty-printed JSON file serializes the results again.
+
+    if fmt == ResultsFormat.ndjson:
+        assert CountedResult.n_dumps == 0
+        assert filepath.read_text().splitlines() == payloads
+    else:
+        assert CountedResult.n_dumps == len(PAYLOADS)
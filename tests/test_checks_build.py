@@ -0,0 +1,121 @@
+from typing import ClassVar, List, Optional
+import json
+
+import pytest
+
+from netcad.checks import CheckCollection
+from netcad.checks.checks_build import build_device_checks, FEATURE_CHECKS_FILENAME
+from netcad.checks.checks_file import ChecksCompression
+from netcad.feats.topology.checks.check_interfaces import (
+    InterfaceCheck,
+    InterfaceCheckParams,
+    InterfaceCheckUsedExpectations,
+)
+
+# the check collection classes require the module __all__, which is used to
+# find the check-result types of the collection.
+
+__all__ = ["PortsCheckCollection", "SavedCheckCollection"]
+
+# -----------------------------------------------------------------------------
+# stand-in devices with a feature of two check collections; one is saved by
+# the default save, and one overrides the save coroutine, in the form used
+# before the check files options were added.
+# -----------------------------------------------------------------------------
+
+
+class PortsCheckCollection(CheckCollection):
+    name: ClassVar[str] = "ports"
+    checks: Optional[List[InterfaceCheck]]
+
+    @classmethod
+    def build(cls, device, **kwargs):
+        return cls(
+            device=device.name,
+            checks=[
+                InterfaceCheck(
+                    check_params=InterfaceCheckParams(
+                        interface=f"Ethernet{port}", interface_flags=None
+                    ),
+                    expected_results=InterfaceCheckUsedExpectations(
+                        used=True,
+                        desc=f"{device.name} port {port}",
+                        oper_up=True,
+                        speed=100_000,
+                    ),
+                )
+                for port in range(1, 5)
+            ],
+        )
+
+
+class SavedCheckCollection(CheckCollection):
+    name: ClassVar[str] = "saved"
+
+    @classmethod
+    def build(cls, device, **kwargs):
+        return cls(device=device.name)
+
+    async def save(self, testcase_dir):
+        filepath = testcase_dir / f"{self.name}.custom"
+        filepath.write_text(self.model_dump_json())
+        return filepath
+
+
+class StandInFeature:
+    name = "stand-in"
+    check_collections = [PortsCheckCollection, SavedCheckCollection]
+
+
+class StandInDesign:
+    name = "test-build"
+
+
+class StandInDevice:
+    def __init__(self, name: str):
+        self.name = name
+        self.design = StandInDesign()
+        self.features = {StandInFeature.name: StandInFeature()}
+
+
+DEVICES = [StandInDevice(f"switch{num}") for num in range(1, 6)]
+
+
+def build_checks(checks_dir, workers: int, **options) -> dict:
+    builds = list(
+        build_device_checks(DEVICES, checks_dir=checks_dir, workers=workers, **options)
+    )
+    assert [device.name for device, _ in builds] == [dev.name for dev in DEVICES]
+
+    return {
+        str(filepath.relative_to(checks_dir)): filepath.read_bytes()
+        for filepath in sorted(checks_dir.rglob("*"))
+        if filepath.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    "compression", [ChecksCompression.none, ChecksCompression.gzip]
+)
+def test_checks_build_workers_same_output(tmp_path, compression):
+    serial = build_checks(tmp_path / "serial", 1, pretty=True, compression=compression)
+    pooled = build_checks(tmp_path / "pooled", 2, pretty=True, compression=compression)
+
+    assert serial == pooled
+    assert len(serial) == len(DEVICES) * 3
+
+
+def test_checks_build_save_override(tmp_path):
+    files = build_checks(tmp_path, 1)
+
+    # the collection that overrides save is saved by the override, the other
+    # collections by the default save.
+
+    assert json.loads(files["test-build/switch1/saved.custom"]) == {
+        "device": "switch1",
+        "exclusive": True,
+        "checks": [],
+    }
+    assert "test-build/switch1/ports.json" in files
+    assert "test-build/switch1/saved.json" not in files
+    assert b"saved" in files[f"test-build/switch1/{FEATURE_CHECKS_FILENAME}"]
@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import pytest
+
+from netcad.checks.checks_file import (
+    ChecksCompression,
+    checks_filepath,
+    read_checks_file,
+    write_checks_file,
+)
+
+CONTENT = json.dumps([{"check_type": "interfaces", "check_id": "Ethernet1"}]).encode()
+
+
+def compressions() -> list:
+    # the zstd compression requires the optional zstandard package.
+    return [
+        pytest.param(
+            comp,
+            marks=pytest.mark.skipif(
+                comp == ChecksCompression.zstd and not has_zstandard(),
+                reason="zstandard not installed",
+            ),
+        )
+        for comp in ChecksCompression
+    ]
+
+
+def has_zstandard() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("compression", compressions())
+def test_checks_file_round_trip(tmp_path, compression):
+    filepath = write_checks_file(tmp_path, "interfaces", CONTENT, compression)
+
+    assert filepath.name == f"interfaces{compression.suffix}"
+    assert checks_filepath(tmp_path, "interfaces") == filepath
+    assert asyncio.run(read_checks_file(filepath)) == CONTENT
+
+    if compression != ChecksCompression.none:
+        assert filepath.read_bytes() != CONTENT
+
+
+@pytest.mark.parametrize("compression", compressions())
+def test_checks_file_removes_other_compressions(tmp_path, compression):
+    for other in ChecksCompression:
+        (tmp_path / f"interfaces{other.suffix}").write_bytes(b"stale")
+
+    filepath = write_checks_file(tmp_path, "interfaces", CONTENT, compression)
+
+    assert [path.name for path in tmp_path.iterdir()] == [filepath.name]
+    assert asyncio.run(read_checks_file(checks_filepath(tmp_path, "interfaces"))) == (
+        CONTENT
+    )
+
+
+@pytest.mark.parametrize("compression", compressions())
+def test_checks_file_same_content(tmp_path, compression, monkeypatch):
+    first = write_checks_file(tmp_path, "interfaces", CONTENT, compression)
+    first_bytes = first.read_bytes()
+
+    # the file written later with the same content has the same bytes.
+
+    monkeypatch.setattr("time.time", lambda: 2_000_000_000.0)
+    second = write_checks_file(tmp_path, "interfaces", CONTENT, compression)
+
+    assert second.read_bytes() == first_bytes
+
+
+def test_checks_file_missing(tmp_path):
+    filepath = checks_filepath(tmp_path, "interfaces")
+    assert filepath == tmp_path / "interfaces.json"
+    assert not filepath.exists()
+
+
+@pytest.mark.skipif(has_zstandard(), reason="zstandard installed")
+def test_checks_file_zstd_not_installed(tmp_path):
+    with pytest.raises(RuntimeError, match="zstd"):
+        write_checks_file(tmp_path, "interfaces", CONTENT, ChecksCompression.zstd)
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,109 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# -----------------------------------------------------------------------------
+# the CLI help is run in a new interpreter so that the imported modules are
+# only those imported by the CLI.
+# -----------------------------------------------------------------------------
+
+HELP_IMPORTS = """
+import sys, json
+from click.testing import CliRunner
+from {package}.cli import cli
+
+result = CliRunner().invoke(cli, {args!r})
+print(json.dumps(dict(output=result.output, modules=sorted(sys.modules))))
+"""
+
+
+# the budget for the cumulative time to import the CLI, in seconds.  The CLI
+# imported all of the command modules in about 1.0s on the reference host,
+# and imports the lazy command groups in about 0.5s.
+
+IMPORT_TIME_BUDGET = 0.85
+
+
+def run_help(package: str, args: list) -> dict:
+    code = HELP_IMPORTS.format(package=package, args=args)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(proc.stdout)
+
+
+def import_time(package: str) -> float:
+    """
+    Returns the cumulative time, in seconds, of the top-level imports done by
+    importing the package CLI; as reported by the interpreter importtime
+    option.  The least of a few runs is used, so that the time is not that of
+    a run slowed by other work on the host.
+    """
+    times = list()
+
+    for _ in range(3):
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                f"from {package}.cli import cli",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # import time: self [us] | cumulative | imported package; the nested
+        # imports are indented, and are included in the cumulative time of
+        # the top-level import.
+
+        times.append(
+            sum(
+                int(cumulative)
+                for line in proc.stderr.splitlines()
+                if line.startswith("import time:")
+                for _, cumulative, name in [line.split("|")]
+                if cumulative.strip().isdigit() and not name.startswith("  ")
+            )
+            / 1e6
+        )
+
+    return min(times)
+
+
+@pytest.mark.parametrize("package", ["netcad", "netcam"])
+def test_cli_import_time_budget(package):
+    assert import_time(package) < IMPORT_TIME_BUDGET
+
+
+def test_netcad_help_lazy():
+    result = run_help("netcad", ["build", "--help"])
+
+    for name in ("checks", "configs", "hostsfile"):
+        assert name in result["output"]
+
+    modules = set(result["modules"])
+    assert "maya" not in modules
+    assert "netcad.cli.cli_build_checks" not in modules
+    assert "netcad.cli.cli_build_configs" not in modules
+
+
+def test_netcam_help_lazy():
+    result = run_help("netcam", ["--help"])
+
+    for name in ("check", "config", "services", "show"):
+        assert name in result["output"]
+
+    modules = set(result["modules"])
+    assert "netcam.cli.cli_check_devices" not in modules
+    assert "netcam.cli.services.clig_services" not in modules
+
+
+def test_lazy_command_imported_on_use():
+    result = run_help("netcad", ["build", "checks", "--help"])
+    assert "Build device test cases" in result["output"]
+    assert "netcad.cli.cli_build_checks" in result["modules"]
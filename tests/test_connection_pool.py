@@ -0,0 +1,183 @@
+import asyncio
+
+import asyncssh
+
+from netcam.connection_pool import (
+    get_connection_pool,
+    close_connection_pool,
+    PoolTransport,
+)
+
+# -----------------------------------------------------------------------------
+# local stand-in servers; each records the number of accepted connections.
+# -----------------------------------------------------------------------------
+
+
+class StandInHTTPServer:
+    def __init__(self):
+        self.n_connections = 0
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.n_connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                    b"Connection: keep-alive\r\n\r\nok"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+
+class StandInSSHServer(asyncssh.SSHServer):
+    n_connections = 0
+
+    def connection_made(self, conn):
+        StandInSSHServer.n_connections += 1
+
+    def begin_auth(self, username):
+        return True
+
+    def password_auth_supported(self):
+        return True
+
+    def validate_password(self, username, password):
+        return password == "secret"
+
+
+async def _echo_process(process):
+    process.stdout.write(process.command)
+    process.exit(0)
+
+
+def test_connection_pool_http_reuse():
+    async def run():
+        server = StandInHTTPServer()
+        await server.start()
+
+        pool = get_connection_pool()
+        for _ in range(3):
+            async with pool.connection(
+                "http", "127.0.0.1", scheme="http", port=server.port
+            ) as client:
+                res = await client.get("/")
+                assert res.text == "ok"
+
+        await close_connection_pool()
+        await server.stop()
+        return server.n_connections
+
+    assert asyncio.run(run()) == 1
+
+
+def test_connection_pool_ssh_reuse():
+    async def run():
+        acceptor = await asyncssh.listen(
+            "127.0.0.1",
+            0,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            server_factory=StandInSSHServer,
+            process_factory=_echo_process,
+        )
+        port = acceptor.sockets[0].getsockname()[1]
+        conn_params = dict(
+            port=port, username="netcam", password="secret", known_hosts=None
+        )
+
+        async def run_command(command):
+            async with get_connection_pool().connection(
+                "ssh", "127.0.0.1", **conn_params
+            ) as conn:
+                return (await conn.run(command)).stdout
+
+        outputs = await asyncio.gather(*(run_command(f"cmd{n}") for n in range(4)))
+        outputs.append(await run_command("last"))
+
+        await close_connection_pool()
+        acceptor.close()
+        await acceptor.wait_closed()
+        return outputs
+
+    StandInSSHServer.n_connections = 0
+    assert asyncio.run(run()) == ["cmd0", "cmd1", "cmd2", "cmd3", "last"]
+    assert StandInSSHServer.n_connections == 1
+
+
+def test_connection_pool_host_limit():
+    class CountingTransport(PoolTransport, registry_name="test-exclusive"):
+        shared = False
+        n_open = 0
+
+        async def connect(self, host, **params):
+            CountingTransport.n_open += 1
+            return object()
+
+        async def close(self, conn):
+            pass
+
+    async def run():
+        pool = get_connection_pool()
+        pool.host_limit = 2
+        in_use = max_in_use = 0
+
+        async def use_conn():
+            nonlocal in_use, max_in_use
+            async with pool.connection("test-exclusive", "dev1"):
+                in_use += 1
+                max_in_use = max(max_in_use, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*(use_conn() for _ in range(6)))
+        await close_connection_pool()
+        return max_in_use
+
+    try:
+        assert asyncio.run(run()) == 2
+        assert CountingTransport.n_open == 2
+    finally:
+        PoolTransport.registry_remove("test-exclusive")
+
+
+def test_connection_pool_host_limit_reentrant():
+    class NestedTransport(PoolTransport, registry_name="test-nested"):
+        async def connect(self, host, **params):
+            return object()
+
+        async def close(self, conn):
+            pass
+
+    async def run():
+        pool = get_connection_pool()
+        pool.host_limit = 1
+
+        async def use_nested(name):
+            async with pool.connection("test-nested", "dev1"):
+                async with pool.connection("test-nested", "dev1", user=name):
+                    await asyncio.sleep(0.01)
+            return name
+
+        # a task does not wait on its own connection; the other task waits
+        # until both of the connections are released.
+
+        names = await asyncio.wait_for(
+            asyncio.gather(use_nested("a"), use_nested("b")), timeout=5
+        )
+        await close_connection_pool()
+        return names
+
+    try:
+        assert asyncio.run(run()) == ["a", "b"]
+    finally:
+        PoolTransport.registry_remove("test-nested")
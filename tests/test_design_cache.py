@@ -0,0 +1,164 @@
+import os
+import sys
+
+import pytest
+
+from netcad.config import netcad_globals, Environment
+from netcad.design import Design
+from netcad.design.design_cache import (
+    DesignSnapshot,
+    dumps_design,
+    loads_design,
+    registry_mark,
+    registry_added,
+)
+from netcad.device import Device, DeviceType, DeviceTypeRegistry
+from netcad.device.device_type import DeviceInterfaceType
+from netcad.device.profiles import InterfaceL3
+
+# -----------------------------------------------------------------------------
+# a device-type with two ethernet ports
+# -----------------------------------------------------------------------------
+
+PRODUCT_MODEL = "TEST-DESIGN-CACHE"
+
+DeviceTypeRegistry.registry_add(
+    PRODUCT_MODEL,
+    DeviceType(
+        model=PRODUCT_MODEL,
+        product_model=PRODUCT_MODEL,
+        interfaces={
+            f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+            for port in range(1, 3)
+        },
+    ),
+)
+
+
+class CacheSwitch(Device):
+    os_name = "eos"
+    product_model = PRODUCT_MODEL
+
+
+CacheSwitch.init_device_spec()
+
+
+def create_design(name: str) -> Design:
+    design = Design(name=name)
+
+    # a class-level change made when the design is created.
+    CacheSwitch.interfaces["Ethernet2"].profile = InterfaceL3(desc="template")
+
+    design.add_devices(CacheSwitch(f"{name}-switch1"))
+    return design
+
+
+@pytest.fixture()
+def cache_project(tmp_path, monkeypatch):
+    monkeypatch.setattr(netcad_globals, "g_netcad_cache_dir", tmp_path / ".netcad")
+    monkeypatch.setattr(netcad_globals, "g_netcad_project_dir", tmp_path)
+    monkeypatch.setattr(netcad_globals, "g_config", {})
+    monkeypatch.setenv(Environment.NETCAD_DESIGNCACHE, "1")
+    monkeypatch.delenv("TEST_DESIGN_CACHE", raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # a design package, a helper module outside of the package, and a data
+    # file used by the design.
+
+    (pkg_dir := tmp_path / "dcache_design").mkdir()
+    (pkg_dir / "__init__.py").write_text("import dcache_helper\n")
+    (tmp_path / "dcache_helper.py").write_text("NUM_LEAFS = 4\n")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "leafs.csv").write_text("leaf1\n")
+
+    import dcache_design  # noqa
+
+    yield tmp_path
+
+    for mod_name in ("dcache_design", "dcache_helper"):
+        sys.modules.pop(mod_name, None)
+
+    CacheSwitch.interfaces["Ethernet2"].profile = None
+    for name in ("dcache", "dcache-rt"):
+        Design.registry_remove(name)
+        Device.registry_remove(f"{name}-switch1")
+
+
+DESIGN_DECL = {
+    "name": "dcache",
+    "package": "dcache_design",
+    "cache-files": ["data/*.csv"],
+    "cache-envvars": ["TEST_DESIGN_CACHE"],
+}
+
+
+def make_snapshot() -> DesignSnapshot:
+    return DesignSnapshot("dcache", DESIGN_DECL["package"], DESIGN_DECL)
+
+
+def save_snapshot():
+    snapshot = make_snapshot()
+    snapshot.mark()
+    snapshot.save(create_design("dcache"))
+    assert make_snapshot().is_current()
+
+
+def test_design_cache_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(netcad_globals, "g_netcad_cache_dir", tmp_path)
+    monkeypatch.delenv(Environment.NETCAD_DESIGNCACHE, raising=False)
+    assert not DesignSnapshot.enabled()
+
+    monkeypatch.setenv(Environment.NETCAD_DESIGNCACHE, "0")
+    assert not DesignSnapshot.enabled()
+
+    monkeypatch.setenv(Environment.NETCAD_DESIGNCACHE, "1")
+    assert DesignSnapshot.enabled()
+
+
+def test_design_cache_round_trip(cache_project):
+    mark = registry_mark()
+    design = create_design("dcache-rt")
+    data = dumps_design(design, registry_added(mark))
+
+    # as if loaded by a new process, the class template is not changed and
+    # the registry does not contain the design.
+
+    CacheSwitch.interfaces["Ethernet2"].profile = None
+    Design.registry_remove("dcache-rt")
+    Device.registry_remove("dcache-rt-switch1")
+
+    loaded = loads_design(data)
+    device = loaded.devices["dcache-rt-switch1"]
+
+    assert Design.registry_get("dcache-rt") is loaded
+    assert Device.registry_get("dcache-rt-switch1") is device
+    assert CacheSwitch.interfaces["Ethernet2"].profile.desc == "template"
+    assert device.interfaces["Ethernet2"].profile.desc == "template"
+    assert list(device.interfaces.used()) == ["Ethernet2"]
+
+
+def test_design_cache_load(cache_project):
+    save_snapshot()
+
+    design = make_snapshot().load()
+    assert design.name == "dcache"
+    assert list(design.devices) == ["dcache-switch1"]
+
+
+def test_design_cache_helper_module_changed(cache_project):
+    save_snapshot()
+    (cache_project / "dcache_helper.py").write_text("NUM_LEAFS = 16\n")
+    assert not make_snapshot().is_current()
+    assert make_snapshot().load() is None
+
+
+def test_design_cache_data_file_changed(cache_project):
+    save_snapshot()
+    (cache_project / "data" / "leafs.csv").write_text("leaf1\nleaf2\n")
+    assert not make_snapshot().is_current()
+
+
+def test_design_cache_envvar_changed(cache_project):
+    save_snapshot()
+    os.environ["TEST_DESIGN_CACHE"] = "changed"
+    assert not make_snapshot().is_current()
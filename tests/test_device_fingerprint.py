@@ -0,0 +1,97 @@
+from ipaddress import IPv4Interface
+
+import pytest
+
+from netcad.device import (
+    Device,
+    DeviceType,
+    DeviceTypeRegistry,
+    DeviceFingerprinter,
+)
+from netcad.device.device_type import DeviceInterfaceType
+from netcad.device.profiles import InterfaceL3
+
+# -----------------------------------------------------------------------------
+# two devices cabled Ethernet1 <-> Ethernet1; the device fingerprints do not
+# include the templates.
+# -----------------------------------------------------------------------------
+
+PRODUCT_MODEL = "TEST-FINGERPRINT"
+
+DeviceTypeRegistry.registry_add(
+    PRODUCT_MODEL,
+    DeviceType(
+        model=PRODUCT_MODEL,
+        product_model=PRODUCT_MODEL,
+        interfaces={
+            f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+            for port in range(1, 3)
+        },
+    ),
+)
+
+
+class FingerprintSwitch(Device):
+    os_name = "eos"
+    product_model = PRODUCT_MODEL
+
+
+FingerprintSwitch.init_device_spec()
+
+
+@pytest.fixture()
+def cabled_devices():
+    dev_a, dev_b = FingerprintSwitch("fp-switch1"), FingerprintSwitch("fp-switch2")
+    if_a, if_b = dev_a.interfaces["Ethernet1"], dev_b.interfaces["Ethernet1"]
+    if_a.profile = InterfaceL3(desc="to switch2")
+    if_b.profile = InterfaceL3(desc="to switch1")
+    if_a.cable_peer, if_b.cable_peer = if_b, if_a
+
+    yield dev_a, dev_b
+
+    for dev in (dev_a, dev_b):
+        Device.registry_remove(dev.name)
+
+
+def fingerprint(device: Device) -> str:
+    return DeviceFingerprinter().fingerprint(device, with_templates=False)
+
+
+def test_fingerprint_stable(cabled_devices):
+    dev_a, _ = cabled_devices
+    assert fingerprint(dev_a) == fingerprint(dev_a)
+
+
+def test_fingerprint_peer_desc(cabled_devices):
+    dev_a, dev_b = cabled_devices
+    before = fingerprint(dev_a)
+
+    dev_b.interfaces["Ethernet1"].desc = "changed"
+    assert fingerprint(dev_a) != before
+
+
+def test_fingerprint_peer_profile(cabled_devices):
+    dev_a, dev_b = cabled_devices
+    before = fingerprint(dev_a)
+
+    # the same profile class and description, with a different address.
+    dev_b.interfaces["Ethernet1"].profile = InterfaceL3(
+        desc="to switch1", if_ipaddr=IPv4Interface("10.0.0.1/31")
+    )
+    assert fingerprint(dev_a) != before
+
+
+def test_fingerprint_peer_attrs(cabled_devices):
+    dev_a, dev_b = cabled_devices
+    before = fingerprint(dev_a)
+
+    dev_b.interfaces["Ethernet1"].enabled = False
+    assert fingerprint(dev_a) != before
+
+
+def test_fingerprint_uncabled_peer_change(cabled_devices):
+    dev_a, dev_b = cabled_devices
+    before = fingerprint(dev_a)
+
+    dev_b.interfaces["Ethernet2"].profile = InterfaceL3(desc="not cabled")
+    assert fingerprint(dev_a) == before
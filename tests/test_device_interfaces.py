@@ -0,0 +1,232 @@
+from copy import deepcopy
+
+import pytest
+
+from netcad.device import Device, DeviceType, DeviceTypeRegistry
+from netcad.device.device_type import DeviceInterfaceType
+from netcad.device.profiles import InterfaceL3, InterfaceLoopback, InterfaceVirtual
+from netcad.design import Design
+from netcad.services.topology_service import TopologyService
+
+# -----------------------------------------------------------------------------
+# a device-type with four ethernet ports; the profile of Ethernet4 is assigned
+# to the device class, and so is shared by each device until copied.
+# -----------------------------------------------------------------------------
+
+PRODUCT_MODEL = "TEST-IFACES"
+
+DeviceTypeRegistry.registry_add(
+    PRODUCT_MODEL,
+    DeviceType(
+        model=PRODUCT_MODEL,
+        product_model=PRODUCT_MODEL,
+        interfaces={
+            f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+            for port in range(1, 5)
+        },
+    ),
+)
+
+
+class IfacesSwitch(Device):
+    os_name = "eos"
+    product_model = PRODUCT_MODEL
+
+
+IfacesSwitch.init_device_spec()
+IfacesSwitch.interfaces["Ethernet4"].profile = InterfaceL3(desc="template")
+
+
+def test_device_interfaces_used_views():
+    dev = IfacesSwitch("switch1")
+    interfaces = dev.interfaces
+    Device.registry_remove("switch1")
+
+    assert list(interfaces.used()) == ["Ethernet4"]
+    assert interfaces.used()["Ethernet4"] is interfaces["Ethernet4"]
+
+    with interfaces["Ethernet2"] as if_eth:
+        if_eth.profile = InterfaceL3(desc="uplink")
+        if_eth.enabled = False
+
+    assert list(interfaces.used()) == ["Ethernet2", "Ethernet4"]
+    assert list(interfaces.used(include_disabled=False)) == ["Ethernet4"]
+    assert list(interfaces.unused()) == ["Ethernet1", "Ethernet3"]
+    assert [iface.name for iface in interfaces.startswith("Eth", used=True)] == [
+        "Ethernet2",
+        "Ethernet4",
+    ]
+
+    interfaces["Ethernet2"].enabled = True
+    assert list(interfaces.used(include_disabled=False)) == ["Ethernet2", "Ethernet4"]
+
+    interfaces["Loopback0"].profile = InterfaceLoopback(desc="loopback")
+    assert list(interfaces.with_profile(InterfaceL3)) == [
+        "Ethernet2",
+        "Ethernet4",
+        "Loopback0",
+    ]
+    assert list(interfaces.with_profile(InterfaceVirtual)) == ["Loopback0"]
+
+    interfaces["Ethernet4"].profile = None
+    assert list(interfaces.used()) == ["Ethernet2", "Loopback0"]
+
+    del interfaces["Loopback0"]
+    assert list(interfaces.used()) == ["Ethernet2"]
+    assert list(interfaces.used(include_unused=True)) == [
+        "Ethernet1",
+        "Ethernet2",
+        "Ethernet3",
+        "Ethernet4",
+    ]
+
+    # other devices still share the template interface.
+    assert list(IfacesSwitch("switch2").interfaces.used()) == ["Ethernet4"]
+    Device.registry_remove("switch2")
+
+
+def interfaces_state(interfaces) -> list:
+    return [
+        (if_name, iface.name, getattr(iface.profile, "desc", None))
+        for if_name, iface in interfaces.items()
+    ]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda ifs: ifs.clear(),
+        lambda ifs: ifs.pop("Ethernet2"),
+        lambda ifs: ifs.pop("Ethernet4"),
+        lambda ifs: ifs.__delitem__("Ethernet1"),
+        lambda ifs: ifs.update(Loopback0=ifs["Ethernet3"], Ethernet2=ifs["Ethernet1"]),
+        lambda ifs: (ifs.clear(), ifs["Ethernet2"]),
+    ],
+)
+def test_device_interfaces_copy_on_write(change):
+    # the copy-on-write collection of a device is the same as the deepcopy of
+    # the device class collection, after each change.
+
+    ifs = IfacesSwitch("switch8").interfaces
+    Device.registry_remove("switch8")
+    copied = deepcopy(IfacesSwitch.interfaces)
+
+    assert copied.template is None and ifs.template is not None
+    change(ifs)
+    change(copied)
+
+    assert len(ifs) == len(copied)
+    assert interfaces_state(ifs) == interfaces_state(copied)
+    assert list(ifs.used()) == list(copied.used())
+
+
+def test_device_interfaces_update_version():
+    ifs = IfacesSwitch("switch6").interfaces
+    other_ifs = IfacesSwitch("switch7").interfaces
+
+    try:
+        assert list(ifs.used()) == ["Ethernet4"]
+
+        # the interfaces added without __setitem__ also change the used
+        # interfaces.
+
+        for if_name in ("Ethernet8", "Ethernet9", "Ethernet10"):
+            other_ifs[if_name].profile = InterfaceL3(desc=if_name)
+
+        iface_with_profile = other_ifs["Ethernet8"]
+        ifs.update({"Ethernet8": iface_with_profile})
+        assert list(ifs.used()) == ["Ethernet4", "Ethernet8"]
+
+        ifs |= {"Ethernet9": other_ifs["Ethernet9"]}
+        assert list(ifs.used()) == ["Ethernet4", "Ethernet8", "Ethernet9"]
+
+        ifs.setdefault("Ethernet10", other_ifs["Ethernet10"])
+        assert list(ifs.used()) == [
+            "Ethernet4",
+            "Ethernet8",
+            "Ethernet9",
+            "Ethernet10",
+        ]
+
+    finally:
+        Device.registry_remove("switch6")
+        Device.registry_remove("switch7")
+
+
+@pytest.fixture()
+def design():
+    design = Design(name="test-ifaces")
+    dev1, dev2 = IfacesSwitch("switch3"), IfacesSwitch("switch4")
+    design.add_devices(dev1, dev2)
+
+    dev2.interfaces["Loopback0"].profile = InterfaceLoopback(desc="loopback")
+    dev2.interfaces["Ethernet1"].profile = InterfaceL3(desc="uplink")
+
+    yield design
+
+    Design.registry_remove("test-ifaces")
+    for name in ("switch3", "switch4"):
+        Device.registry_remove(name)
+
+
+def test_design_interfaces_with_profile(design):
+    dev2 = design.devices["switch4"]
+
+    assert design.interfaces_with_profile(InterfaceLoopback) == [
+        dev2.interfaces["Loopback0"]
+    ]
+    assert len(design.interfaces_with_profile(InterfaceL3)) == 4
+
+
+def topology_service(design, **match) -> TopologyService:
+    return TopologyService(
+        design,
+        name="test-topology",
+        owner="test",
+        config=TopologyService.Config(topology_feature=None, **match),
+    )
+
+
+def interface_names(svc: TopologyService) -> list[str]:
+    return sorted(f"{iface.device.name}:{iface.name}" for iface in svc.interfaces)
+
+
+def test_topology_service_match_profile_classes(design):
+    svc = topology_service(design, match_profile_classes=(InterfaceLoopback,))
+
+    assert interface_names(svc) == ["switch4:Loopback0"]
+    assert svc.devices == {design.devices["switch4"]}
+
+
+def test_topology_service_match_profile_attrs(design):
+    svc = topology_service(design, match_profile_attrs={"desc": "template"})
+    assert interface_names(svc) == ["switch3:Ethernet4", "switch4:Ethernet4"]
+
+    # the profile classes, attribute values, and match function must all match.
+
+    match = dict(
+        match_profile_classes=(InterfaceL3,),
+        match_interface_profile=lambda ifp: ifp.desc != "template",
+    )
+    svc = topology_service(design, **match)
+    assert interface_names(svc) == ["switch4:Ethernet1", "switch4:Loopback0"]
+
+    svc = topology_service(design, match_profile_attrs={"desc": "uplink"}, **match)
+    assert interface_names(svc) == ["switch4:Ethernet1"]
+
+    with pytest.raises(ValueError, match="No interfaces found"):
+        topology_service(design, match_profile_attrs={"desc": "nothing"})
+
+
+def test_topology_service_config_requires_match():
+    with pytest.raises(ValueError, match="requires interface match criteria"):
+        TopologyService.Config(topology_feature=None)
+
+
+def test_device_interface_slots():
+    if_obj = IfacesSwitch("switch5").interfaces["Ethernet1"]
+    Device.registry_remove("switch5")
+
+    assert not hasattr(if_obj, "__dict__")
+    with pytest.raises(AttributeError):
+        if_obj.not_an_attribute = True
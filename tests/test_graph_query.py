@@ -0,0 +1,109 @@
+import igraph
+import pytest
+
+from netcad.services.graph_query import GraphQuery, GraphIndex
+
+# -----------------------------------------------------------------------------
+# a service graph in the form built by the services analyzer: the service
+# node (0) is connected to its check nodes by "s" edges, and the check nodes
+# are connected to the result nodes by "r" edges.
+# -----------------------------------------------------------------------------
+
+
+def make_graph() -> igraph.Graph:
+    graph = igraph.Graph(directed=True)
+    graph.add_vertices(
+        7,
+        attributes=dict(
+            check_type=[None, "interface", "lag", "interface", None, None, None],
+            service=["svc1", "svc1", "svc1", "svc2", "svc1", "svc1", "svc2"],
+            status=["PASS", "PASS", "FAIL", "PASS", "PASS", "FAIL", "PASS"],
+        ),
+    )
+    graph.add_edges(
+        [(0, 1), (0, 2), (0, 3), (1, 4), (1, 5), (2, 5), (3, 6), (1, 2)],
+        attributes=dict(
+            kind=["s", "s", "s", "r", "r", "r", "r", "d"],
+            service=["svc1", "svc1", "svc2", "svc1", "svc1", "svc1", "svc2", None],
+            weight=[1, 2, 3, 1, 2, 3, 1, 2],
+        ),
+    )
+    return graph
+
+
+QUERIES = [
+    ("out_", [0], dict(kind="s")),
+    ("out_", [0], dict(kind="s", service="svc1")),
+    ("out_", [1, 2], dict(kind="r")),
+    ("out_", [0, 1], dict()),
+    ("out_", [1], dict(weight=2)),
+    ("in_", [5], dict(kind="r", service="svc1")),
+    ("in_", [2], dict()),
+    ("in_", [6, 5], dict(kind="r")),
+]
+
+SELECTS = [
+    dict(status="FAIL"),
+    dict(check_type="interface"),
+    dict(service="svc1", status="PASS"),
+]
+
+
+def query_results(graph: igraph.Graph, graph_index=None) -> list:
+    results = [
+        getattr(GraphQuery(graph, graph_index)(*graph.vs[start]), method)(
+            **query
+        ).node_ids
+        for method, start, query in QUERIES
+    ]
+    results.extend(
+        GraphQuery(graph, graph_index).select(**query).node_ids for query in SELECTS
+    )
+    return results
+
+
+def test_graph_query_index_same_results():
+    graph = make_graph()
+    graph_index = GraphIndex(graph)
+
+    assert query_results(graph, graph_index) == query_results(graph)
+    assert GraphQuery(graph, graph_index)(graph.vs[0]).out_(kind="s").node_ids == [
+        1,
+        2,
+        3,
+    ]
+
+
+def test_graph_query_index_node_changed():
+    graph = make_graph()
+    graph_index = GraphIndex(graph)
+    query_results(graph, graph_index)
+
+    graph.vs[1]["status"] = "FAIL"
+    graph_index.invalidate()
+
+    assert query_results(graph, graph_index) == query_results(graph)
+    assert GraphQuery(graph, graph_index).select(status="FAIL").node_ids == [1, 2, 5]
+
+
+@pytest.mark.parametrize("delete", ["edge", "vertex"])
+def test_graph_query_index_deleted(delete):
+    graph = make_graph()
+    graph_index = GraphIndex(graph)
+    query_results(graph, graph_index)
+
+    # the graph has the same number of nodes and edges after the change, so the
+    # index must be reset.
+
+    if delete == "edge":
+        graph.delete_edges([0])
+        graph.add_edge(0, 2, kind="s", service="svc1", weight=1)
+    else:
+        graph.delete_vertices([4])
+        graph.add_vertex(check_type="lag", service="svc2", status="FAIL")
+        graph.add_edge(0, 6, kind="s", service="svc2", weight=1)
+
+    assert (graph.vcount(), graph.ecount()) == (7, 8)
+    graph_index.reset()
+
+    assert query_results(graph, graph_index) == query_results(graph)
@@ -0,0 +1,72 @@
+import asyncio
+
+from netcad.igather import as_completed, igather
+
+# -----------------------------------------------------------------------------
+# each job sleeps for the given delay and records the number of concurrently
+# running jobs.
+# -----------------------------------------------------------------------------
+
+
+class Jobs:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = []
+
+    async def job(self, name, delay):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+            return name
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+        finally:
+            self.running -= 1
+
+
+def test_as_completed_order():
+    jobs = Jobs()
+
+    async def run():
+        coros = [jobs.job("slow", 0.05), jobs.job("fast", 0.01)]
+        return [(coro, result) async for coro, result in as_completed(coros)]
+
+    results = asyncio.run(run())
+    assert [result for _, result in results] == ["fast", "slow"]
+    assert [coro.cr_code.co_name for coro, _ in results] == ["job", "job"]
+
+
+def test_as_completed_limit():
+    jobs = Jobs()
+
+    async def run():
+        await igather((jobs.job(num, 0.01) for num in range(10)), limit=3)
+
+    asyncio.run(run())
+    assert jobs.max_running == 3
+    assert jobs.running == 0
+
+
+def test_as_completed_break_cancels():
+    jobs = Jobs()
+    pending = [jobs.job(num, 0.01 if num == 0 else 1) for num in range(6)]
+
+    async def run():
+        results = as_completed(iter(pending), limit=3)
+        async for _, result in results:
+            break
+        await results.aclose()
+
+        # the running jobs are cancelled when the generator is closed, not
+        # when the event loop is closed.
+        assert sorted(jobs.cancelled) == [1, 2, 3]
+        assert jobs.running == 0
+        return result
+
+    assert asyncio.run(run()) == 0
+
+    # the coroutines that were not started are closed, not left pending.
+    assert all(coro.cr_frame is None for coro in pending)
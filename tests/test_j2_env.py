@@ -0,0 +1,14 @@
+from netcad.config import netcad_globals
+from netcad.jinja2.j2_env import get_bytecode_cache
+
+
+def test_bytecode_cache_after_cache_dir_set(tmp_path, monkeypatch):
+    monkeypatch.setattr(netcad_globals, "g_netcad_cache_dir", None)
+    assert get_bytecode_cache() is None
+
+    # the cache dir set after the first call is used by the next call.
+    monkeypatch.setattr(netcad_globals, "g_netcad_cache_dir", tmp_path)
+    bc_cache = get_bytecode_cache()
+    assert bc_cache is not None
+    assert bc_cache is get_bytecode_cache()
+    assert (tmp_path / "jinja2").is_dir()
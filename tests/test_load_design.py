@@ -0,0 +1,166 @@
+import os
+import sys
+
+import pytest
+
+from netcad.cabling import CablePlanner
+from netcad.config import netcad_globals, Environment
+from netcad.design import Design, load_design
+from netcad.design.load_design import _create_member_designs
+from netcad.device import Device, DeviceType, DeviceTypeRegistry
+from netcad.device.device_type import DeviceInterfaceType
+
+# -----------------------------------------------------------------------------
+# a device-type with four ethernet ports, and a group of two designs; each
+# design package defines a device class, a cable planner, and the
+# create_design function that cables the design devices.
+# -----------------------------------------------------------------------------
+
+PRODUCT_MODEL = "TEST-LOAD-DESIGN"
+
+DeviceTypeRegistry.registry_add(
+    PRODUCT_MODEL,
+    DeviceType(
+        model=PRODUCT_MODEL,
+        product_model=PRODUCT_MODEL,
+        interfaces={
+            f"Ethernet{port}": DeviceInterfaceType(name=f"Ethernet{port}")
+            for port in range(1, 5)
+        },
+    ),
+)
+
+DESIGN_PACKAGE = f"""\
+from netcad.cabling import CablePlanner
+from netcad.device import Device
+from netcad.device.profiles import InterfaceL3
+
+
+class GroupSwitch(Device):
+    os_name = "eos"
+    product_model = "{PRODUCT_MODEL}"
+
+
+GroupSwitch.init_device_spec()
+
+
+class GroupCabler(CablePlanner):
+    def build(self):
+        for device in sorted(self.devices, key=lambda dev: dev.name):
+            for iface in device.interfaces.used().values():
+                self.add_endpoint(iface.cable_id, iface)
+
+        return self.validate()
+
+
+def create_design(design):
+    switch1, switch2 = (
+        GroupSwitch(f"{{design.name}}-switch{{num}}") for num in (1, 2)
+    )
+    design.add_devices(switch1, switch2)
+
+    for port in (1, 2):
+        for device in (switch1, switch2):
+            iface = device.interfaces[f"Ethernet{{port}}"]
+            iface.profile = InterfaceL3(desc=f"{{design.name}} link {{port}}")
+            iface.cable_id = f"{{design.name}}-cable{{port}}"
+
+    cabler = GroupCabler(name=f"{{design.name}}-cabling")
+    cabler.add_devices(switch1, switch2)
+    cabler.build()
+
+    return design
+"""
+
+GROUP_MEMBERS = ["lgroup_site1", "lgroup_site2"]
+
+
+@pytest.fixture()
+def group_project(tmp_path, monkeypatch):
+    monkeypatch.delenv(Environment.NETCAD_DESIGNCACHE, raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    designs = {"lgroup": {"name": "lgroup", "group": GROUP_MEMBERS}}
+
+    for design_name in GROUP_MEMBERS:
+        (pkg_dir := tmp_path / design_name).mkdir()
+        (pkg_dir / "__init__.py").write_text(DESIGN_PACKAGE)
+        designs[design_name] = {"name": design_name, "package": design_name}
+
+    monkeypatch.setattr(netcad_globals, "g_netcad_designs", designs)
+
+    yield
+
+    remove_registry_items()
+    for mod_name in GROUP_MEMBERS:
+        sys.modules.pop(mod_name, None)
+
+
+def remove_registry_items():
+    for design_name in GROUP_MEMBERS:
+        Design.registry_remove(design_name)
+        CablePlanner.registry_remove(f"{design_name}-cabling")
+        for num in (1, 2):
+            Device.registry_remove(f"{design_name}-switch{num}")
+
+
+def group_state(group_design: Design) -> dict:
+    """
+    Returns the group design devices, and the Registry items of the member
+    designs, in a form that can be compared between loads.
+    """
+    devices = group_design.devices
+    state = dict(devices={}, cables={})
+
+    for name, device in devices.items():
+        assert Device.registry_get(name) is device
+        assert Design.registry_get(device.design.name) is device.design
+
+        state["devices"][name] = (
+            type(device).__name__,
+            device.design.name,
+            {
+                if_name: (iface.profile and iface.profile.desc, iface.cable_id)
+                for if_name, iface in device.interfaces.items()
+            },
+        )
+
+    # the cable planners of the member designs cable the interfaces of the
+    # group design devices.
+
+    for design_name in GROUP_MEMBERS:
+        cabler = CablePlanner.registry_get(f"{design_name}-cabling")
+        for cable_id, ends in cabler.cables.items():
+            assert all(devices[iface.device.name] is iface.device for iface in ends)
+            state["cables"][cable_id] = sorted(
+                (iface.device.name, iface.name) for iface in ends
+            )
+
+    return state
+
+
+def test_load_design_group_workers(group_project, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    assert not _create_member_designs(GROUP_MEMBERS)
+    serial = group_state(load_design("lgroup"))
+
+    remove_registry_items()
+
+    # the member designs are created in worker processes even though the host
+    # may have only one CPU.
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    created = _create_member_designs(GROUP_MEMBERS)
+    assert list(created) == GROUP_MEMBERS
+    assert all(created.values())
+
+    remove_registry_items()
+
+    pooled = group_state(load_design("lgroup"))
+
+    assert pooled == serial
+    assert len(serial["devices"]) == 4
+    assert serial["cables"]["lgroup_site2-cable1"] == [
+        ("lgroup_site2-switch1", "Ethernet1"),
+        ("lgroup_site2-switch2", "Ethernet1"),
+    ]
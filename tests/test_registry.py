@@ -0,0 +1,76 @@
+from netcad.registry import Registry
+
+
+def test_registry_index_subclasses():
+    class Root(Registry):
+        pass
+
+    class Child(Root, registry_name="child"):
+        pass
+
+    class GrandChild(Child, registry_name="grandchild"):
+        pass
+
+    Root.registry_add("a", 1)
+    GrandChild.registry_add("b", 2)
+
+    assert Root.registry_get("a") == 1
+    assert Root.registry_get("b", with_registry=True) == (2, GrandChild)
+    assert Root.registry_get("grandchild") is GrandChild
+    assert Child.registry_get("a") is None
+    assert Root.registry_list(subclasses=True) == {"a", "b", "child", "grandchild"}
+
+    # the index is updated when items are added, removed, or a subclass is
+    # declared.
+
+    Child.registry_add("a", 3)
+    assert Child.registry_get("a") == 3
+    assert Root.registry_get("a") == 1
+
+    assert Root.registry_remove("b") == 2
+    assert Root.registry_get("b") is None
+
+    class Other(GrandChild, registry_name="other"):
+        pass
+
+    Other.registry_add("c", 4)
+    assert Root.registry_get("c") == 4
+    assert Root.registry_items(subclasses=True)["other"] is Other
+
+
+def test_registry_index_discard_ancestors():
+    class Root(Registry):
+        pass
+
+    class Left(Root, registry_name="left"):
+        pass
+
+    class Right(Root, registry_name="right"):
+        pass
+
+    class Other(Registry):
+        pass
+
+    Left.registry_add("a", 1)
+    Other.registry_add("b", 2)
+
+    indexes = {
+        reg_cls: reg_cls.registry_index() for reg_cls in (Root, Left, Right, Other)
+    }
+
+    # adding an item discards only the indexes of the class and its ancestors,
+    # the indexes of the unrelated and sibling registries are kept.
+
+    Right.registry_add("c", 3)
+
+    assert Other.registry_index() is indexes[Other]
+    assert Left.registry_index() is indexes[Left]
+    assert Right.registry_get("c") == 3
+    assert Root.registry_get("c") == 3
+
+    right_index = Right.registry_index()
+
+    assert Left.registry_remove("a") == 1
+    assert Root.registry_get("a") is None
+    assert Right.registry_index() is right_index
+    assert Other.registry_index() is indexes[Other]
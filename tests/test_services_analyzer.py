@@ -0,0 +1,167 @@
+import asyncio
+import json
+
+from netcad.config import netcad_globals
+from netcad.design import Design
+from netcad.services import ServicesAnalyzer, DesignService
+
+# -----------------------------------------------------------------------------
+# a service subgraph where a failed check is shared by two design nodes:
+#
+#   service -> node-a -> check-shared (FAIL)
+#           -> node-b -> check-shared
+#                     -> check-b (PASS)
+# -----------------------------------------------------------------------------
+
+
+class Node:
+    def __init__(self, name: str, check_type: str = ""):
+        self.name = name
+        self.check_type = check_type
+
+
+def build_analyzer():
+    design = Design(name="test-rollup")
+    ai = ServicesAnalyzer(design)
+    svc = DesignService(design, name="rollup", owner="test")
+
+    node_a, node_b = Node("node-a"), Node("node-b")
+    check_shared, check_b = Node("check-shared", "test"), Node("check-b", "test")
+
+    ai.add_service_node(svc)
+    for node in (node_a, node_b):
+        ai.add_design_node(node, kind_type="test")
+        ai.add_service_edge(svc, svc, node)
+
+    for check in (check_shared, check_b):
+        ai.add_check_node(svc, check, check_id=check.name)
+
+    ai.add_check_edge(svc, node_a, check_shared)
+    ai.add_check_edge(svc, node_b, check_shared)
+    ai.add_check_edge(svc, node_b, check_b)
+    ai.commit()
+
+    ai.nodes_map[check_shared].update_attributes(status="FAIL", fail_count=1)
+    ai.nodes_map[check_b].update_attributes(pass_count=1)
+    return ai, svc, (node_a, node_b, check_shared, check_b)
+
+
+def test_services_analyzer_rollup_shared_node():
+    ai, svc, (node_a, node_b, check_shared, check_b) = build_analyzer()
+
+    try:
+        ai.analyze(svc)
+
+        def counts(obj):
+            node = ai.nodes_map[obj]
+            return node["pass_count"], node["fail_count"]
+
+        # the shared check is counted once by the service, and listed once in
+        # the service failed checks.
+
+        assert counts(svc) == (1, 1)
+        assert counts(node_a) == (0, 1)
+        assert counts(node_b) == (1, 1)
+        assert counts(check_shared) == (0, 1)
+        assert svc.status == "FAIL"
+        assert [node["check_id"] for node in svc.failed] == ["check-shared"]
+
+    finally:
+        Design.registry_remove("test-rollup")
+
+
+# -----------------------------------------------------------------------------
+# a service whose check adds a check node from the status of a device result,
+# so that the check must be executed again when the result is reloaded.
+# -----------------------------------------------------------------------------
+
+
+class StandInCollection:
+    @classmethod
+    def get_name(cls) -> str:
+        return "stand-in"
+
+    @classmethod
+    def parse_result(cls, payload: dict):
+        raise NotImplementedError()
+
+
+class StandInDevice:
+    def __init__(self, name: str, design: Design):
+        self.name = name
+        self.design = design
+        self.is_pseudo = False
+
+
+class StandInFeature:
+    name = "stand-in"
+    check_collections = [StandInCollection]
+
+
+class UplinkService(DesignService):
+    def build(self, ai: ServicesAnalyzer):
+        super().build(ai)
+        ai.commit()
+
+        result = ai.results_map[self.config]["stand-in"]["uplink"]
+        ai.add_check_edge(self, self, result)
+
+    async def check(self, ai: ServicesAnalyzer):
+        result = ai.results_map[self.config]["stand-in"]["uplink"]
+        check = Node("uplink-check", "uplink")
+        ai.add_service_check(self, check, check_id="uplink-check")
+        ai.commit()
+
+        if result.status == "PASS":
+            ai.nodes_map[check].update_attributes(pass_count=1)
+        else:
+            ai.nodes_map[check].update_attributes(status="FAIL", fail_count=1)
+
+
+def write_result(results_dir, status: str):
+    payload = {
+        "device": "dev1",
+        "check": {"check_type": "stand-in"},
+        "check_id": "uplink",
+        "status": status,
+    }
+    (results_dir / "stand-in.ndjson").write_text(json.dumps(payload) + "\n")
+
+
+def test_services_analyzer_reload_checks(tmp_path, monkeypatch):
+    monkeypatch.setattr(netcad_globals, "g_netcad_checks_dir", tmp_path)
+
+    design = Design(name="test-reload")
+    device = StandInDevice("dev1", design)
+    design.devices[device.name] = device
+    design.features["stand-in"] = StandInFeature()
+    svc = UplinkService(design, name="uplink", owner="test", config=device)
+
+    results_dir = tmp_path / design.name / device.name / "results"
+    results_dir.mkdir(parents=True)
+    write_result(results_dir, "FAIL")
+
+    try:
+        ai = ServicesAnalyzer(design, lazy_results=True)
+        ai.build()
+        asyncio.run(ai.check())
+        assert svc.status == "FAIL"
+        vcount, ecount = ai.graph.vcount(), ai.graph.ecount()
+
+        # the service check is executed again with the reloaded result, and
+        # replaces the check node of the previous check.
+
+        write_result(results_dir, "PASS")
+        assert asyncio.run(ai.reload_results({(device.name, "stand-in")}))
+
+        assert svc.status == "PASS"
+        assert not svc.failed
+        assert (ai.graph.vcount(), ai.graph.ecount()) == (vcount, ecount)
+
+        check_node = ai.graph.vs.find(check_id="uplink-check")
+        assert check_node["status"] == "PASS"
+        assert ai.nodes_map.inverse[check_node].name == "uplink-check"
+        assert ai.nodes_map[svc]["pass_count"] == 2
+
+    finally:
+        Design.registry_remove("test-reload")
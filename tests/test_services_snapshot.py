@@ -0,0 +1,94 @@
+import sys
+
+import pytest
+
+from netcad.config import netcad_globals, Environment
+from netcad.design import Design
+from netcad.services import ServicesAnalyzer
+from netcad.services.services_snapshot import ServicesSnapshot, _results_manifest
+
+DESIGN_NAME = "svc-snapshot"
+
+
+@pytest.fixture()
+def snapshot_project(tmp_path, monkeypatch):
+    monkeypatch.setattr(netcad_globals, "g_netcad_cache_dir", tmp_path / ".netcad")
+    monkeypatch.setattr(netcad_globals, "g_netcad_checks_dir", tmp_path / "checks")
+    monkeypatch.setattr(netcad_globals, "g_netcad_project_dir", tmp_path)
+    monkeypatch.setattr(netcad_globals, "g_config", {})
+    monkeypatch.setattr(
+        netcad_globals,
+        "g_netcad_designs",
+        {DESIGN_NAME: {"name": DESIGN_NAME, "package": "svcsnap_design"}},
+    )
+    monkeypatch.setenv(Environment.NETCAD_DESIGNCACHE, "1")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    (tmp_path / "svcsnap_design.py").write_text("")
+    (tmp_path / "checks" / DESIGN_NAME).mkdir(parents=True)
+
+    yield tmp_path
+
+    sys.modules.pop("svcsnap_design", None)
+    Design.registry_remove(DESIGN_NAME)
+
+
+def save_analyzer() -> ServicesSnapshot:
+    snapshot = ServicesSnapshot(DESIGN_NAME)
+    snapshot.mark()
+    snapshot.save(ServicesAnalyzer(Design(name=DESIGN_NAME)))
+    return snapshot
+
+
+def test_services_snapshot_opt_in(snapshot_project, monkeypatch):
+    assert ServicesSnapshot.enabled()
+
+    monkeypatch.delenv(Environment.NETCAD_DESIGNCACHE)
+    assert not ServicesSnapshot.enabled()
+
+
+def test_services_snapshot_in_cache_dir(snapshot_project):
+    snapshot = save_analyzer()
+
+    assert snapshot.filepath.is_relative_to(snapshot_project / ".netcad")
+    assert snapshot.filepath.exists()
+    assert not list((snapshot_project / "checks").rglob("*.pickle"))
+
+
+def test_services_snapshot_load(snapshot_project):
+    save_analyzer()
+    Design.registry_remove(DESIGN_NAME)
+
+    ai = ServicesSnapshot(DESIGN_NAME).load()
+    assert ai.design.name == DESIGN_NAME
+    assert Design.registry_get(DESIGN_NAME) is ai.design
+
+
+def test_services_snapshot_lazy_key(snapshot_project):
+    save_analyzer()
+
+    assert ServicesSnapshot(DESIGN_NAME, lazy_results=True).load() is None
+    assert ServicesSnapshot(DESIGN_NAME, lazy_results=False).load() is not None
+
+
+def test_services_snapshot_manifest_filenames(snapshot_project):
+    results_dir = snapshot_project / "checks" / DESIGN_NAME / "dev1" / "results"
+    results_dir.mkdir(parents=True)
+
+    for filename in ("interfaces.json", "interfaces.ndjson", "cabling.ndjson.tmp"):
+        (results_dir / filename).write_text("[]")
+
+    # the results of a collection in each format are separate entries, and
+    # the results being written are not included.
+
+    assert sorted(_results_manifest(DESIGN_NAME)) == [
+        ("dev1", "interfaces.json"),
+        ("dev1", "interfaces.ndjson"),
+    ]
+
+    save_analyzer()
+    (results_dir / "interfaces.json").unlink()
+
+    snapshot = ServicesSnapshot(DESIGN_NAME)
+    assert snapshot.load() is not None
+    assert snapshot.changed == {("dev1", "interfaces")}